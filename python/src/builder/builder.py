@@ -1,37 +1,286 @@
 """Builder pattern example."""
 
-from typing import Final, List
+from typing import (
+    Any,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    SupportsIndex,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+
+class RenderContext:
+    """Cache of the indentation and tag strings used to render `HtmlElement`s.
+
+    Reuse a context across renders to avoid recomputing the strings.
+    """
+
+    def __init__(self, indent_size: int) -> None:
+        """Create a context for rendering with `indent_size` spaces per level."""
+        self.indent_size = indent_size
+        self._indents: List[str] = []
+        self._open_tags: Dict[str, str] = {}
+        self._close_tags: Dict[str, str] = {}
+
+    def indent(self, indent_level: int) -> str:
+        """Return the indentation of `indent_level`."""
+        try:
+            return self._indents[indent_level]
+        except IndexError:
+            indents = self._indents
+            while len(indents) <= indent_level:
+                indents.append(" " * (len(indents) * self.indent_size))
+            return indents[indent_level]
+
+    def open_tag(self, name: str) -> str:
+        """Return the opening tag of a `name` element."""
+        tag = self._open_tags.get(name)
+        if tag is None:
+            tag = self._open_tags[name] = f"<{name}>"
+        return tag
+
+    def close_tag(self, name: str) -> str:
+        """Return the closing tag of a `name` element."""
+        tag = self._close_tags.get(name)
+        if tag is None:
+            tag = self._close_tags[name] = f"</{name}>"
+        return tag
+
+
+class _Subelements(List["HtmlElement"]):
+    """Subelements of an `HtmlElement`, invalidating its cached rendering on change.
+
+    Every element added becomes a child of the owning element, so that mutating it
+    later also invalidates the rendering of its new ancestors.
+    """
+
+    def __init__(
+        self, owner: "HtmlElement", subelements: Iterable["HtmlElement"] = ()
+    ) -> None:
+        super().__init__(subelements)
+        self._owner = owner
+        self._adopt(self)
+
+    def _adopt(self, subelements: Iterable["HtmlElement"]) -> None:
+        owner = self._owner
+        for subelement in subelements:
+            subelement._parent = owner
+        owner.invalidate()
+
+    def append(self, subelement: "HtmlElement") -> None:
+        super().append(subelement)
+        self._adopt((subelement,))
+
+    def extend(self, subelements: Iterable["HtmlElement"]) -> None:
+        subelements = list(subelements)
+        super().extend(subelements)
+        self._adopt(subelements)
+
+    def __iadd__(self, subelements: Iterable["HtmlElement"]) -> "_Subelements":
+        self.extend(subelements)
+        return self
+
+    def insert(self, index: SupportsIndex, subelement: "HtmlElement") -> None:
+        super().insert(index, subelement)
+        self._adopt((subelement,))
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+            super().__setitem__(index, value)
+            self._adopt(value)
+        else:
+            super().__setitem__(index, value)
+            self._adopt((value,))
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._owner.invalidate()
+
+    def __imul__(self, count: SupportsIndex) -> "_Subelements":
+        super().__imul__(count)
+        self._owner.invalidate()
+        return self
+
+    def pop(self, index: SupportsIndex = -1) -> "HtmlElement":
+        subelement = super().pop(index)
+        self._owner.invalidate()
+        return subelement
+
+    def remove(self, subelement: "HtmlElement") -> None:
+        super().remove(subelement)
+        self._owner.invalidate()
+
+    def clear(self) -> None:
+        super().clear()
+        self._owner.invalidate()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._owner.invalidate()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._owner.invalidate()
 
 
 class HtmlElement:
-    """An HTML element."""
+    """An HTML element.
+
+    Setting `name` or `text`, or changing `subelements`, discards the cached rendering
+    of the element and of its ancestors; see `render`. An element is expected to have
+    at most one parent.
+    """
 
     INDENT_SIZE: Final[int] = 2
 
     def __init__(self, name: str = "", text: str = ""):
         """Create an HTML element with the given `name` and `text`."""
-        self.name = name
-        self.text = text
-        self.subelements: List[HtmlElement] = []
+        self._parent: Optional[HtmlElement] = None
+        # Rendered subtree, keyed by indentation size and level.
+        self._rendered: Optional[Tuple[Tuple[int, int], str]] = None
+        self._name = name
+        self._text = text
+        self._subelements = _Subelements(self)
+
+    @property
+    def name(self) -> str:
+        """Tag name of the element."""
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        self._name = name
+        self.invalidate()
+
+    @property
+    def text(self) -> str:
+        """Text of the element, rendered before its subelements."""
+        return self._text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        self._text = text
+        self.invalidate()
+
+    @property
+    def subelements(self) -> List["HtmlElement"]:
+        """Child elements; adding one makes this element its parent."""
+        return self._subelements
+
+    @subelements.setter
+    def subelements(self, subelements: Iterable["HtmlElement"]) -> None:
+        self._subelements = _Subelements(self, subelements)
+
+    def add_subelement(self, subelement: "HtmlElement") -> None:
+        """Append `subelement`, invalidating the cached rendering of this subtree."""
+        self._subelements.append(subelement)
+
+    def invalidate(self) -> None:
+        """Discard the cached rendering of this element and of its ancestors.
+
+        Called on every change made through the attributes of an element.
+        """
+        element: Optional[HtmlElement] = self
+        while element is not None:
+            element._rendered = None
+            element = element._parent
 
     def __str(self, indent_level: int) -> str:
         lines: List[str] = []
         indent = " " * (indent_level * self.INDENT_SIZE)
-        lines.append(f"{indent}<{self.name}>")
+        lines.append(f"{indent}<{self._name}>")
 
-        if self.text:
+        if self._text:
             indent_text = " " * ((indent_level + 1) * self.INDENT_SIZE)
-            lines.append(f"{indent_text}{self.text}")
+            lines.append(f"{indent_text}{self._text}")
 
-        for subelement in self.subelements:
+        for subelement in self._subelements:
             lines.append(subelement.__str(indent_level + 1))
 
-        lines.append(f"{indent}</{self.name}>")
+        lines.append(f"{indent}</{self._name}>")
         return "\n".join(lines)
 
     def __str__(self) -> str:
         return self.__str(0)
 
+    def iter_chunks(self, context: Optional[RenderContext] = None) -> Iterator[str]:
+        """Render this element as a sequence of chunks, in a single pass.
+
+        Joined together, the chunks are the same as `str(self)`. Unlike `str()`, no
+        element's text is copied more than once, and deep documents do not recurse.
+        """
+        if context is None:
+            context = RenderContext(self.INDENT_SIZE)
+
+        indent_of, open_tag, close_tag = (
+            context.indent,
+            context.open_tag,
+            context.close_tag,
+        )
+
+        # Elements yet to be opened, and closing tags yet to be written.
+        stack: List[Union[Tuple[HtmlElement, int], str]] = [(self, 0)]
+        separator = ""
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                yield item
+                continue
+
+            element, indent_level = item
+            indent = indent_of(indent_level)
+            chunk = f"{separator}{indent}{open_tag(element._name)}"
+            separator = "\n"
+
+            if element._text:
+                chunk = f"{chunk}\n{indent_of(indent_level + 1)}{element._text}"
+
+            if not element._subelements:
+                yield f"{chunk}\n{indent}{close_tag(element._name)}"
+                continue
+
+            yield chunk
+            stack.append(f"\n{indent}{close_tag(element._name)}")
+            subelement_level = indent_level + 1
+            for subelement in reversed(element._subelements):
+                stack.append((subelement, subelement_level))
+
+    def render(self, context: RenderContext, indent_level: int = 0) -> str:
+        """Render this element, reusing the cached rendering of unchanged subtrees.
+
+        The rendering of each element with subelements is cached until the element or
+        one of its descendants is changed. This makes re-rendering mostly static
+        documents cheap, at the cost of keeping the rendered text of every subtree in
+        memory.
+        """
+        key = (context.indent_size, indent_level)
+        if self._rendered is not None and self._rendered[0] == key:
+            return self._rendered[1]
+
+        indent = context.indent(indent_level)
+        lines = [f"{indent}{context.open_tag(self._name)}"]
+        if self._text:
+            lines.append(f"{context.indent(indent_level + 1)}{self._text}")
+        for subelement in self._subelements:
+            lines.append(subelement.render(context, indent_level + 1))
+        lines.append(f"{indent}{context.close_tag(self._name)}")
+
+        rendered = "\n".join(lines)
+        if self._subelements:
+            self._rendered = (key, rendered)
+        return rendered
+
+    def write(self, stream: TextIO) -> None:
+        """Write this element to a text `stream`, e.g., an `io.StringIO` or a file."""
+        stream.writelines(self.iter_chunks())
+
     @staticmethod
     def create(name: str, text: str = "") -> "HtmlBuilder":
         """Create an `HtmlBuilder` with a `name` root element."""
@@ -44,15 +293,30 @@ class HtmlBuilder:
     def __init__(self, root_name: str, root_text: str = ""):
         """Create a builder of `HtmlElement`s."""
         self.__root = HtmlElement(name=root_name, text=root_text)
+        self.__context = RenderContext(HtmlElement.INDENT_SIZE)
 
     def add_child(self, child_name: str, child_text: str) -> None:
         """Add a child element."""
-        self.__root.subelements.append(HtmlElement(child_name, child_text))
+        self.__root.add_subelement(HtmlElement(child_name, child_text))
 
     def add_child_fluent(self, child_name: str, child_text: str) -> "HtmlBuilder":
         """Add a child using a fluent API."""
-        self.__root.subelements.append(HtmlElement(child_name, child_text))
+        self.__root.add_subelement(HtmlElement(child_name, child_text))
         return self
 
+    def build(self) -> HtmlElement:
+        """Return the built element."""
+        return self.__root
+
+    def iter_chunks(self) -> Iterator[str]:
+        """Render the built element as a sequence of chunks; see `HtmlElement`."""
+        return self.__root.iter_chunks(self.__context)
+
+    def write(self, stream: TextIO) -> None:
+        """Write the built element to a text `stream`."""
+        self.__root.write(stream)
+
     def __str__(self) -> str:
-        return str(self.__root)
+        # Changing an element discards the cached renderings that include it, so the
+        # cached renderings of unchanged subtrees remain valid.
+        return self.__root.render(self.__context)
@@ -0,0 +1,148 @@
+"""Builder pattern example: nested HTML built into an arena.
+
+`HtmlBuilder` in `builder.py` can only add children to the root element, and each
+element is an `HtmlElement` object with its own list of subelements. The builder here
+supports arbitrary nesting, and keeps the elements in an arena: flat, parallel lists
+indexed by element number. Building a large document then allocates far fewer objects.
+"""
+
+from typing import Final, Iterator, List
+
+from builder.builder import HtmlElement
+
+# Element number representing the absence of an element.
+NONE: Final[int] = -1
+
+
+class HtmlArena:
+    """Elements of an HTML document stored in parallel lists.
+
+    Element 0 is the root. An element's children are linked through `first_child`
+    and `next_sibling`; `last_child` allows appending a child in constant time.
+    """
+
+    def __init__(self, root_name: str, root_text: str = "") -> None:
+        """Create an arena containing only the root element."""
+        self.names: List[str] = [root_name]
+        self.texts: List[str] = [root_text]
+        self.parents: List[int] = [NONE]
+        self.first_child: List[int] = [NONE]
+        self.last_child: List[int] = [NONE]
+        self.next_sibling: List[int] = [NONE]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, parent: int, name: str, text: str = "") -> int:
+        """Append a `name` element to the children of `parent`; return its number."""
+        element = len(self.names)
+        self.names.append(name)
+        self.texts.append(text)
+        self.parents.append(parent)
+        self.first_child.append(NONE)
+        self.last_child.append(NONE)
+        self.next_sibling.append(NONE)
+
+        last = self.last_child[parent]
+        if last == NONE:
+            self.first_child[parent] = element
+        else:
+            self.next_sibling[last] = element
+        self.last_child[parent] = element
+        return element
+
+    def children(self, element: int) -> Iterator[int]:
+        """Iterate over the children of `element`."""
+        child = self.first_child[element]
+        while child != NONE:
+            yield child
+            child = self.next_sibling[child]
+
+    def iter_chunks(self, indent_size: int = HtmlElement.INDENT_SIZE) -> Iterator[str]:
+        """Render the document as a sequence of chunks, as `HtmlElement` does."""
+        names, texts, parents = self.names, self.texts, self.parents
+        first_child, next_sibling = self.first_child, self.next_sibling
+        indents = [""]
+
+        # Walk the tree through the links, so no stack is needed.
+        element, indent_level = 0, 0
+        separator = ""
+        while True:
+            if len(indents) <= indent_level + 1:
+                indents.append(" " * (len(indents) * indent_size))
+            indent = indents[indent_level]
+
+            chunk = f"{separator}{indent}<{names[element]}>"
+            separator = "\n"
+            if texts[element]:
+                chunk = f"{chunk}\n{indents[indent_level + 1]}{texts[element]}"
+
+            child = first_child[element]
+            if child != NONE:
+                yield chunk
+                element, indent_level = child, indent_level + 1
+                continue
+
+            yield f"{chunk}\n{indent}</{names[element]}>"
+
+            # Close the ancestors that have no more children to render.
+            while next_sibling[element] == NONE:
+                element = parents[element]
+                if element == NONE:
+                    return
+                indent_level -= 1
+                yield f"\n{indents[indent_level]}</{names[element]}>"
+            element = next_sibling[element]
+
+    def __str__(self) -> str:
+        return "".join(self.iter_chunks())
+
+    def to_element(self, element: int = 0) -> HtmlElement:
+        """Return element number `element` and its descendants as `HtmlElement`s."""
+        elements = {element: HtmlElement(self.names[element], self.texts[element])}
+        stack = [element]
+        while stack:
+            parent = stack.pop()
+            for child in self.children(parent):
+                elements[child] = HtmlElement(self.names[child], self.texts[child])
+                elements[parent].subelements.append(elements[child])
+                stack.append(child)
+        return elements[element]
+
+
+class NestedHtmlBuilder:
+    """Builder of nested HTML elements, stored in an `HtmlArena`.
+
+    `child` adds a child to the current element and makes it the current element;
+    `up` makes the current element's parent the current element again.
+    """
+
+    def __init__(self, root_name: str, root_text: str = "") -> None:
+        """Create a builder of a `root_name` document."""
+        self.arena = HtmlArena(root_name, root_text)
+        self._current = 0
+
+    def child(self, name: str, text: str = "") -> "NestedHtmlBuilder":
+        """Add a child to the current element, and descend into it."""
+        self._current = self.arena.add(self._current, name, text)
+        return self
+
+    def add_child(self, name: str, text: str = "") -> "NestedHtmlBuilder":
+        """Add a child to the current element, without descending into it."""
+        self.arena.add(self._current, name, text)
+        return self
+
+    def up(self) -> "NestedHtmlBuilder":
+        """Return to the parent of the current element."""
+        parent = self.arena.parents[self._current]
+        if parent == NONE:
+            raise ValueError("The root element has no parent")
+        self._current = parent
+        return self
+
+    def build(self) -> HtmlArena:
+        """Return the arena holding the document."""
+        return self.arena
+
+    def __str__(self) -> str:
+        return str(self.arena)
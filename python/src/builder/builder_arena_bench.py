@@ -0,0 +1,79 @@
+"""Benchmark building and rendering a large nested document.
+
+Run from `python/src` with `python -m builder.builder_arena_bench`.
+"""
+
+import time
+import tracemalloc
+from typing import Callable, Tuple, TypeVar
+
+from builder.builder import HtmlElement
+from builder.builder_arena import HtmlArena, NestedHtmlBuilder
+
+T = TypeVar("T")
+
+# 1 root, SECTIONS sections, SECTIONS * ITEMS items, each item with one bold child.
+SECTIONS = 250
+ITEMS = 200
+
+
+def build_elements() -> HtmlElement:
+    """Build the document as `HtmlElement`s."""
+    root = HtmlElement("body")
+    for section_index in range(SECTIONS):
+        section = HtmlElement("ul", f"section {section_index}")
+        root.subelements.append(section)
+        for item_index in range(ITEMS):
+            item = HtmlElement("li", f"item {item_index}")
+            item.subelements.append(HtmlElement("b", "bold"))
+            section.subelements.append(item)
+    return root
+
+
+def build_arena() -> HtmlArena:
+    """Build the document into an arena."""
+    builder = NestedHtmlBuilder("body")
+    for section_index in range(SECTIONS):
+        builder.child("ul", f"section {section_index}")
+        for item_index in range(ITEMS):
+            builder.child("li", f"item {item_index}").add_child("b", "bold").up()
+        builder.up()
+    return builder.build()
+
+
+def _measure(build: Callable[[], T]) -> Tuple[T, float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    document = build()
+    seconds = time.perf_counter() - start
+    statistics = tracemalloc.take_snapshot().statistics("filename")
+    blocks = sum(stat.count for stat in statistics)
+    tracemalloc.stop()
+    return document, seconds, blocks
+
+
+def main() -> None:
+    """Report build time, allocated blocks and render time of both approaches."""
+    nodes = 1 + SECTIONS + 2 * SECTIONS * ITEMS
+    print(f"{nodes:,} elements")
+    print(f"{'approach':<14}{'build (ms)':>12}{'blocks':>12}{'render (ms)':>14}")
+
+    element, element_build, element_blocks = _measure(build_elements)
+    arena, arena_build, arena_blocks = _measure(build_arena)
+
+    start = time.perf_counter()
+    rendered = "".join(element.iter_chunks())
+    element_render = time.perf_counter() - start
+    start = time.perf_counter()
+    assert "".join(arena.iter_chunks()) == rendered
+    arena_render = time.perf_counter() - start
+
+    for name, build, blocks, render in [
+        ("HtmlElement", element_build, element_blocks, element_render),
+        ("HtmlArena", arena_build, arena_blocks, arena_render),
+    ]:
+        print(f"{name:<14}{build * 1000:>12.1f}{blocks:>12,}{render * 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
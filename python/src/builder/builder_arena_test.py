@@ -0,0 +1,64 @@
+"""Demonstrate building nested HTML elements into an arena."""
+
+import pytest
+
+from builder.builder import HtmlElement
+from builder.builder_arena import NestedHtmlBuilder
+
+# fmt: off
+EXP_NESTED = """<div>
+  <ul>
+    <li>
+      hello
+    </li>
+    <li>
+      <b>
+        hola
+      </b>
+    </li>
+  </ul>
+  <p>
+    bye
+  </p>
+</div>"""
+# fmt: on
+
+
+def test_nested_builder() -> None:
+    """Build nested HTML elements using a fluent API."""
+    builder = (
+        NestedHtmlBuilder("div")
+        .child("ul")
+        .add_child("li", "hello")
+        .child("li")
+        .child("b", "hola")
+        .up()
+        .up()
+        .up()
+        .child("p", "bye")
+    )
+    assert str(builder) == EXP_NESTED
+
+    arena = builder.build()
+    assert len(arena) == 6
+    assert [arena.names[child] for child in arena.children(0)] == ["ul", "p"]
+    assert str(arena.to_element()) == EXP_NESTED
+
+
+def test_nested_builder_matches_element() -> None:
+    """Verify that the arena renders the same as equivalent `HtmlElement`s."""
+    builder = NestedHtmlBuilder("ul", "items")
+    root = HtmlElement("ul", "items")
+    for i in range(3):
+        builder.child("li", f"item {i}").add_child("br").up()
+        item = HtmlElement("li", f"item {i}")
+        item.subelements.append(HtmlElement("br"))
+        root.subelements.append(item)
+
+    assert str(builder) == str(root)
+
+
+def test_nested_builder_up_from_root() -> None:
+    """Verify that the root element has no parent to return to."""
+    with pytest.raises(ValueError):
+        NestedHtmlBuilder("div").up()
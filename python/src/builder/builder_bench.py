@@ -0,0 +1,95 @@
+"""Benchmark rendering deep and wide `HtmlElement` documents.
+
+Run from `python/src` with `python -m builder.builder_bench`.
+"""
+
+import io
+import timeit
+from typing import Callable, Dict
+
+from builder.builder import HtmlElement, RenderContext
+
+# `str()` recurses once per level, so stay clear of the recursion limit.
+DEEP_DEPTH = 500
+WIDE_WIDTH = 100_000
+PAGE_SECTIONS = 100
+PAGE_SECTION_ITEMS = 1_000
+
+
+def deep_document(depth: int = DEEP_DEPTH) -> HtmlElement:
+    """Return a document nested `depth` levels deep."""
+    root = HtmlElement("div", "level 0")
+    parent = root
+    for level in range(1, depth):
+        child = HtmlElement("div", f"level {level}")
+        parent.subelements.append(child)
+        parent = child
+    return root
+
+
+def wide_document(width: int = WIDE_WIDTH) -> HtmlElement:
+    """Return a document with `width` children of the root."""
+    root = HtmlElement("ul")
+    root.subelements = [HtmlElement("li", f"item {i}") for i in range(width)]
+    return root
+
+
+def static_page(
+    sections: int = PAGE_SECTIONS, items: int = PAGE_SECTION_ITEMS
+) -> HtmlElement:
+    """Return a page of `sections` lists of `items` items each."""
+    root = HtmlElement("body")
+    for section_index in range(sections):
+        section = HtmlElement("ul")
+        for item_index in range(items):
+            section.add_subelement(HtmlElement("li", f"item {item_index}"))
+        root.add_subelement(section)
+    return root
+
+
+def _mutate(page: HtmlElement) -> None:
+    page.subelements[0].add_subelement(HtmlElement("li", "new item"))
+
+
+def _write(element: HtmlElement) -> str:
+    stream = io.StringIO()
+    element.write(stream)
+    return stream.getvalue()
+
+
+def renderers() -> Dict[str, Callable[[HtmlElement], str]]:
+    """Return the ways of rendering an element to a string."""
+    return {
+        "str()": str,
+        "write(StringIO)": _write,
+        "join(iter_chunks())": lambda element: "".join(element.iter_chunks()),
+    }
+
+
+def main() -> None:
+    """Time each renderer on a deep and a wide document."""
+    for name, document in [
+        (f"deep ({DEEP_DEPTH} levels)", deep_document()),
+        (f"wide ({WIDE_WIDTH:,} children)", wide_document()),
+    ]:
+        print(name)
+        expected = str(document)
+        for renderer_name, render in renderers().items():
+            assert render(document) == expected
+            seconds = min(timeit.repeat(lambda: render(document), number=5, repeat=3))
+            print(f"  {renderer_name:<22}{seconds / 5 * 1000:>10.2f} ms")
+
+    page = static_page()
+    context = RenderContext(HtmlElement.INDENT_SIZE)
+    page.render(context)
+    print(f"page ({PAGE_SECTIONS} sections of {PAGE_SECTION_ITEMS:,} items)")
+    for renderer_name, render in [
+        ("str() after mutation", lambda: (_mutate(page), str(page))),
+        ("render() after mutation", lambda: (_mutate(page), page.render(context))),
+    ]:
+        seconds = min(timeit.repeat(render, number=5, repeat=3))
+        print(f"  {renderer_name:<22}{seconds / 5 * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,37 @@ to also add it to the parent builder.
 """
 
 
-from typing import Optional
+from itertools import repeat, starmap
+from typing import (
+    Any,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from builder.builder_snapshot import derive_many, take_snapshot
+
+# Attributes of a `Person`.
+PERSON_FIELDS: Final[Tuple[str, ...]] = (
+    "street_address",
+    "postcode",
+    "city",
+    "company_name",
+    "position",
+    "annual_income",
+)
+
+B = TypeVar("B", bound="PersonBuilder")
 
 
 class Person:
@@ -23,6 +53,57 @@ class Person:
         self.annual_income: Optional[int] = None
 
 
+class SlottedPerson:
+    """`Person` with `__slots__`, taking less memory when building many people."""
+
+    __slots__ = PERSON_FIELDS
+
+    def __init__(
+        self,
+        street_address: Optional[str] = None,
+        postcode: Optional[str] = None,
+        city: Optional[str] = None,
+        company_name: Optional[str] = None,
+        position: Optional[str] = None,
+        annual_income: Optional[int] = None,
+    ) -> None:
+        """Create a `SlottedPerson` with the given address and employment info."""
+        self.street_address = street_address
+        self.postcode = postcode
+        self.city = city
+        self.company_name = company_name
+        self.position = position
+        self.annual_income = annual_income
+
+
+class PersonSnapshot(NamedTuple):
+    """Immutable, validated snapshot of a `Person`; see `builder_snapshot`."""
+
+    street_address: Optional[str] = None
+    postcode: Optional[str] = None
+    city: Optional[str] = None
+    company_name: Optional[str] = None
+    position: Optional[str] = None
+    annual_income: Optional[int] = None
+
+    @staticmethod
+    def check_field(field: str, value: Any) -> None:
+        """Raise `TypeError` or `ValueError` if `value` is invalid for `field`."""
+        if value is None:
+            return
+        if field == "annual_income":
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise TypeError(f"annual_income must be an int, not {value!r}")
+            if value < 0:
+                raise ValueError(f"annual_income must not be negative, not {value!r}")
+        elif not isinstance(value, str):
+            raise TypeError(f"{field} must be a str, not {value!r}")
+
+    def to_person(self) -> Person:
+        """Return a mutable `Person` with the values of this snapshot."""
+        return _person(*self)
+
+
 class PersonBuilder:
     """Builder to build a person.
 
@@ -36,20 +117,86 @@ class PersonBuilder:
         else:
             self.person = person
 
+        # Sub-builders of the person, shared by this builder and its sub-builders so
+        # that switching between them allocates nothing.
+        self._facets: Dict[type, PersonBuilder] = {}
+
+    def _facet(self, facet_type: Type[B]) -> B:
+        facet = self._facets.get(facet_type)
+        if facet is None:
+            facet = facet_type(self.person)
+            facet._facets = self._facets
+            self._facets[facet_type] = facet
+        return cast(B, facet)
+
     @property
     def works(self) -> "PersonJobBuilder":
         """Return a sub-builder to build the person's job."""
-        return PersonJobBuilder(self.person)
+        return self._facet(PersonJobBuilder)
 
     @property
     def lives(self) -> "PersonAddressBuilder":
         """Return a sub-builder to build the person's address."""
-        return PersonAddressBuilder(self.person)
+        return self._facet(PersonAddressBuilder)
 
     def build(self) -> Person:
         """Return the `Person` object that is built."""
         return self.person
 
+    def snapshot(self) -> PersonSnapshot:
+        """Return an immutable, validated snapshot of the person built so far."""
+        return take_snapshot(PersonSnapshot, self.person)
+
+    def build_many(
+        self, variants: Iterable[Mapping[str, Any]]
+    ) -> Iterator[PersonSnapshot]:
+        """Return a snapshot of the person built so far changed by each of `variants`.
+
+        See `builder_snapshot.derive_many`.
+        """
+        return derive_many(self.snapshot(), variants)
+
+    @staticmethod
+    def from_columns(
+        columns: Mapping[str, Sequence[Any]], slotted: bool = False
+    ) -> Iterator[Union[Person, SlottedPerson]]:
+        """Build a person from each row of `columns`, without any sub-builders.
+
+        `columns` maps `Person` attribute names to equal-length sequences of values;
+        attributes without a column are left unset. With `slotted`, the people are
+        `SlottedPerson`s.
+        """
+        unknown = set(columns).difference(PERSON_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown Person attributes: {sorted(unknown)}")
+        if len({len(column) for column in columns.values()}) > 1:
+            raise ValueError("Columns must be of equal length")
+        if not columns:
+            return iter(())
+
+        rows = zip(*(columns.get(field, repeat(None)) for field in PERSON_FIELDS))
+        return starmap(SlottedPerson if slotted else _person, rows)
+
+
+def _person(
+    street_address: Optional[str],
+    postcode: Optional[str],
+    city: Optional[str],
+    company_name: Optional[str],
+    position: Optional[str],
+    annual_income: Optional[int],
+) -> Person:
+    # Assign the attributes in the same order as `Person.__init__`, so the instance
+    # dicts share their keys.
+    person = Person.__new__(Person)
+    person.street_address = street_address
+    person.postcode = postcode
+    person.city = city
+    person.company_name = company_name
+    person.position = position
+    person.annual_income = annual_income
+    return person
+
 
 class PersonJobBuilder(PersonBuilder):
     """Sub-builder to build the person's job.
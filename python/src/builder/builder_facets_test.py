@@ -1,8 +1,12 @@
 """Demonstrate using Builder design pattern for building complicated objects."""
 
+import tracemalloc
 from copy import copy
 
-from builder.builder_facets import PersonBuilder
+import pytest
+
+from builder import builder_facets
+from builder.builder_facets import PersonBuilder, PersonSnapshot, SlottedPerson
 
 
 def test_build_person() -> None:
@@ -44,3 +48,114 @@ def test_build_person_copy() -> None:
     assert manager.city is None
     assert manager.company_name == "Fabrikam"
     assert manager.position == "Manager"
+
+
+def test_build_person_snapshots() -> None:
+    """Build immutable `Person` snapshots using the builder as a template."""
+    builder = PersonBuilder().works.at("Fabrikam").as_a("Engineer")
+    fabrikam_engineer = builder.snapshot()
+    assert fabrikam_engineer == PersonSnapshot(
+        company_name="Fabrikam", position="Engineer"
+    )
+    with pytest.raises(AttributeError):
+        fabrikam_engineer.city = "London"  # type: ignore
+
+    cities = ["London", "Paris"] * 1000
+    engineers = list(builder.build_many({"city": city} for city in cities))
+    assert [engineer.city for engineer in engineers] == cities
+    assert all(
+        engineer.company_name is fabrikam_engineer.company_name
+        for engineer in engineers
+    )
+
+    manager = next(builder.build_many([{"position": "Manager"}])).to_person()
+    assert (manager.company_name, manager.position) == ("Fabrikam", "Manager")
+
+
+def test_build_person_snapshots_validated() -> None:
+    """Verify that snapshots are validated."""
+    with pytest.raises(ValueError):
+        PersonBuilder().works.earning(-1).snapshot()
+    with pytest.raises(TypeError):
+        list(PersonBuilder().build_many([{"annual_income": "lots"}]))
+    with pytest.raises(ValueError, match=r"Unknown PersonSnapshot fields: \['name'\]"):
+        list(PersonBuilder().build_many([{"name": "Dmitri"}]))
+
+
+def test_build_person_facets_reused() -> None:
+    """Verify that switching between sub-builders reuses them."""
+    builder = PersonBuilder()
+    job_builder = builder.works
+    address_builder = builder.lives
+    assert builder.works is job_builder
+    assert job_builder.lives is address_builder
+    assert address_builder.works is job_builder
+    assert job_builder.works is job_builder
+    assert job_builder.person is address_builder.person is builder.person
+
+    other_builder = PersonBuilder()
+    assert other_builder.works is not job_builder
+    assert other_builder.works.person is other_builder.person
+
+
+def test_build_person_facets_allocation_free() -> None:
+    """Verify that switching between sub-builders allocates no builders."""
+    builder = PersonBuilder()
+    builder.works.lives.works.lives.build()
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        # Keep the sub-builders, so that any allocated ones show in the snapshot.
+        facets = [builder.lives.works for _ in range(1000)]
+        facets += [facet.lives for facet in facets]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    trace_filter = tracemalloc.Filter(True, builder_facets.__file__)
+    allocated = [
+        stat
+        for stat in after.filter_traces([trace_filter]).compare_to(
+            before.filter_traces([trace_filter]), "filename"
+        )
+        if stat.count_diff > 0
+    ]
+    assert not allocated
+    assert len({id(facet) for facet in facets}) == 2
+
+
+def test_build_people_from_columns() -> None:
+    """Build `Person`s from columns of attribute values."""
+    columns = {
+        "city": ["London", "Paris"],
+        "company_name": ["Fabrikam", "Contoso"],
+        "annual_income": [123000, 456000],
+    }
+    london, paris = PersonBuilder.from_columns(columns)
+    assert (london.city, london.company_name, london.annual_income) == (
+        "London",
+        "Fabrikam",
+        123000,
+    )
+    assert paris.city == "Paris"
+    assert paris.street_address is None
+    assert vars(paris) == {
+        **vars(PersonBuilder().lives.in_city("Paris").build()),
+        "company_name": "Contoso",
+        "annual_income": 456000,
+    }
+
+    slotted = list(PersonBuilder.from_columns(columns, slotted=True))
+    assert isinstance(slotted[0], SlottedPerson)
+    assert (slotted[1].city, slotted[1].position) == ("Paris", None)
+
+    assert not list(PersonBuilder.from_columns({}))
+
+
+def test_build_people_from_invalid_columns() -> None:
+    """Verify that columns are checked."""
+    with pytest.raises(ValueError):
+        PersonBuilder.from_columns({"name": ["Dmitri"]})
+    with pytest.raises(ValueError):
+        PersonBuilder.from_columns({"city": ["London"], "postcode": []})
@@ -5,7 +5,9 @@ already got.
 """
 
 
-from typing import Optional, TypeVar
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple, Optional, TypeVar
+
+from builder.builder_snapshot import derive_many, take_snapshot
 
 
 class Person:
@@ -17,6 +19,26 @@ class Person:
         self.date_of_birth: Optional[str] = None
 
 
+class PersonSnapshot(NamedTuple):
+    """Immutable, validated snapshot of a `Person`; see `builder_snapshot`."""
+
+    name: Optional[str] = None
+    position: Optional[str] = None
+    date_of_birth: Optional[str] = None
+
+    @staticmethod
+    def check_field(field: str, value: Any) -> None:
+        """Raise `TypeError` if `value` is invalid for `field`."""
+        if value is not None and not isinstance(value, str):
+            raise TypeError(f"{field} must be a str, not {value!r}")
+
+    def to_person(self) -> Person:
+        """Return a mutable `Person` with the values of this snapshot."""
+        person = Person()
+        person.name, person.position, person.date_of_birth = self
+        return person
+
+
 T = TypeVar("T", bound="PersonBuilder")
 
 
@@ -30,6 +52,19 @@ class PersonBuilder:
         """Build the `Person` object."""
         return self.person
 
+    def snapshot(self) -> PersonSnapshot:
+        """Return an immutable, validated snapshot of the person built so far."""
+        return take_snapshot(PersonSnapshot, self.person)
+
+    def build_many(
+        self, variants: Iterable[Mapping[str, Any]]
+    ) -> Iterator[PersonSnapshot]:
+        """Return a snapshot of the person built so far changed by each of `variants`.
+
+        See `builder_snapshot.derive_many`.
+        """
+        return derive_many(self.snapshot(), variants)
+
 
 # You can have any number of builders through inheritance to initialise various aspects
 # of Person.
@@ -1,6 +1,8 @@
 """Demonstrate using Builder design pattern with inheritance to avoid violating OCP."""
 
-from builder.builder_inheritance import PersonBirthDateBuilder
+import pytest
+
+from builder.builder_inheritance import PersonBirthDateBuilder, PersonSnapshot
 
 
 def test_build_person() -> None:
@@ -11,3 +13,24 @@ def test_build_person() -> None:
     assert dmitri.name == "Dmitri"
     assert dmitri.position == "Engineer"
     assert dmitri.date_of_birth == "1/1/1980"
+
+
+def test_build_person_snapshots() -> None:
+    """Build immutable `Person` snapshots using the builder as a template."""
+    builder = PersonBirthDateBuilder().works_as_a("Engineer").born("1/1/1980")
+    names = [f"Dmitri {i}" for i in range(1000)]
+    engineers = list(builder.build_many({"name": name} for name in names))
+
+    assert [engineer.name for engineer in engineers] == names
+    assert engineers[0] == PersonSnapshot("Dmitri 0", "Engineer", "1/1/1980")
+    assert engineers[0].position is engineers[-1].position
+    assert vars(engineers[1].to_person()) == {
+        "name": "Dmitri 1",
+        "position": "Engineer",
+        "date_of_birth": "1/1/1980",
+    }
+
+    with pytest.raises(TypeError):
+        list(builder.build_many([{"date_of_birth": 1980}]))
+    with pytest.raises(ValueError, match="city"):
+        list(builder.build_many([{"city": "London"}]))
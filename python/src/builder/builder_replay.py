@@ -0,0 +1,103 @@
+"""Builder pattern example: recording a fluent chain once, and replaying it in bulk.
+
+Building each `Person` through `PersonBirthDateBuilder().born(...).works_as_a(...)`
+dispatches every call through the builder inheritance chain. When the same chain is
+applied to many sets of arguments, record it once with a `ChainRecorder`: recording
+works out which `Person` attribute each call sets, and compiles the chain into a
+function that creates the person and assigns the attributes directly.
+"""
+
+import keyword
+from itertools import starmap
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Sequence, Type
+
+from builder.builder_inheritance import Person, PersonBuilder, T
+
+
+class RecordedChain:
+    """A fluent chain compiled into direct attribute assignments."""
+
+    def __init__(
+        self,
+        methods: Sequence[str],
+        attributes: Sequence[str],
+        person_type: Callable[[], Any] = Person,
+    ) -> None:
+        """Compile a chain of calls to `methods`, which set `attributes` in turn.
+
+        The replayed chain creates its people by calling `person_type`.
+        """
+        self.methods = tuple(methods)
+        self.attributes = tuple(attributes)
+        self.person_type = person_type
+
+        for attribute in self.attributes:
+            if not attribute.isidentifier() or keyword.iskeyword(attribute):
+                raise ValueError(f"Cannot assign attribute {attribute!r}")
+
+        # As `collections.namedtuple` does, generate the source of a function
+        # specialised for the attributes, as a loop over them would be slower than
+        # the live chain.
+        parameters = [f"_{index}" for index in range(len(self.attributes))]
+        lines = [f"def make_person({', '.join(parameters)}):", "    person = Person()"]
+        lines += [
+            f"    person.{attribute} = {parameter}"
+            for attribute, parameter in zip(self.attributes, parameters)
+        ]
+        lines.append("    return person")
+        namespace = {"Person": person_type}
+        exec("\n".join(lines), namespace)
+        self.make_person: Callable[..., Person] = namespace["make_person"]
+
+    def replay(self, rows: Iterable[Sequence[Any]]) -> Iterator[Person]:
+        """Build a person for each row, holding one argument per recorded call."""
+        return starmap(self.make_person, rows)
+
+
+class ChainRecorder(Generic[T]):
+    """Recorder of a fluent chain of calls on a builder type.
+
+    Call the builder's methods on the recorder, without arguments, in the order they
+    are to be applied; then `compile` the recorded chain.
+    """
+
+    def __init__(self, builder_type: Type[T]) -> None:
+        """Create a recorder of a chain of calls on `builder_type` builders."""
+        self._builder_type = builder_type
+        self._methods: List[str] = []
+
+    def __getattr__(self, name: str) -> Callable[[], "ChainRecorder[T]"]:
+        if name.startswith("_") or not callable(getattr(self._builder_type, name)):
+            raise AttributeError(f"{self._builder_type.__name__} has no method {name}")
+
+        def record() -> "ChainRecorder[T]":
+            self._methods.append(name)
+            return self
+
+        return record
+
+    def compile(self) -> RecordedChain:
+        """Compile the recorded chain.
+
+        Each method is called once on a probe builder, to find the attribute it sets
+        on the builder's person; the replayed chain creates people of the same type.
+        A method that returns anything but the builder, or does not store its argument
+        in exactly one attribute, cannot be replayed.
+        """
+        builder: PersonBuilder = self._builder_type()
+        attributes = []
+        for method in self._methods:
+            probe = object()
+            if getattr(builder, method)(probe) is not builder:
+                raise ValueError(f"{method} does not return the builder")
+
+            assigned = [
+                attribute
+                for attribute, value in vars(builder.person).items()
+                if value is probe
+            ]
+            if len(assigned) != 1:
+                raise ValueError(f"{method} does not set exactly one attribute")
+            attributes.append(assigned[0])
+
+        return RecordedChain(self._methods, attributes, type(builder.person))
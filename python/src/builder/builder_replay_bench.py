@@ -0,0 +1,42 @@
+"""Benchmark replaying a recorded fluent chain against the live chain.
+
+Run from `python/src` with `python -m builder.builder_replay_bench`.
+"""
+
+import timeit
+from typing import List
+
+from builder.builder_inheritance import Person, PersonBirthDateBuilder
+from builder.builder_replay import ChainRecorder
+
+ROWS = 100_000
+
+
+def main() -> None:
+    """Time building `ROWS` people through the live chain and by replay."""
+    rows = [(f"1/1/{1900 + i % 100}", "Engineer", f"Dmitri {i}") for i in range(ROWS)]
+    chain = ChainRecorder(PersonBirthDateBuilder).born().works_as_a().called().compile()
+
+    def live() -> List[Person]:
+        return [
+            PersonBirthDateBuilder()
+            .born(date_of_birth)
+            .works_as_a(position)
+            .called(name)
+            .build()
+            for date_of_birth, position, name in rows
+        ]
+
+    def replay() -> List[Person]:
+        return list(chain.replay(rows))
+
+    assert [vars(person) for person in live()] == [vars(person) for person in replay()]
+
+    print(f"{ROWS:,} people, best of 5")
+    for name, build in [("live chain", live), ("replay", replay)]:
+        seconds = min(timeit.repeat(build, number=1, repeat=5))
+        print(f"  {name:<12}{seconds * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
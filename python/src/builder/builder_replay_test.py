@@ -0,0 +1,74 @@
+"""Demonstrate recording a fluent builder chain and replaying it in bulk."""
+
+from typing import Optional
+
+import pytest
+
+from builder.builder_inheritance import (
+    Person,
+    PersonBirthDateBuilder,
+    PersonInfoBuilder,
+)
+from builder.builder_replay import ChainRecorder
+
+
+class Employee(Person):
+    """Person with an employee number."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.number: Optional[int] = None
+
+
+class EmployeeBuilder(PersonInfoBuilder):
+    """Build an `Employee` along with the employee's name and number."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.person: Employee = Employee()
+
+    def numbered(self, number: int) -> "EmployeeBuilder":
+        """Set the employee's number."""
+        self.person.number = number
+        return self
+
+
+def test_replay_chain() -> None:
+    """Build `Person`s by replaying a recorded chain over rows of arguments."""
+    chain = ChainRecorder(PersonBirthDateBuilder).born().works_as_a().called().compile()
+    assert chain.methods == ("born", "works_as_a", "called")
+    assert chain.attributes == ("date_of_birth", "position", "name")
+
+    rows = [("1/1/1980", "Engineer", "Dmitri"), ("2/2/1990", "Manager", "Ada")]
+    people = list(chain.replay(rows))
+    for person, (date_of_birth, position, name) in zip(people, rows):
+        live = (
+            PersonBirthDateBuilder()
+            .born(date_of_birth)
+            .works_as_a(position)
+            .called(name)
+            .build()
+        )
+        assert vars(person) == vars(live)
+
+
+def test_replay_partial_chain() -> None:
+    """Leave attributes not set by the chain unset."""
+    chain = ChainRecorder(PersonBirthDateBuilder).called().compile()
+    (person,) = chain.replay([("Dmitri",)])
+    assert person.name == "Dmitri"
+    assert person.position is None and person.date_of_birth is None
+
+
+def test_record_unknown_method() -> None:
+    """Verify that only the builder's methods can be recorded."""
+    with pytest.raises(AttributeError):
+        ChainRecorder(PersonInfoBuilder).works_as_a()
+
+
+def test_replay_builder_person_type() -> None:
+    """Build people of the type the recorded builder builds."""
+    chain = ChainRecorder(EmployeeBuilder).called().numbered().compile()
+    (employee,) = chain.replay([("Dmitri", 42)])
+    assert type(employee) is Employee
+    assert employee.name == "Dmitri" and employee.number == 42
@@ -0,0 +1,56 @@
+"""Immutable, validated snapshots of the object built by a builder.
+
+A snapshot is a `NamedTuple` whose fields are attributes of the built object, with a
+`check_field` static method validating the value of a field. Deriving many snapshots
+from one template with `derive_many` validates only the changed values, and the derived
+snapshots share the template's unchanged values rather than copying them.
+"""
+
+from typing import Any, Iterable, Iterator, Mapping, Protocol, Tuple, Type, TypeVar
+
+
+class Snapshot(Protocol):
+    """An immutable snapshot, e.g., a `NamedTuple` with a `check_field` method."""
+
+    _fields: Tuple[str, ...]
+
+    @staticmethod
+    def check_field(field: str, value: Any) -> None:
+        """Raise `TypeError` or `ValueError` if `value` is invalid for `field`."""
+
+    def _replace(self: "S", **values: Any) -> "S":
+        ...
+
+
+S = TypeVar("S", bound=Snapshot)
+
+
+def check_fields(snapshot_type: Type[Snapshot], values: Mapping[str, Any]) -> None:
+    """Raise an error unless `values` maps fields of `snapshot_type` to valid values.
+
+    An unknown field raises `ValueError` naming it.
+    """
+    unknown = set(values).difference(snapshot_type._fields)
+    if unknown:
+        raise ValueError(f"Unknown {snapshot_type.__name__} fields: {sorted(unknown)}")
+    for field, value in values.items():
+        snapshot_type.check_field(field, value)
+
+
+def take_snapshot(snapshot_type: Type[S], built: Any) -> S:
+    """Return a validated snapshot of the attributes of `built`."""
+    values = {field: getattr(built, field) for field in snapshot_type._fields}
+    check_fields(snapshot_type, values)
+    return snapshot_type(**values)
+
+
+def derive_many(template: S, variants: Iterable[Mapping[str, Any]]) -> Iterator[S]:
+    """Derive a snapshot from `template` for each of `variants`.
+
+    Each variant maps the fields to change to their values; only those values are
+    validated.
+    """
+    snapshot_type = type(template)
+    for variant in variants:
+        check_fields(snapshot_type, variant)
+        yield template._replace(**variant)
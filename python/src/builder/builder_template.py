@@ -0,0 +1,104 @@
+"""Builder pattern example: compiling a document shape into a template.
+
+When the same document shape is built over and over, varying only the text of its
+elements, building the elements and rendering them each time is wasted work. Instead,
+build the shape once with `Slot`s in place of the varying text, and compile it into an
+`HtmlTemplate`: a pre-joined skeleton of the rendered document with the slots left to
+fill in.
+"""
+
+import html
+from typing import Callable, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from builder.builder import HtmlBuilder, HtmlElement
+
+
+class Slot(str):
+    """Text of an element to be filled in when rendering an `HtmlTemplate`.
+
+    The value of the string is the name of the slot.
+    """
+
+
+class HtmlTemplate:
+    """Precompiled rendering of a document with text slots."""
+
+    def __init__(
+        self,
+        source: Union[HtmlElement, HtmlBuilder],
+        escape: Union[bool, Callable[[str], str]] = False,
+    ) -> None:
+        """Compile the document built by `source`.
+
+        `escape` is applied to the values of the slots: `True` for `html.escape`, or a
+        function taking and returning a string.
+        """
+        element = source.build() if isinstance(source, HtmlBuilder) else source
+        if escape is True:
+            self._escape: Optional[Callable[[str], str]] = html.escape
+        else:
+            self._escape = escape or None
+
+        skeleton: List[str] = []
+        self._slots: List[Tuple[str, str]] = []
+        for chunk, slot in self._compile(element):
+            if slot is None:
+                skeleton.append(chunk.replace("{", "{{").replace("}", "}}"))
+            else:
+                skeleton.append(f"{{{len(self._slots)}}}")
+                self._slots.append((slot, chunk))
+        self._skeleton = "".join(skeleton)
+
+    @property
+    def slots(self) -> Tuple[str, ...]:
+        """Names of the slots, in document order."""
+        return tuple(name for name, _ in self._slots)
+
+    @staticmethod
+    def _compile(element: HtmlElement) -> Iterator[Tuple[str, Optional[str]]]:
+        """Yield (chunk, `None`) for static text, and (line prefix, name) for slots."""
+        size = HtmlElement.INDENT_SIZE
+        stack: List[Union[Tuple[HtmlElement, int], str]] = [(element, 0)]
+        separator = ""
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                yield item, None
+                continue
+
+            element, indent_level = item
+            indent = " " * (indent_level * size)
+            yield f"{separator}{indent}<{element.name}>", None
+            separator = "\n"
+
+            indent_text = " " * ((indent_level + 1) * size)
+            if isinstance(element.text, Slot):
+                yield f"\n{indent_text}", str(element.text)
+            elif element.text:
+                yield f"\n{indent_text}{element.text}", None
+
+            stack.append(f"\n{indent}</{element.name}>")
+            for subelement in reversed(element.subelements):
+                stack.append((subelement, indent_level + 1))
+
+    def render(self, **values: str) -> str:
+        """Render the document, filling each slot with the value of the same name.
+
+        As with `HtmlElement`, the line of an element whose text is empty is omitted.
+        """
+        escape = self._escape
+        fills = []
+        for name, prefix in self._slots:
+            value = values[name]
+            if not value:
+                fills.append("")
+            elif escape is None:
+                fills.append(prefix + value)
+            else:
+                fills.append(prefix + escape(value))
+        return self._skeleton.format(*fills)
+
+    def render_many(self, rows: Iterable[Mapping[str, str]]) -> Iterator[str]:
+        """Render the document once for each mapping of slot names to values."""
+        for row in rows:
+            yield self.render(**row)
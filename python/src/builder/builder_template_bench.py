@@ -0,0 +1,46 @@
+"""Benchmark rendering a repeated document shape from a template.
+
+Run from `python/src` with `python -m builder.builder_template_bench`.
+"""
+
+import timeit
+from typing import Dict
+
+from builder.builder import HtmlElement
+from builder.builder_template import HtmlTemplate, Slot
+
+ITEMS = 10
+NUMBER = 20_000
+
+
+def rebuild(texts: Dict[str, str]) -> str:
+    """Build the list elements and render them."""
+    builder = HtmlElement.create("ul")
+    for i in range(ITEMS):
+        builder.add_child_fluent("li", texts[f"item{i}"])
+    return str(builder)
+
+
+def main() -> None:
+    """Time rebuilding the document against rendering the compiled template."""
+    shape = HtmlElement.create("ul")
+    for i in range(ITEMS):
+        shape.add_child_fluent("li", Slot(f"item{i}"))
+    template = HtmlTemplate(shape)
+    escaping_template = HtmlTemplate(shape, escape=True)
+
+    texts = {f"item{i}": f"text number {i}" for i in range(ITEMS)}
+    assert template.render(**texts) == rebuild(texts)
+
+    print(f"<ul> with {ITEMS} <li>, {NUMBER:,} renders, best of 3 (us/render)")
+    for name, render in [
+        ("rebuild + str()", lambda: rebuild(texts)),
+        ("template", lambda: template.render(**texts)),
+        ("template (escaped)", lambda: escaping_template.render(**texts)),
+    ]:
+        seconds = min(timeit.repeat(render, number=NUMBER, repeat=3))
+        print(f"  {name:<20}{seconds / NUMBER * 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
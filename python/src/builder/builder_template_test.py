@@ -0,0 +1,48 @@
+"""Demonstrate compiling a document shape built by a builder into a template."""
+
+import pytest
+
+from builder.builder import HtmlElement
+from builder.builder_template import HtmlTemplate, Slot
+
+# fmt: off
+EXP_HELLOS = """<ul>
+  <li>
+    hello
+  </li>
+  <li>
+    hola
+  </li>
+</ul>"""
+# fmt: on
+
+
+def test_template_render() -> None:
+    """Render a compiled template with different slot values."""
+    template = HtmlTemplate(
+        HtmlElement.create("ul")
+        .add_child_fluent("li", Slot("first"))
+        .add_child_fluent("li", Slot("second"))
+    )
+    assert template.slots == ("first", "second")
+    assert template.render(first="hello", second="hola") == EXP_HELLOS
+
+    builder = HtmlElement.create("ul").add_child_fluent("li", "{x}")
+    builder.add_child("li", "")
+    assert template.render(first="{x}", second="") == str(builder)
+
+    assert list(template.render_many([{"first": "hello", "second": "hola"}])) == [
+        EXP_HELLOS
+    ]
+    with pytest.raises(KeyError):
+        template.render(first="hello")
+
+
+def test_template_escape() -> None:
+    """Escape the slot values, but not the static text of the template."""
+    builder = HtmlElement.create("p", "<static>").add_child_fluent("b", Slot("value"))
+
+    assert "<static>" in HtmlTemplate(builder, escape=True).render(value="")
+    assert "&lt;i&gt;" in HtmlTemplate(builder, escape=True).render(value="<i>")
+    assert "I" in HtmlTemplate(builder, escape=str.upper).render(value="i")
+    assert "<i>" in HtmlTemplate(builder).render(value="<i>")
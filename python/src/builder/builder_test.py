@@ -1,8 +1,9 @@
 """Demonstrate using Builder design pattern."""
 
+import io
 from typing import Final
 
-from builder.builder import HtmlElement
+from builder.builder import HtmlElement, RenderContext
 
 # fmt: off
 EXP_HELLO: Final[str] = """<p>
@@ -62,3 +63,89 @@ def test_create_html_builder_fluent() -> None:
         .add_child_fluent("li", "hola")
     )
     assert str(builder) == EXP_HELLOS
+
+
+def test_create_html_builder_streaming() -> None:
+    """Render HTML elements into a stream and as chunks."""
+    builder = (
+        HtmlElement.create("ul")
+        .add_child_fluent("li", "hello")
+        .add_child_fluent("li", "hola")
+    )
+    assert "".join(builder.iter_chunks()) == EXP_HELLOS
+
+    stream = io.StringIO()
+    builder.write(stream)
+    assert stream.getvalue() == EXP_HELLOS
+
+
+def test_streaming_nested() -> None:
+    """Verify that streaming renders nested elements the same as `str()`."""
+    root = HtmlElement("div")
+    parent = root
+    for depth in range(5):
+        child = HtmlElement("div", f"level {depth}" if depth % 2 else "")
+        sibling = HtmlElement("p", "sibling")
+        parent.subelements.extend([sibling, child, HtmlElement("br")])
+        parent = child
+
+    assert "".join(root.iter_chunks()) == str(root)
+
+
+def test_render_context() -> None:
+    """Verify that a render context reuses its strings."""
+    context = RenderContext(HtmlElement.INDENT_SIZE)
+    assert context.indent(2) == "    "
+    assert context.indent(2) is context.indent(2)
+    assert context.open_tag("li") == "<li>"
+    assert context.close_tag("li") is context.close_tag("li")
+
+
+def test_render_cached() -> None:
+    """Verify that cached renderings are discarded when a subtree is mutated."""
+    context = RenderContext(HtmlElement.INDENT_SIZE)
+    root = HtmlElement("div")
+    section = HtmlElement("ul")
+    item = HtmlElement("li", "hello")
+    root.add_subelement(section)
+    section.add_subelement(item)
+    rendered = root.render(context)
+    assert rendered == str(root)
+    assert root.render(context) is rendered
+
+    item.add_subelement(HtmlElement("b", "hola"))
+    assert root.render(context) == str(root) != rendered
+
+
+def test_render_cached_attributes() -> None:
+    """Verify that changing any attribute of an element discards cached renderings."""
+    context = RenderContext(HtmlElement.INDENT_SIZE)
+    root = HtmlElement("div")
+    section = HtmlElement("ul")
+    item = HtmlElement("li", "hello")
+    root.subelements.append(section)
+    section.subelements = [item]
+    root.render(context)
+
+    item.text = "hola"
+    assert root.render(context) == str(root)
+    assert "hola" in str(root)
+
+    item.name = "b"
+    assert root.render(context) == str(root)
+
+    other = HtmlElement("p")
+    section.subelements[0:1] = [other, item]
+    assert root.render(context) == str(root)
+
+    other.subelements.append(HtmlElement("br"))
+    assert root.render(context) == str(root)
+
+    del section.subelements[0]
+    assert root.render(context) == str(root)
+    assert "<p>" not in root.render(context)
+
+    builder = HtmlElement.create("ul").add_child_fluent("li", "hello")
+    assert str(builder).count("<li>") == 1
+    builder.add_child("li", "hola")
+    assert str(builder) == EXP_HELLOS
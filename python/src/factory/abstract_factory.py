@@ -4,8 +4,18 @@ If you have a hierarchy of types, then you can have a corresponding hierarchy of
 factories. You can have an abstract factory as a base class for other factories.
 """
 
+import asyncio
+import importlib
+import inspect
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from importlib import metadata
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from factory.abstract_factory_metrics import DrinkMetrics
+    from factory.abstract_factory_pool import DrinkPool
 
 # Hierarchy of types.
 
@@ -13,13 +23,32 @@ from typing import Dict, Optional
 class HotDrink:
     """Base class for hot drinks."""
 
+    # Pool to return the drink to once consumed, if any; set by `refill`.
+    _pool: Optional["DrinkPool"] = None
+
     def __init__(self, volume: int):
         """Create a hot drink of a specific amount."""
         self._volume = volume
 
     def consume(self) -> None:
-        """Consume the hot drink completely."""
+        """Consume the hot drink completely.
+
+        A drink from a pool returns to the pool, and must not be used afterwards. It
+        returns once, however many times, or from however many threads, it is consumed.
+        """
         self._volume = 0
+        # Popping the pool off the instance is atomic, so only one caller gets it.
+        pool = self.__dict__.pop("_pool", None)
+        if pool is not None:
+            pool.release(self)
+
+    def refill(self, volume: int, pool: Optional["DrinkPool"] = None) -> None:
+        """Refill the hot drink to `volume`, to return to `pool` once consumed.
+
+        Only to be called by the drink's holder, e.g., its pool before handing it out.
+        """
+        self._volume = volume
+        self._pool = pool
 
     def amount(self) -> int:
         """Amount of hot drink available."""
@@ -42,6 +71,10 @@ class HotDrinkFactory(ABC):
 
     This is not really necessary with Python due to duck typing, but it gives you an
     idea of the API you are expected to implement.
+
+    A factory able to prepare several drinks at once more cheaply than one at a time
+    may also implement `prepare_many(count)`, returning a list of `count` drinks,
+    either as a plain method or as a coroutine; see `HotDrinkMachine.make_drinks`.
     """
 
     @abstractmethod
@@ -68,17 +101,154 @@ class CoffeeFactory(HotDrinkFactory):
         return Coffee(50)
 
 
+# Entry point group in which installed packages may advertise hot drink factories.
+ENTRY_POINT_GROUP = "hot_drink_factories"
+
+
 class HotDrinkMachine:
     """Hot drink dispensing machine."""
 
     def __init__(self) -> None:
         self._factories: Dict[str, HotDrinkFactory] = {}
+        # Object references ("module:Factory") of factories not imported yet.
+        self._lazy_factories: Dict[str, str] = {}
+        self._lazy_lock = threading.Lock()
+        # Metrics to record the drinks made to, if any.
+        self.metrics: Optional["DrinkMetrics"] = None
 
     def register_factory(self, drink_name: str, drink_factory: HotDrinkFactory) -> None:
         """Register a hot drink factory."""
+        # Store the factory first, so that a concurrent lookup always finds the drink.
         self._factories[drink_name] = drink_factory
+        self._lazy_factories.pop(drink_name, None)
+
+    def register_lazy_factory(self, drink_name: str, reference: str) -> None:
+        """Register a hot drink factory to be imported when first needed.
+
+        `reference` names a `HotDrinkFactory` subclass or instance, as
+        `"package.module:Factory"` (as in entry points) or `"package.module.Factory"`.
+        The module is imported, and a class instantiated, on the first request for
+        `drink_name`. Replaces any factory registered for `drink_name`.
+        """
+        self._lazy_factories[drink_name] = reference
+        self._factories.pop(drink_name, None)
+
+    def discover_factories(self, group: str = ENTRY_POINT_GROUP) -> List[str]:
+        """Register lazily the factories advertised as entry points of `group`.
+
+        Return the names of the drinks registered. Nothing is imported until a drink is
+        requested.
+        """
+        entry_points = metadata.entry_points()
+        if hasattr(entry_points, "select"):
+            group_entry_points = entry_points.select(group=group)
+        else:
+            # Python < 3.10: a dict of entry points by group.
+            group_entry_points = entry_points.get(group, ())
+
+        drink_names = []
+        for entry_point in group_entry_points:
+            self.register_lazy_factory(entry_point.name, entry_point.value)
+            drink_names.append(entry_point.name)
+        return drink_names
+
+    def _factory(self, drink_name: str) -> Optional[HotDrinkFactory]:
+        factory = self._factories.get(drink_name)
+        if factory is None and drink_name in self._lazy_factories:
+            with self._lazy_lock:
+                factory = self._factories.get(drink_name)
+                reference = self._lazy_factories.get(drink_name)
+                if factory is None and reference is not None:
+                    factory = _load_factory(reference)
+                    self.register_factory(drink_name, factory)
+        return factory
 
     def make_drink(self, drink_name: str) -> Optional[HotDrink]:
         """Return a hot drink, or `None` if its factory has not been registered."""
-        factory = self._factories.get(drink_name)
-        return factory.prepare() if not factory is None else None
+        factory = self._factory(drink_name)
+        metrics = self.metrics
+        if metrics is None:
+            return factory.prepare() if not factory is None else None
+
+        if factory is None:
+            metrics.record_unknown(drink_name)
+            return None
+        start = time.perf_counter()
+        drink = factory.prepare()
+        metrics.record(drink_name, time.perf_counter() - start)
+        return drink
+
+    async def make_drinks(self, drink_names: Sequence[str]) -> List[Optional[HotDrink]]:
+        """Return hot drinks for a batch of requests, in the order requested.
+
+        Requests for the same drink are grouped, and each group is prepared with one
+        call to the factory's `prepare_many` if it has one. Groups are prepared
+        concurrently; synchronous factories run in the event loop's default executor.
+        A request is answered with `None` if the drink's factory has not been
+        registered.
+        """
+        positions: Dict[str, List[int]] = {}
+        for position, drink_name in enumerate(drink_names):
+            positions.setdefault(drink_name, []).append(position)
+
+        drinks: List[Optional[HotDrink]] = [None] * len(drink_names)
+
+        async def prepare_group(drink_name: str, group: List[int]) -> None:
+            metrics = self.metrics
+            start = time.perf_counter()
+            prepared = await self._make_many(drink_name, len(group))
+            if prepared is None:
+                if metrics is not None:
+                    metrics.record_unknown(drink_name, len(group))
+                return
+
+            if len(prepared) != len(group):
+                raise ValueError(
+                    f"{len(prepared)} {drink_name} drinks made, {len(group)} requested"
+                )
+            if metrics is not None:
+                metrics.record(drink_name, time.perf_counter() - start, len(group))
+            for position, drink in zip(group, prepared):
+                drinks[position] = drink
+
+        await asyncio.gather(
+            *(prepare_group(name, group) for name, group in positions.items())
+        )
+        return drinks
+
+    async def _make_many(
+        self, drink_name: str, count: int
+    ) -> Optional[List[HotDrink]]:
+        """Return `count` drinks, or `None` if the factory has not been registered."""
+        factory = self._factory(drink_name)
+        if factory is None:
+            return None
+        return await prepare_many(factory, count)
+
+
+def _load_factory(reference: str) -> HotDrinkFactory:
+    if ":" in reference:
+        module_name, _, qualname = reference.partition(":")
+    else:
+        module_name, _, qualname = reference.rpartition(".")
+
+    target = importlib.import_module(module_name)
+    for attribute in qualname.split("."):
+        target = getattr(target, attribute)
+
+    factory = target() if isinstance(target, type) else target
+    if not isinstance(factory, HotDrinkFactory):
+        raise TypeError(f"{reference} is not a HotDrinkFactory")
+    return factory
+
+
+async def prepare_many(factory: HotDrinkFactory, count: int) -> List[HotDrink]:
+    """Prepare `count` drinks with `factory`, with its `prepare_many` if it has one."""
+    prepare_many = getattr(factory, "prepare_many", None)
+    if prepare_many is None:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, lambda: [factory.prepare() for _ in range(count)]
+        )
+    if inspect.iscoroutinefunction(prepare_many):
+        return await prepare_many(count)
+    return await asyncio.get_running_loop().run_in_executor(None, prepare_many, count)
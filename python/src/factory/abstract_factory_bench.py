@@ -0,0 +1,60 @@
+"""Benchmark dispensing a burst of drink orders one at a time and in batches.
+
+Run from `python/src` with `python -m factory.abstract_factory_bench`.
+"""
+
+import asyncio
+import time
+from typing import List
+
+from factory.abstract_factory import Coffee, CoffeeFactory, HotDrinkMachine
+
+# Time taken to brew, whether one cup or a batch of cups.
+BREW_SECONDS = 0.002
+BURST_SIZES = (10, 100, 1000)
+
+
+class SlowCoffeeFactory(CoffeeFactory):
+    """Factory of coffee where each brew takes a while, however many cups."""
+
+    def prepare(self) -> Coffee:
+        """Brew a cup of coffee."""
+        time.sleep(BREW_SECONDS)
+        return Coffee(50)
+
+    async def prepare_many(self, count: int) -> List[Coffee]:
+        """Brew `count` cups of coffee at once."""
+        await asyncio.sleep(BREW_SECONDS)
+        return [Coffee(50) for _ in range(count)]
+
+
+def _one_at_a_time(machine: HotDrinkMachine, orders: List[str]) -> float:
+    start = time.perf_counter()
+    for order in orders:
+        machine.make_drink(order)
+    # The average order waits for half the burst to be served.
+    return (time.perf_counter() - start) / 2
+
+
+def _batched(machine: HotDrinkMachine, orders: List[str]) -> float:
+    start = time.perf_counter()
+    drinks = asyncio.run(machine.make_drinks(orders))
+    assert len(drinks) == len(orders)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Print the average latency of an order in a burst."""
+    machine = HotDrinkMachine()
+    machine.register_factory("coffee", SlowCoffeeFactory())
+
+    print(f"{'burst':>6}  {'one at a time (ms)':>18}  {'batched (ms)':>12}")
+    for burst_size in BURST_SIZES:
+        orders = ["coffee"] * burst_size
+        sequential = _one_at_a_time(machine, orders)
+        batched = _batched(machine, orders)
+        print(f"{burst_size:6}  {sequential * 1000:18.2f}  {batched * 1000:12.2f}")
+
+
+if __name__ == "__main__":
+    main()
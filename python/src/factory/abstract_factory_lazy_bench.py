@@ -0,0 +1,80 @@
+"""Benchmark machine startup with eagerly and lazily registered factories.
+
+Run from `python/src` with `python -m factory.abstract_factory_lazy_bench`.
+"""
+
+import importlib
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from factory.abstract_factory import HotDrinkMachine
+
+DRINK_TYPES = 500
+
+# Each drink type's module, with some set-up to do on import as real ones would.
+DRINK_MODULE = """
+from factory.abstract_factory import HotDrink, HotDrinkFactory
+
+RECIPE = {{step: step * step for step in range(2_000)}}
+
+class Drink{n}(HotDrink):
+    pass
+
+class Drink{n}Factory(HotDrinkFactory):
+    def prepare(self) -> Drink{n}:
+        return Drink{n}(len(RECIPE))
+"""
+
+
+def _write_modules(directory: Path, package: str) -> None:
+    (directory / package).mkdir()
+    (directory / package / "__init__.py").write_text("")
+    for n in range(DRINK_TYPES):
+        module = directory / package / f"drink{n}.py"
+        module.write_text(DRINK_MODULE.format(n=n))
+
+
+def _eager(package: str) -> float:
+    start = time.perf_counter()
+    machine = HotDrinkMachine()
+    for n in range(DRINK_TYPES):
+        module = importlib.import_module(f"{package}.drink{n}")
+        machine.register_factory(f"drink{n}", getattr(module, f"Drink{n}Factory")())
+    elapsed = time.perf_counter() - start
+    assert machine.make_drink("drink0") is not None
+    return elapsed
+
+
+def _lazy(package: str) -> float:
+    start = time.perf_counter()
+    machine = HotDrinkMachine()
+    for n in range(DRINK_TYPES):
+        reference = f"{package}.drink{n}:Drink{n}Factory"
+        machine.register_lazy_factory(f"drink{n}", reference)
+    elapsed = time.perf_counter() - start
+    assert machine.make_drink("drink0") is not None
+    return elapsed
+
+
+def main() -> None:
+    """Print the startup time of a machine registering many drink types."""
+    with tempfile.TemporaryDirectory() as directory:
+        # Separate packages, so that neither run finds the modules already imported.
+        _write_modules(Path(directory), "eager_drinks")
+        _write_modules(Path(directory), "lazy_drinks")
+        sys.path.insert(0, directory)
+
+        print(f"{'registration':>12}  {'startup (ms)':>12}")
+        print(f"{'eager':>12}  {_eager('eager_drinks') * 1000:12.2f}")
+        print(f"{'lazy':>12}  {_lazy('lazy_drinks') * 1000:12.2f}")
+
+        start = time.perf_counter()
+        HotDrinkMachine().discover_factories()
+        discovery = time.perf_counter() - start
+        print(f"{'entry points':>12}  {discovery * 1000:12.2f}")
+
+
+if __name__ == "__main__":
+    main()
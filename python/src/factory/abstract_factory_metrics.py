@@ -0,0 +1,128 @@
+"""Abstract Factory example: metrics of a hot drink machine.
+
+Set a `DrinkMetrics` as a `HotDrinkMachine`'s `metrics` to record, per drink, how many
+drinks were prepared and a histogram of how long their preparation took, as well as
+requests for drinks with no registered factory. Without metrics, the machine only
+checks that `metrics` is `None`.
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, Final, List, Sequence, Tuple
+
+# Upper bounds, in seconds, of the buckets of the latency histograms.
+DEFAULT_BUCKETS: Final[Tuple[float, ...]] = (
+    0.000_001,
+    0.000_005,
+    0.000_01,
+    0.000_05,
+    0.000_1,
+    0.000_5,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+)
+
+# Names of the metrics in the Prometheus format.
+_PREPARE: Final[str] = "hot_drink_prepare_seconds"
+_UNKNOWN: Final[str] = "hot_drink_unknown_total"
+
+
+class _Histogram:
+    """Latency histogram of the preparations of one drink."""
+
+    __slots__ = ("counts", "total_seconds")
+
+    def __init__(self, bucket_count: int) -> None:
+        # Non-cumulative counts; the last bucket is for latencies above all bounds.
+        self.counts = [0] * (bucket_count + 1)
+        self.total_seconds = 0.0
+
+    def cumulative_counts(self) -> List[int]:
+        counts, total = [], 0
+        for count in self.counts:
+            total += count
+            counts.append(total)
+        return counts
+
+
+class DrinkMetrics:
+    """Preparation counts and latencies per drink, and unknown drink requests."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Create metrics with histogram buckets bounded by `buckets`, in seconds."""
+        self.buckets = tuple(sorted(buckets))
+        self._histograms: Dict[str, _Histogram] = {}
+        self._unknown: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, drink_name: str, seconds: float, count: int = 1) -> None:
+        """Record that `count` drinks were prepared in `seconds`, taken together."""
+        bucket = bisect_left(self.buckets, seconds / count)
+        with self._lock:
+            histogram = self._histograms.get(drink_name)
+            if histogram is None:
+                histogram = self._histograms[drink_name] = _Histogram(len(self.buckets))
+            histogram.counts[bucket] += count
+            histogram.total_seconds += seconds
+
+    def record_unknown(self, drink_name: str, count: int = 1) -> None:
+        """Record requests for a drink with no registered factory."""
+        with self._lock:
+            self._unknown[drink_name] = self._unknown.get(drink_name, 0) + count
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the metrics as a dict.
+
+        Bucket counts are cumulative, keyed by upper bound, as in Prometheus.
+        """
+        with self._lock:
+            histograms = {
+                drink_name: (histogram.cumulative_counts(), histogram.total_seconds)
+                for drink_name, histogram in self._histograms.items()
+            }
+            unknown = dict(self._unknown)
+
+        bounds = self.buckets + (float("inf"),)
+        return {
+            "prepared": {
+                drink_name: {
+                    "count": counts[-1],
+                    "sum_seconds": total_seconds,
+                    "buckets": dict(zip(bounds, counts)),
+                }
+                for drink_name, (counts, total_seconds) in histograms.items()
+            },
+            "unknown": unknown,
+        }
+
+    def to_prometheus(self) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {_PREPARE} Time taken to prepare a hot drink.",
+            f"# TYPE {_PREPARE} histogram",
+        ]
+        for drink_name, prepared in snapshot["prepared"].items():
+            label = f'drink="{_escape(drink_name)}"'
+            for bound, count in prepared["buckets"].items():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{_PREPARE}_bucket{{{label},le="{le}"}} {count}')
+            lines.append(f"{_PREPARE}_sum{{{label}}} {prepared['sum_seconds']!r}")
+            lines.append(f"{_PREPARE}_count{{{label}}} {prepared['count']}")
+
+        lines += [
+            f"# HELP {_UNKNOWN} Requests for drinks with no registered factory.",
+            f"# TYPE {_UNKNOWN} counter",
+        ]
+        for drink_name, count in snapshot["unknown"].items():
+            lines.append(f'{_UNKNOWN}{{drink="{_escape(drink_name)}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+def _escape(label_value: str) -> str:
+    return label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,43 @@
+"""Benchmark making drinks with and without metrics.
+
+Run from `python/src` with `python -m factory.abstract_factory_metrics_bench`.
+"""
+
+import time
+
+from factory.abstract_factory import HotDrinkMachine, TeaFactory
+from factory.abstract_factory_metrics import DrinkMetrics
+
+DRINKS = 1_000_000
+
+
+def _nanoseconds_per_drink(machine: HotDrinkMachine, drink_name: str) -> float:
+    make_drink = machine.make_drink
+    start = time.perf_counter()
+    for _ in range(DRINKS):
+        make_drink(drink_name)
+    return (time.perf_counter() - start) / DRINKS * 1e9
+
+
+def main() -> None:
+    """Print the time taken to make a drink, with and without metrics."""
+    machine = HotDrinkMachine()
+    machine.register_factory("tea", TeaFactory())
+
+    factory = TeaFactory()
+    start = time.perf_counter()
+    for _ in range(DRINKS):
+        factory.prepare()
+    prepare_only = (time.perf_counter() - start) / DRINKS * 1e9
+
+    print(f"{'':>24}  {'ns/drink':>8}")
+    print(f"{'prepare() alone':>24}  {prepare_only:8.1f}")
+    print(f"{'no metrics':>24}  {_nanoseconds_per_drink(machine, 'tea'):8.1f}")
+    print(f"{'no metrics, unknown':>24}  {_nanoseconds_per_drink(machine, 'x'):8.1f}")
+    machine.metrics = DrinkMetrics()
+    print(f"{'metrics':>24}  {_nanoseconds_per_drink(machine, 'tea'):8.1f}")
+    print(f"{'metrics, unknown':>24}  {_nanoseconds_per_drink(machine, 'x'):8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Demonstrate recording metrics of a hot drink machine."""
+
+import asyncio
+
+from factory.abstract_factory import CoffeeFactory, HotDrinkMachine, TeaFactory
+from factory.abstract_factory_metrics import DrinkMetrics
+from factory.abstract_factory_pool import PooledHotDrinkMachine
+
+
+def test_metrics_snapshot() -> None:
+    """Record preparation counts and latencies, and unknown drink requests."""
+    machine = HotDrinkMachine()
+    machine.register_factory("tea", TeaFactory())
+    machine.register_factory("coffee", CoffeeFactory())
+    machine.metrics = DrinkMetrics(buckets=(1.0,))
+
+    machine.make_drink("tea")
+    machine.make_drink("tea")
+    machine.make_drink("water")
+    asyncio.run(machine.make_drinks(["coffee", "water", "coffee"]))
+
+    snapshot = machine.metrics.snapshot()
+    assert snapshot["unknown"] == {"water": 2}
+    assert snapshot["prepared"]["tea"]["count"] == 2
+    assert snapshot["prepared"]["tea"]["buckets"] == {1.0: 2, float("inf"): 2}
+    assert snapshot["prepared"]["coffee"]["count"] == 2
+    assert snapshot["prepared"]["coffee"]["sum_seconds"] >= 0.0
+
+
+def test_metrics_disabled() -> None:
+    """Record nothing until metrics are set."""
+    machine = PooledHotDrinkMachine()
+    machine.register_factory("tea", TeaFactory())
+    metrics = DrinkMetrics()
+
+    machine.make_drink("tea")
+    machine.metrics = metrics
+    machine.make_drink("tea")
+    machine.make_drink("water")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["prepared"]["tea"]["count"] == 1
+    assert snapshot["unknown"] == {"water": 1}
+
+
+def test_metrics_prometheus() -> None:
+    """Export the metrics in the Prometheus text format."""
+    metrics = DrinkMetrics(buckets=(0.001, 0.01))
+    metrics.record("tea", 0.002)
+    metrics.record("tea", 0.02)
+    metrics.record_unknown('"water"')
+
+    assert metrics.to_prometheus().splitlines() == [
+        "# HELP hot_drink_prepare_seconds Time taken to prepare a hot drink.",
+        "# TYPE hot_drink_prepare_seconds histogram",
+        'hot_drink_prepare_seconds_bucket{drink="tea",le="0.001"} 0',
+        'hot_drink_prepare_seconds_bucket{drink="tea",le="0.01"} 1',
+        'hot_drink_prepare_seconds_bucket{drink="tea",le="+Inf"} 2',
+        'hot_drink_prepare_seconds_sum{drink="tea"} 0.022',
+        'hot_drink_prepare_seconds_count{drink="tea"} 2',
+        "# HELP hot_drink_unknown_total"
+        " Requests for drinks with no registered factory.",
+        "# TYPE hot_drink_unknown_total counter",
+        'hot_drink_unknown_total{drink="\\"water\\""} 1',
+    ]
@@ -0,0 +1,157 @@
+"""Abstract Factory example: a hot drink machine dispensing from pre-warmed pools.
+
+`HotDrinkMachine` prepares a new drink for every request, and its factories must not
+be registered while other threads are making drinks. `PooledHotDrinkMachine` keeps a
+pool of prepared drinks per factory, to which drinks return once consumed, and
+registers factories copy-on-write, so that making drinks never takes a lock.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from factory.abstract_factory import (
+    HotDrink,
+    HotDrinkFactory,
+    HotDrinkMachine,
+    prepare_many,
+)
+
+
+class DrinkPool:
+    """Pool of drinks prepared by a factory, reused once consumed.
+
+    Safe to use from many threads: `deque.append` and `deque.pop` are atomic.
+    """
+
+    def __init__(self, factory: HotDrinkFactory, size: int = 0) -> None:
+        """Create a pool of drinks from `factory`, pre-warmed with `size` drinks."""
+        self._factory = factory
+        self._idle: Deque[HotDrink] = deque()
+        self._volume: Optional[int] = None
+        for _ in range(size):
+            self.release(self._prepare())
+
+    def _prepare(self) -> HotDrink:
+        return self._adopt(self._factory.prepare())
+
+    def _adopt(self, drink: HotDrink) -> HotDrink:
+        if self._volume is None:
+            self._volume = drink.amount()
+        drink.refill(self._volume, self)
+        return drink
+
+    def acquire(self) -> HotDrink:
+        """Return an idle drink, refilled, or a newly prepared one if none is idle."""
+        try:
+            drink = self._idle.pop()
+        except IndexError:
+            return self._prepare()
+
+        drink.refill(self._volume, self)
+        return drink
+
+    async def acquire_many(self, count: int) -> List[HotDrink]:
+        """Return `count` drinks: idle ones, refilled, then newly prepared ones.
+
+        The drinks missing from the pool are prepared together; see `prepare_many`.
+        """
+        drinks: List[HotDrink] = []
+        idle = self._idle
+        while len(drinks) < count:
+            try:
+                drink = idle.pop()
+            except IndexError:
+                break
+            drink.refill(self._volume, self)
+            drinks.append(drink)
+
+        if len(drinks) < count:
+            prepared = await prepare_many(self._factory, count - len(drinks))
+            drinks.extend(self._adopt(drink) for drink in prepared)
+        return drinks
+
+    def release(self, drink: HotDrink) -> None:
+        """Return `drink` to the pool.
+
+        Called by `HotDrink.consume`, once per acquisition of the drink.
+        """
+        self._idle.append(drink)
+
+    def __len__(self) -> int:
+        """Number of idle drinks."""
+        return len(self._idle)
+
+
+class PooledHotDrinkMachine(HotDrinkMachine):
+    """Hot drink dispensing machine, safe to use from many threads."""
+
+    def __init__(self, pool_size: int = 0) -> None:
+        """Create a machine pre-warming each factory's pool with `pool_size` drinks."""
+        super().__init__()
+        self._pool_size = pool_size
+        self._pools: Dict[str, DrinkPool] = {}
+        self._register_lock = threading.Lock()
+
+    def register_factory(self, drink_name: str, drink_factory: HotDrinkFactory) -> None:
+        """Register a hot drink factory, and pre-warm its pool."""
+        pool = DrinkPool(drink_factory, self._pool_size)
+        with self._register_lock:
+            # Replace rather than mutate the dicts, so that concurrent lookups see
+            # either the old or the new registrations, never a dict being resized.
+            factories = dict(self._factories)
+            factories[drink_name] = drink_factory
+            pools = dict(self._pools)
+            pools[drink_name] = pool
+            self._factories, self._pools = factories, pools
+            self._lazy_factories.pop(drink_name, None)
+
+    def register_lazy_factory(self, drink_name: str, reference: str) -> None:
+        """Register a hot drink factory to be imported when first needed.
+
+        Its pool is pre-warmed on the first request for `drink_name`.
+        """
+        with self._register_lock:
+            # Register the reference first, so that a concurrent lookup always finds
+            # the drink.
+            self._lazy_factories[drink_name] = reference
+            factories = dict(self._factories)
+            factories.pop(drink_name, None)
+            pools = dict(self._pools)
+            pools.pop(drink_name, None)
+            self._factories, self._pools = factories, pools
+
+    def make_drink(self, drink_name: str) -> Optional[HotDrink]:
+        """Return a hot drink, or `None` if its factory has not been registered.
+
+        The drink returns to its pool when consumed. The latency recorded in `metrics`
+        is that of acquiring the drink from its pool.
+        """
+        pool = self._pools.get(drink_name)
+        if pool is None and drink_name in self._lazy_factories:
+            self._factory(drink_name)
+            pool = self._pools.get(drink_name)
+        metrics = self.metrics
+        if metrics is None:
+            return pool.acquire() if pool is not None else None
+
+        if pool is None:
+            metrics.record_unknown(drink_name)
+            return None
+        start = time.perf_counter()
+        drink = pool.acquire()
+        metrics.record(drink_name, time.perf_counter() - start)
+        return drink
+
+    async def _make_many(
+        self, drink_name: str, count: int
+    ) -> Optional[List[HotDrink]]:
+        """Return `count` drinks from the pool, or `None` if it has no factory."""
+        pool = self._pools.get(drink_name)
+        if pool is None and drink_name in self._lazy_factories:
+            self._factory(drink_name)
+            pool = self._pools.get(drink_name)
+        if pool is None:
+            return None
+        return await pool.acquire_many(count)
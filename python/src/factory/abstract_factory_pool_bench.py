@@ -0,0 +1,57 @@
+"""Benchmark multi-threaded drink dispensing with and without pools.
+
+Run from `python/src` with `python -m factory.abstract_factory_pool_bench`.
+"""
+
+import threading
+import time
+
+from factory.abstract_factory import HotDrinkMachine, Tea, TeaFactory
+from factory.abstract_factory_pool import PooledHotDrinkMachine
+
+DRINKS_PER_THREAD = 50_000
+
+
+class BrewedTeaFactory(TeaFactory):
+    """Factory of tea that takes a while to set up."""
+
+    def prepare(self) -> Tea:
+        """Brew a `Tea` hot drink."""
+        sum(range(200))
+        return Tea(200)
+
+
+def _throughput(machine: HotDrinkMachine, threads: int) -> float:
+    def dispense() -> None:
+        for _ in range(DRINKS_PER_THREAD):
+            drink = machine.make_drink("tea")
+            assert drink is not None
+            drink.consume()
+
+    workers = [threading.Thread(target=dispense) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return threads * DRINKS_PER_THREAD / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Report drinks per second for various numbers of threads."""
+    for factory_type in [TeaFactory, BrewedTeaFactory]:
+        print(factory_type.__name__)
+        print(f"  {'threads':>8}{'plain (drinks/s)':>20}{'pooled (drinks/s)':>20}")
+        for threads in [1, 2, 4, 8]:
+            plain = HotDrinkMachine()
+            plain.register_factory("tea", factory_type())
+            pooled = PooledHotDrinkMachine(pool_size=threads)
+            pooled.register_factory("tea", factory_type())
+            print(
+                f"  {threads:>8}{_throughput(plain, threads):>20,.0f}"
+                f"{_throughput(pooled, threads):>20,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Demonstrate a hot drink machine dispensing from pre-warmed pools."""
+
+import asyncio
+import threading
+from typing import List
+
+from factory.abstract_factory import CoffeeFactory, HotDrink, TeaFactory
+from factory.abstract_factory_pool import DrinkPool, PooledHotDrinkMachine
+
+
+def test_pooled_machine() -> None:
+    """Make drinks that return to their pools once consumed."""
+    machine = PooledHotDrinkMachine(pool_size=2)
+    machine.register_factory("tea", TeaFactory())
+    assert machine.make_drink("coffee") is None
+
+    tea = machine.make_drink("tea")
+    assert tea is not None and tea.amount() == 200
+    tea.consume()
+    assert tea.amount() == 0
+
+    again = machine.make_drink("tea")
+    assert again is tea and again.amount() == 200
+
+
+def test_pooled_machine_batch() -> None:
+    """Make batches of drinks from the pools, preparing those missing together."""
+    machine = PooledHotDrinkMachine(pool_size=2)
+    machine.register_factory("tea", TeaFactory())
+    pooled = [machine.make_drink("tea"), machine.make_drink("tea")]
+    for tea in pooled:
+        assert tea is not None
+        tea.consume()
+
+    drinks = asyncio.run(machine.make_drinks(["tea", "water", "tea", "tea"]))
+    assert drinks[1] is None
+    teas = [tea for tea in drinks if tea is not None]
+    assert len(teas) == 3 and all(tea.amount() == 200 for tea in teas)
+    assert {id(tea) for tea in pooled} < {id(tea) for tea in teas}
+
+    for tea in teas:
+        tea.consume()
+    again = asyncio.run(machine.make_drinks(["tea"] * 3))
+    assert {id(tea) for tea in again} == {id(tea) for tea in teas}
+
+
+def test_pool_consumed_twice() -> None:
+    """Verify that consuming a drink twice returns it to its pool once."""
+    pool = DrinkPool(CoffeeFactory())
+    coffee = pool.acquire()
+    coffee.consume()
+    coffee.consume()
+    assert len(pool) == 1
+
+
+def test_pool_consumed_concurrently() -> None:
+    """Verify that consuming a drink from many threads returns it to its pool once."""
+    pool = DrinkPool(CoffeeFactory())
+    for _ in range(100):
+        coffee = pool.acquire()
+        barrier = threading.Barrier(4)
+
+        def consume(drink: HotDrink = coffee) -> None:
+            barrier.wait()
+            drink.consume()
+
+        threads = [threading.Thread(target=consume) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(pool) == 1
+        assert pool.acquire() is coffee and coffee.amount() == 50
+
+
+def test_pooled_machine_threads() -> None:
+    """Make drinks from many threads while factories are being registered."""
+    machine = PooledHotDrinkMachine(pool_size=4)
+    machine.register_factory("tea", TeaFactory())
+    drinks: List[HotDrink] = []
+
+    def drink() -> None:
+        for _ in range(1000):
+            tea = machine.make_drink("tea")
+            assert tea is not None and tea.amount() == 200
+            drinks.append(tea)
+            tea.consume()
+
+    threads = [threading.Thread(target=drink) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for index in range(100):
+        machine.register_factory(f"coffee {index}", CoffeeFactory())
+    for thread in threads:
+        thread.join()
+
+    assert len(drinks) == 4000
+    assert len({id(tea) for tea in drinks}) <= 8
+    assert machine.make_drink("coffee 99") is not None
+
+
+def test_pooled_machine_lazy() -> None:
+    """Pre-warm the pool of a lazily registered factory on its first request."""
+    machine = PooledHotDrinkMachine(pool_size=2)
+    machine.register_factory("tea", CoffeeFactory())
+    machine.register_lazy_factory("tea", "factory.abstract_factory:TeaFactory")
+
+    tea = machine.make_drink("tea")
+    assert tea is not None and tea.amount() == 200
+    tea.consume()
+    assert machine.make_drink("tea") is tea
@@ -1,6 +1,49 @@
 """Demonstrate using the Abstract Factory design pattern."""
 
-from factory.abstract_factory import CoffeeFactory, HotDrinkMachine, TeaFactory
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from factory.abstract_factory import (
+    Coffee,
+    CoffeeFactory,
+    HotDrinkMachine,
+    Tea,
+    TeaFactory,
+)
+from factory.abstract_factory_metrics import DrinkMetrics
+
+CHAI_MODULE = """
+from factory.abstract_factory import Tea, TeaFactory
+
+class ChaiFactory(TeaFactory):
+    def prepare(self) -> Tea:
+        return Tea(250)
+"""
+
+
+@pytest.fixture(name="chai_path")
+def fixture_chai_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Provide a directory on `sys.path` with a `chai` module, not yet imported."""
+    (tmp_path / "chai.py").write_text(CHAI_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "chai", raising=False)
+    return tmp_path
+
+
+class BatchCoffeeFactory(CoffeeFactory):
+    """Factory of coffee able to prepare several cups at once."""
+
+    def __init__(self) -> None:
+        self.batches: List[int] = []
+
+    async def prepare_many(self, count: int) -> List[Coffee]:
+        """Prepare `count` cups of coffee at once."""
+        self.batches.append(count)
+        return [Coffee(50 + i) for i in range(count)]
 
 
 def test_abstract_factory() -> None:
@@ -18,3 +61,116 @@ def test_abstract_factory() -> None:
     assert not coffee is None and coffee.amount() == 50
     coffee.consume()
     assert coffee.amount() == 0
+
+
+def test_abstract_factory_batch() -> None:
+    """Create batches of hot drinks, in the order requested."""
+    machine = HotDrinkMachine()
+    coffee_factory = BatchCoffeeFactory()
+    machine.register_factory("coffee", coffee_factory)
+    machine.register_factory("tea", TeaFactory())
+
+    drinks = asyncio.run(
+        machine.make_drinks(["tea", "coffee", "water", "coffee", "tea", "coffee"])
+    )
+    assert [type(drink) for drink in drinks] == [
+        Tea,
+        Coffee,
+        type(None),
+        Coffee,
+        Tea,
+        Coffee,
+    ]
+    assert [drink.amount() for drink in drinks if isinstance(drink, Coffee)] == [
+        50,
+        51,
+        52,
+    ]
+    assert coffee_factory.batches == [3]
+    assert asyncio.run(machine.make_drinks([])) == []
+
+
+class ShortCoffeeFactory(CoffeeFactory):
+    """Factory of coffee preparing one cup fewer than asked for."""
+
+    def prepare_many(self, count: int) -> List[Coffee]:
+        """Prepare `count - 1` cups of coffee."""
+        return [Coffee(50) for _ in range(count - 1)]
+
+
+def test_abstract_factory_batch_short() -> None:
+    """Verify that a factory preparing too few drinks is an error."""
+    machine = HotDrinkMachine()
+    machine.register_factory("coffee", ShortCoffeeFactory())
+    with pytest.raises(ValueError, match="2 coffee drinks made, 3 requested"):
+        asyncio.run(machine.make_drinks(["coffee"] * 3))
+
+
+def test_abstract_factory_batch_short_metrics() -> None:
+    """Verify that a batch with too few drinks is not recorded as prepared."""
+    machine = HotDrinkMachine()
+    machine.register_factory("coffee", ShortCoffeeFactory())
+    machine.metrics = DrinkMetrics()
+    with pytest.raises(ValueError):
+        asyncio.run(machine.make_drinks(["coffee"] * 3))
+    assert machine.metrics.snapshot()["prepared"] == {}
+
+
+def test_abstract_factory_lazy(chai_path: Path) -> None:
+    """Import a hot drink factory only when its drink is first requested."""
+    _ = chai_path
+    machine = HotDrinkMachine()
+    machine.register_lazy_factory("chai", "chai:ChaiFactory")
+    machine.register_lazy_factory("tea", "factory.abstract_factory.TeaFactory")
+    machine.register_lazy_factory("water", "chai:WaterFactory")
+    assert "chai" not in sys.modules
+
+    chai = machine.make_drink("chai")
+    assert "chai" in sys.modules
+    assert isinstance(chai, Tea) and chai.amount() == 250
+    assert machine.make_drink("chai") is not chai
+
+    tea = machine.make_drink("tea")
+    assert tea is not None and tea.amount() == 200
+
+    with pytest.raises(AttributeError):
+        machine.make_drink("water")
+
+
+def test_abstract_factory_lazy_registration_order() -> None:
+    """Verify that a drink is always registered while its lazy factory is replaced."""
+    machine = HotDrinkMachine()
+    machine.register_lazy_factory("tea", "factory.abstract_factory.TeaFactory")
+    found: List[bool] = []
+
+    def registered() -> bool:
+        return "tea" in machine._factories or "tea" in machine._lazy_factories
+
+    class CheckedDict(Dict[str, Any]):
+        def pop(self, *args: Any) -> Any:
+            value = super().pop(*args)
+            found.append(registered())
+            return value
+
+    machine._factories = CheckedDict(machine._factories)
+    machine._lazy_factories = CheckedDict(machine._lazy_factories)
+    machine.register_factory("tea", TeaFactory())
+    machine.register_lazy_factory("tea", "factory.abstract_factory.TeaFactory")
+    assert found == [True, True]
+
+
+def test_abstract_factory_entry_points(chai_path: Path) -> None:
+    """Discover hot drink factories advertised by installed packages."""
+    dist_info = chai_path / "chai-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Name: chai\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text(
+        "[hot_drink_factories]\nchai = chai:ChaiFactory\n"
+    )
+
+    machine = HotDrinkMachine()
+    assert machine.discover_factories() == ["chai"]
+    assert "chai" not in sys.modules
+
+    chai = machine.make_drink("chai")
+    assert chai is not None and chai.amount() == 250
@@ -6,6 +6,12 @@ existence.
 """
 
 from math import cos, isclose, sin
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from factory.point_array import PointArray
 
 
 class Point:
@@ -62,3 +68,19 @@ class PointFactory:
         Does not need to be a static method.
         """
         return Point(rho * cos(theta), rho * sin(theta))
+
+    def new_cartesian_points(self, pairs: "npt.ArrayLike") -> "PointArray":
+        """Create an array of points from (x, y) pairs. Requires NumPy."""
+        # Imported here, so that NumPy is only needed for batches of points.
+        from factory.point_array import PointArray
+
+        return PointArray.from_cartesian(pairs, Point)
+
+    def new_polar_points(self, pairs: "npt.ArrayLike") -> "PointArray":
+        """Create an array of points from (rho, theta) pairs. Requires NumPy.
+
+        `theta` is in radians.
+        """
+        from factory.point_array import PointArray
+
+        return PointArray.from_polar(pairs, Point)
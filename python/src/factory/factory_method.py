@@ -1,6 +1,12 @@
 """Factory Method pattern example."""
 
 from math import cos, isclose, sin
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from factory.point_array import PointArray
 
 
 class Point:
@@ -46,6 +52,24 @@ class Point:
         """
         return Point(rho * cos(theta), rho * sin(theta))
 
+    @staticmethod
+    def new_cartesian_points(pairs: "npt.ArrayLike") -> "PointArray":
+        """Create an array of points from (x, y) pairs. Requires NumPy."""
+        # Imported here, so that NumPy is only needed for batches of points.
+        from factory.point_array import PointArray
+
+        return PointArray.from_cartesian(pairs, Point)
+
+    @staticmethod
+    def new_polar_points(pairs: "npt.ArrayLike") -> "PointArray":
+        """Create an array of points from (rho, theta) pairs. Requires NumPy.
+
+        `theta` is in radians.
+        """
+        from factory.point_array import PointArray
+
+        return PointArray.from_polar(pairs, Point)
+
     def __eq__(self, other: object) -> bool:
         """Two `Point` objects are equal if their coordinates are equal."""
         if not isinstance(other, Point):
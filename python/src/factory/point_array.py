@@ -0,0 +1,128 @@
+"""Compact arrays of points, created in batches by the point factories.
+
+Creating a `Point` per sample is slow and takes a lot of memory when converting tens of
+millions of samples. A `PointArray` keeps the coordinates of all its points in one NumPy
+array, and computes them for the whole batch at once. Indexing it returns a lightweight
+`PointView` onto the array rather than a copy.
+
+Requires NumPy.
+"""
+
+from math import isclose
+from typing import Any, Callable, Iterator, List, Union, overload
+
+import numpy as np
+import numpy.typing as npt
+
+from factory.factory import Point
+
+# Type of the points of a `PointArray`, e.g., `factory.Point`; called with x and y.
+PointType = Callable[[float, float], Any]
+
+
+class PointView:
+    """A point in a `PointArray`, comparable with `Point`s."""
+
+    __slots__ = ("_xy", "_index")
+
+    def __init__(self, xy: np.ndarray, index: int) -> None:
+        self._xy = xy
+        self._index = index
+
+    @property
+    def x(self) -> float:
+        """The x coordinate."""
+        return float(self._xy[self._index, 0])
+
+    @property
+    def y(self) -> float:
+        """The y coordinate."""
+        return float(self._xy[self._index, 1])
+
+    def __eq__(self, other: object) -> bool:
+        """A view is equal to any point with equal coordinates."""
+        x = getattr(other, "x", None)
+        y = getattr(other, "y", None)
+        if x is None or y is None:
+            return NotImplemented
+
+        return isclose(self.x, x) and isclose(self.y, y)
+
+    def __repr__(self) -> str:
+        return f"PointView(x={self.x!r}, y={self.y!r})"
+
+
+class PointArray:
+    """An array of points, with their coordinates stored as an (n, 2) float array."""
+
+    def __init__(self, xy: npt.ArrayLike, point_type: PointType = Point) -> None:
+        """Create an array of points from their (x, y) coordinates.
+
+        `point_type` makes the points returned by `to_points`, from their coordinates;
+        it is that of the factory creating the array.
+        """
+        self.xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        self.point_type = point_type
+
+    @staticmethod
+    def from_cartesian(
+        pairs: npt.ArrayLike, point_type: PointType = Point
+    ) -> "PointArray":
+        """Create an array of points from (x, y) pairs."""
+        return PointArray(pairs, point_type)
+
+    @staticmethod
+    def from_polar(pairs: npt.ArrayLike, point_type: PointType = Point) -> "PointArray":
+        """Create an array of points from (rho, theta) pairs; theta is in radians."""
+        rho_theta = np.asarray(pairs, dtype=np.float64).reshape(-1, 2)
+        rho, theta = rho_theta[:, 0], rho_theta[:, 1]
+        xy = np.empty_like(rho_theta)
+        np.multiply(rho, np.cos(theta), out=xy[:, 0])
+        np.multiply(rho, np.sin(theta), out=xy[:, 1])
+        return PointArray(xy, point_type)
+
+    @property
+    def x(self) -> np.ndarray:
+        """The x coordinates, as a view onto the array."""
+        return self.xy[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """The y coordinates, as a view onto the array."""
+        return self.xy[:, 1]
+
+    def __len__(self) -> int:
+        return len(self.xy)
+
+    @overload
+    def __getitem__(self, index: int) -> PointView:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PointArray":
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[PointView, "PointArray"]:
+        if isinstance(index, slice):
+            return PointArray(self.xy[index], self.point_type)
+
+        if index < 0:
+            index += len(self.xy)
+        if not 0 <= index < len(self.xy):
+            raise IndexError("PointArray index out of range")
+        return PointView(self.xy, index)
+
+    def __iter__(self) -> Iterator[PointView]:
+        return (PointView(self.xy, index) for index in range(len(self.xy)))
+
+    def to_points(self) -> List[Any]:
+        """Return the points as a list of objects of `point_type`."""
+        point_type = self.point_type
+        return [point_type(x, y) for x, y in self.xy.tolist()]
+
+    def __eq__(self, other: Any) -> bool:
+        """Two arrays are equal if their coordinates are close."""
+        if not isinstance(other, PointArray):
+            return NotImplemented
+
+        return self.xy.shape == other.xy.shape and bool(np.allclose(self.xy, other.xy))
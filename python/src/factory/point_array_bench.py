@@ -0,0 +1,39 @@
+"""Benchmark creating points from polar coordinates one at a time and in batches.
+
+Run from `python/src` with `python -m factory.point_array_bench`. Requires NumPy.
+"""
+
+import time
+
+import numpy as np
+
+from factory.factory import PointFactory
+
+SAMPLES = 1_000_000
+
+
+def main() -> None:
+    """Time converting `SAMPLES` polar samples to points."""
+    rng = np.random.default_rng(0)
+    samples = np.column_stack(
+        [rng.uniform(0, 10, SAMPLES), rng.uniform(0, 2 * np.pi, SAMPLES)]
+    )
+    pairs = samples.tolist()
+    factory = PointFactory()
+
+    start = time.perf_counter()
+    points = [factory.new_polar_point(rho, theta) for rho, theta in pairs]
+    one_at_a_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    array = factory.new_polar_points(samples)
+    batch = time.perf_counter() - start
+
+    assert points[-1] == array[-1]
+    print(f"{SAMPLES:,} polar samples")
+    print(f"  {'new_polar_point':<20}{one_at_a_time * 1000:>10.1f} ms")
+    print(f"  {'new_polar_points':<20}{batch * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Demonstrate creating batches of points with the point factories."""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from factory import factory_method
+from factory.factory import Point, PointFactory
+from factory.point_array import PointArray, PointView
+
+
+def test_create_polar_points() -> None:
+    """Create an array of points from polar coordinates."""
+    points = PointFactory().new_polar_points([(4, math.pi / 3), (2, 0)])
+    assert len(points) == 2
+    assert points[0] == Point(2, 3.46410161514)
+    assert Point(2, 0) == points[-1]
+    assert points == PointFactory().new_cartesian_points([(2, 3.46410161514), (2, 0)])
+    assert [point.x for point in points] == pytest.approx([2, 2])
+
+    with pytest.raises(IndexError):
+        _ = points[2]
+
+
+def test_create_points_factory_method() -> None:
+    """Create arrays of points with the factory methods of `Point`."""
+    polar = factory_method.Point.new_polar_points(np.array([[4, math.pi / 3]]))
+    cartesian = factory_method.Point.new_cartesian_points([[2, 3.46410161514]])
+    assert polar == cartesian
+    assert polar[0] == factory_method.Point(2, 3.46410161514)
+    assert cartesian.to_points() == [factory_method.Point(2, 3.46410161514)]
+    assert polar[:1].to_points()[0] == factory_method.Point(2, 3.46410161514)
+
+
+def test_point_views() -> None:
+    """Verify that indexing a `PointArray` gives views onto it."""
+    points = PointArray.from_cartesian(np.arange(10.0).reshape(5, 2))
+    view = points[1]
+    assert isinstance(view, PointView)
+    points.xy[1] = (20, 30)
+    assert (view.x, view.y) == (20, 30)
+
+    tail = points[3:]
+    assert len(tail) == 2
+    tail.xy[0, 0] = -1
+    assert points.x[3] == -1
+    assert points.to_points()[3] == Point(-1, 7)
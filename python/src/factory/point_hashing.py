@@ -0,0 +1,109 @@
+"""Hashable points and deduplication of near-equal points.
+
+`Point` compares coordinates with `math.isclose` but defines no `__hash__`, so points
+cannot be put in sets or used as dict keys, and deduplicating them means comparing
+every pair. Here the plane is divided into a grid of square cells of the tolerance's
+size: near-equal points fall in the same or an adjacent cell, so they can be found by
+hashing rather than by comparing all pairs.
+"""
+
+from math import floor
+from typing import Dict, Iterable, List, Protocol, Tuple, TypeVar
+
+# Default size of the grid cells, i.e., the absolute tolerance of coordinates.
+TOLERANCE = 1e-9
+
+
+class HasCoordinates(Protocol):
+    """Anything with x and y coordinates, e.g., `Point` or `SpatialPoint`."""
+
+    x: float
+    y: float
+
+
+P = TypeVar("P", bound=HasCoordinates)
+
+
+def cell_of(x: float, y: float, tolerance: float = TOLERANCE) -> Tuple[int, int]:
+    """Return the grid cell containing (`x`, `y`)."""
+    return floor(x / tolerance), floor(y / tolerance)
+
+
+class SpatialPoint:
+    """An immutable, hashable point on a plane.
+
+    Two `SpatialPoint`s are equal if they fall in the same grid cell. Points closer
+    than the tolerance but on either side of a cell boundary are therefore not equal;
+    use `dedupe` to treat those as duplicates too.
+    """
+
+    __slots__ = ("_x", "_y", "_cell")
+
+    def __init__(self, x: float, y: float) -> None:
+        """Create a point using Cartesian coordinates."""
+        self._x = x
+        self._y = y
+        self._cell = cell_of(x, y)
+
+    @property
+    def x(self) -> float:
+        """The x coordinate."""
+        return self._x
+
+    @property
+    def y(self) -> float:
+        """The y coordinate."""
+        return self._y
+
+    def __eq__(self, other: object) -> bool:
+        """Two `SpatialPoint` objects are equal if they are in the same grid cell."""
+        if not isinstance(other, SpatialPoint):
+            return NotImplemented
+
+        return self._cell == other._cell
+
+    def __hash__(self) -> int:
+        return hash(self._cell)
+
+    def __repr__(self) -> str:
+        return f"SpatialPoint(x={self._x!r}, y={self._y!r})"
+
+
+def dedupe(points: Iterable[P], tolerance: float = TOLERANCE) -> List[P]:
+    """Return `points` without those near-equal to an earlier point, in order.
+
+    Points are near-equal if both their coordinates differ by at most `tolerance`.
+    Each point is only compared with the kept points in its own and the 8 adjacent
+    grid cells, so this takes time linear in the number of points.
+    """
+    grid: Dict[Tuple[int, int], List[P]] = {}
+    kept: List[P] = []
+    for point in points:
+        x, y = point.x, point.y
+        cell_x, cell_y = floor(x / tolerance), floor(y / tolerance)
+        if not _has_near(grid, cell_x, cell_y, x, y, tolerance):
+            cell = grid.get((cell_x, cell_y))
+            if cell is None:
+                grid[cell_x, cell_y] = [point]
+            else:
+                cell.append(point)
+            kept.append(point)
+    return kept
+
+
+def _has_near(
+    grid: Dict[Tuple[int, int], List[P]],
+    cell_x: int,
+    cell_y: int,
+    x: float,
+    y: float,
+    tolerance: float,
+) -> bool:
+    for neighbour_x in (cell_x, cell_x - 1, cell_x + 1):
+        for neighbour_y in (cell_y, cell_y - 1, cell_y + 1):
+            others = grid.get((neighbour_x, neighbour_y))
+            if others is not None:
+                for other in others:
+                    if abs(other.x - x) <= tolerance and abs(other.y - y) <= tolerance:
+                        return True
+    return False
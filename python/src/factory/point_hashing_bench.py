@@ -0,0 +1,58 @@
+"""Benchmark deduplicating near-equal points by hashing against pairwise comparison.
+
+Run from `python/src` with `python -m factory.point_hashing_bench`.
+"""
+
+import random
+import time
+from typing import List
+
+from factory.factory import Point
+from factory.point_hashing import dedupe
+
+
+def pairwise_dedupe(points: List[Point]) -> List[Point]:
+    """Deduplicate by comparing each point with all kept points."""
+    kept: List[Point] = []
+    for point in points:
+        if not any(point == other for other in kept):
+            kept.append(point)
+    return kept
+
+
+def sample(count: int) -> List[Point]:
+    """Return `count` points, half of them near-duplicates of the others."""
+    rng = random.Random(0)
+    unique = [
+        Point(rng.uniform(1, 1e3), rng.uniform(1, 1e3)) for _ in range(count // 2)
+    ]
+    near = [Point(point.x + 1e-10, point.y) for point in unique]
+    points = unique + near
+    rng.shuffle(points)
+    return points
+
+
+def main() -> None:
+    """Time both ways of deduplicating increasingly many points."""
+    print(f"{'points':>10}{'pairwise (ms)':>16}{'dedupe (ms)':>14}")
+    for count in [1_000, 4_000, 8_000, 1_000_000]:
+        points = sample(count)
+
+        pairwise = float("nan")
+        if count <= 8_000:
+            start = time.perf_counter()
+            expected = pairwise_dedupe(points)
+            pairwise = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = dedupe(points)
+        hashed = time.perf_counter() - start
+
+        assert len(result) == count // 2
+        if count <= 8_000:
+            assert result == expected
+        print(f"{count:>10,}{pairwise * 1000:>16.1f}{hashed * 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
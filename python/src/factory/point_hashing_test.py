@@ -0,0 +1,36 @@
+"""Demonstrate hashing and deduplicating near-equal points."""
+
+from factory.factory import Point
+from factory.point_hashing import SpatialPoint, cell_of, dedupe
+
+
+def test_spatial_point_hashable() -> None:
+    """Put near-equal `SpatialPoint`s in a set."""
+    # Coordinates in the middle of a grid cell.
+    x, y = 0.30000000015, 0.70000000015
+    points = {SpatialPoint(x, y), SpatialPoint(x + 1e-12, y), SpatialPoint(1, 1)}
+    assert len(points) == 2
+    assert SpatialPoint(1, 1) in points
+    assert {SpatialPoint(x, y): "a"}[SpatialPoint(x, y - 1e-12)] == "a"
+
+
+def test_dedupe() -> None:
+    """Deduplicate near-equal points, including across grid cell boundaries."""
+    points = [
+        Point(1.0, 2.0),
+        Point(3.0, 4.0),
+        Point(1.0 + 1e-12, 2.0),
+        # Either side of a cell boundary, but within the tolerance.
+        Point(1e-9 - 1e-13, 0.0),
+        Point(1e-9 + 1e-13, 0.0),
+        Point(3.0, 4.1),
+    ]
+    assert cell_of(points[3].x, 0.0) != cell_of(points[4].x, 0.0)
+    assert dedupe(points) == [points[0], points[1], points[3], points[5]]
+    assert len(dedupe(points, tolerance=0.5)) == 3
+
+
+def test_dedupe_spatial_points() -> None:
+    """Deduplicate `SpatialPoint`s."""
+    points = [SpatialPoint(0, 0), SpatialPoint(0, 1e-10), SpatialPoint(0, 1)]
+    assert dedupe(points) == [points[0], points[2]]
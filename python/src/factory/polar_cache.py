@@ -0,0 +1,131 @@
+"""Polar point factories that avoid computing the cosine and sine of every angle.
+
+Some workloads create polar points with a small set of repeating angles, e.g., the
+angles of a sensor sweep. `MemoizingPolarFactory` caches `cos(theta)` and `sin(theta)`
+for the most recently used angles, and reports the cache's hit rate.
+`QuantizedPolarFactory` rounds each angle to a fixed resolution, and looks its cosine
+and sine up in a table computed once.
+
+The table pays off for batches of points: gathering from it costs a fraction of
+computing the cosines and sines of the whole batch. For a single point, looking up an
+angle costs about as much in CPython as calling `cos` and `sin`, so the memoizing
+factory is mostly useful to measure how often the angles of a workload repeat.
+"""
+
+from math import cos, floor, sin, tau
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
+
+from factory.factory import Point, PointFactory
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from factory.point_array import PointArray
+
+
+class TrigCacheInfo(NamedTuple):
+    """Statistics of a cache of cosines and sines."""
+
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class MemoizingPolarFactory(PointFactory):
+    """Factory of `Point`s caching the cosine and sine of up to `maxsize` angles.
+
+    When the cache is full, the angle cached first is evicted.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Create a factory caching at most `maxsize` angles."""
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, not {maxsize!r}")
+
+        self.maxsize = maxsize
+        self._cache: Dict[float, Tuple[float, float]] = {}
+        self._lookups = 0
+        self._misses = 0
+
+    def new_polar_point(self, rho: float, theta: float) -> Point:
+        """Create a point using polar coordinates.
+
+        `theta` is in radians.
+        """
+        self._lookups += 1
+        try:
+            cos_theta, sin_theta = self._cache[theta]
+        except KeyError:
+            cos_theta, sin_theta = self._cache_miss(theta)
+        return Point(rho * cos_theta, rho * sin_theta)
+
+    def _cache_miss(self, theta: float) -> Tuple[float, float]:
+        self._misses += 1
+        if len(self._cache) >= self.maxsize:
+            del self._cache[next(iter(self._cache))]
+        entry = self._cache[theta] = (cos(theta), sin(theta))
+        return entry
+
+    def cache_info(self) -> TrigCacheInfo:
+        """Return the statistics of the cache."""
+        hits = self._lookups - self._misses
+        return TrigCacheInfo(hits, self._misses, len(self._cache))
+
+
+class QuantizedPolarFactory(PointFactory):
+    """Factory of `Point`s rounding angles to a fixed resolution, using a lookup table.
+
+    Angles are rounded to the nearest multiple of a full turn divided by `resolution`,
+    so the points are only as precise as the resolution allows.
+    """
+
+    def __init__(self, resolution: int = 3600) -> None:
+        """Create a factory with `resolution` angles per full turn."""
+        if resolution < 1:
+            raise ValueError(f"resolution must be at least 1, not {resolution!r}")
+
+        self.resolution = resolution
+        self._steps_per_radian = resolution / tau
+        angles = [index / self._steps_per_radian for index in range(resolution)]
+        self._cos: List[float] = [cos(angle) for angle in angles]
+        self._sin: List[float] = [sin(angle) for angle in angles]
+        # The table as a (resolution, 2) NumPy array, created on first batch.
+        self._cos_sin: Optional[Any] = None
+
+    def new_polar_point(self, rho: float, theta: float) -> Point:
+        """Create a point using polar coordinates, with `theta` rounded.
+
+        `theta` is in radians.
+        """
+        index = floor(theta * self._steps_per_radian + 0.5) % self.resolution
+        return Point(rho * self._cos[index], rho * self._sin[index])
+
+    def new_polar_points(self, pairs: "npt.ArrayLike") -> "PointArray":
+        """Create an array of points from (rho, theta) pairs, with theta rounded.
+
+        `theta` is in radians. Requires NumPy.
+        """
+        # Imported here, so that NumPy is only needed for batches of points.
+        import numpy as np
+
+        from factory.point_array import PointArray
+
+        if self._cos_sin is None:
+            self._cos_sin = np.column_stack((self._cos, self._sin))
+
+        rho_theta = np.asarray(pairs, dtype=np.float64).reshape(-1, 2)
+        steps = rho_theta[:, 1] * self._steps_per_radian
+        steps += 0.5
+        indices = np.floor(steps).astype(np.intp)
+        indices %= self.resolution
+
+        # `take` rather than indexing, which is several times slower for a 2-D table.
+        xy = self._cos_sin.take(indices, axis=0)
+        xy *= rho_theta[:, :1]
+        return PointArray(xy, Point)
@@ -0,0 +1,53 @@
+"""Benchmark polar point factories on a stream of repeating angles.
+
+Run from `python/src` with `python -m factory.polar_cache_bench`. Requires NumPy.
+"""
+
+import math
+import random
+import time
+
+import numpy as np
+
+from factory.factory import PointFactory
+from factory.polar_cache import MemoizingPolarFactory, QuantizedPolarFactory
+
+SAMPLES = 1_000_000
+# Angles of a sensor sweep at a 1 degree resolution.
+ANGLES = [math.radians(degree) for degree in range(360)]
+
+
+def main() -> None:
+    """Time each factory on `SAMPLES` points with angles from the sweep."""
+    rng = random.Random(0)
+    samples = [(rng.uniform(0, 10), ANGLES[i % len(ANGLES)]) for i in range(SAMPLES)]
+    # Batches are typically already in an array, e.g., read from a sensor's buffer.
+    samples_array = np.array(samples)
+
+    print(f"{SAMPLES:,} points, {len(ANGLES)} distinct angles")
+    print(f"  {'factory':<24}{'one by one (ms)':>16}{'hit rate':>10}{'batch (ms)':>12}")
+    for name, factory in [
+        ("PointFactory", PointFactory()),
+        ("MemoizingPolarFactory", MemoizingPolarFactory()),
+        ("QuantizedPolarFactory", QuantizedPolarFactory(resolution=360)),
+    ]:
+        new_polar_point = factory.new_polar_point
+        start = time.perf_counter()
+        for rho, theta in samples:
+            new_polar_point(rho, theta)
+        one_by_one = time.perf_counter() - start
+        cache_info = getattr(factory, "cache_info", None)
+        hit_rate = f"{cache_info().hit_rate:.2%}" if cache_info else "-"
+
+        start = time.perf_counter()
+        factory.new_polar_points(samples_array)
+        batch = time.perf_counter() - start
+
+        print(
+            f"  {name:<24}{one_by_one * 1000:>16.1f}{hit_rate:>10}"
+            f"{batch * 1000:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Demonstrate polar point factories looking up the cosine and sine of angles."""
+
+import math
+
+import pytest
+
+from factory.factory import Point, PointFactory
+from factory.polar_cache import MemoizingPolarFactory, QuantizedPolarFactory
+
+
+def test_memoizing_polar_factory() -> None:
+    """Create points with repeating angles, computing their cosine and sine once."""
+    factory = MemoizingPolarFactory(maxsize=2)
+    assert factory.new_polar_point(4, math.pi / 3) == Point(2, 3.46410161514)
+    assert factory.new_polar_point(8, math.pi / 3) == Point(4, 6.92820323028)
+    factory.new_polar_point(1, 0)
+    factory.new_polar_point(1, 1)
+
+    info = factory.cache_info()
+    assert (info.hits, info.misses, info.size) == (1, 3, 2)
+    assert info.hit_rate == pytest.approx(0.25)
+
+    with pytest.raises(ValueError):
+        MemoizingPolarFactory(maxsize=0)
+
+
+def test_quantized_polar_factory() -> None:
+    """Create points with angles rounded to a fixed resolution."""
+    factory = QuantizedPolarFactory(resolution=360)
+    assert factory.new_polar_point(4, math.pi / 3) == Point(2, 3.46410161514)
+    assert factory.new_polar_point(4, math.pi / 3 + 1e-4) == Point(2, 3.46410161514)
+    assert factory.new_polar_point(2, 2 * math.pi) == Point(2, 0)
+    assert factory.new_polar_point(2, -2 * math.pi) == Point(2, 0)
+
+    with pytest.raises(ValueError):
+        QuantizedPolarFactory(resolution=0)
+
+
+def test_quantized_polar_factory_batch() -> None:
+    """Create an array of points with angles rounded to a fixed resolution."""
+    pytest.importorskip("numpy")
+
+    factory = QuantizedPolarFactory(resolution=360)
+    pairs = [(4, math.pi / 3 + 1e-4), (2, -2 * math.pi), (3, 1.0)]
+    points = factory.new_polar_points(pairs)
+    assert points.to_points() == [factory.new_polar_point(*pair) for pair in pairs]
+    assert points == PointFactory().new_polar_points(
+        [(4, math.pi / 3), (2, 0), (3, math.radians(57))]
+    )
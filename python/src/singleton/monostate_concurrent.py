@@ -0,0 +1,117 @@
+"""Variation of monostate that is safe to update and read from many threads.
+
+Updating several fields of a monostate one at a time (e.g., `CEO`'s `name` and `age`)
+lets another thread observe a torn state, with the new `name` but the old `age`. Here
+the shared fields are written under a sequence lock (seqlock): a writer makes the
+version odd while it updates the fields, and even again once it is done. Readers take
+no lock; they retry a snapshot if the version was odd or changed while they read.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from singleton.monostate_typed import TypedMonostate
+
+T = TypeVar("T")
+
+
+class SeqLock:
+    """Sequence lock: serialised writers, lock-free readers."""
+
+    __slots__ = ("version", "_write_lock")
+
+    def __init__(self) -> None:
+        self.version = 0
+        self._write_lock = threading.Lock()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Hold the lock for writing."""
+        with self._write_lock:
+            self.version += 1
+            try:
+                yield
+            finally:
+                self.version += 1
+
+    def read(self, reader: Callable[[], T]) -> Tuple[int, T]:
+        """Return the version and the result of `reader` while no writer was active."""
+        while True:
+            version = self.version
+            if version % 2 == 0:
+                result = reader()
+                if self.version == version:
+                    return version, result
+            # Let the writer finish.
+            time.sleep(0)
+
+
+class MonostateSnapshot(NamedTuple):
+    """A consistent view of the shared fields of a monostate."""
+
+    version: int
+    values: Dict[str, Any]
+
+
+class ConcurrentMonostate(TypedMonostate):
+    """Base class for monostate classes with atomic updates and consistent snapshots.
+
+    Declare the shared fields as in `TypedMonostate`.
+    """
+
+    # One lock for a class and its subclasses, as they share the class's fields.
+    _seqlock: ClassVar[Optional[SeqLock]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls._seqlock is None:
+            cls._seqlock = SeqLock()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        with type(self)._seqlock.write():
+            super().__setattr__(name, value)
+
+    def update(self, **values: Any) -> None:
+        """Set the given shared fields atomically."""
+        unknown = set(values).difference(self._fields)
+        if unknown:
+            raise AttributeError(f"undeclared shared fields: {sorted(unknown)}")
+
+        with type(self)._seqlock.write():
+            for field, value in values.items():
+                object.__setattr__(self, field, value)
+
+    def snapshot(self) -> MonostateSnapshot:
+        """Return a consistent view of the shared fields that have been set."""
+        cls = type(self)
+
+        def read() -> Dict[str, Any]:
+            values = {}
+            for field in self._fields:
+                try:
+                    values[field] = getattr(self, field)
+                except AttributeError:
+                    pass
+            return values
+
+        version, values = cls._seqlock.read(read)
+        return MonostateSnapshot(version, values)
+
+
+class CEO(ConcurrentMonostate):
+    """Monostate CEO that can be updated from many threads."""
+
+    name: str = "Steve"
+    age: int = 55
@@ -0,0 +1,61 @@
+"""Stress-test reader/writer throughput of the concurrent monostate.
+
+Run from `python/src` with `python -m singleton.monostate_concurrent_bench`.
+"""
+
+import threading
+import time
+from typing import List
+
+from singleton.monostate_concurrent import CEO
+
+DURATION = 2.0
+
+
+def _run(readers: int, writers: int) -> None:
+    stop = threading.Event()
+    reads: List[int] = [0] * readers
+    writes: List[int] = [0] * writers
+    torn: List[int] = [0]
+
+    def write(index: int) -> None:
+        ceo = CEO()
+        while not stop.is_set():
+            writes[index] += 1
+            ceo.update(name=f"CEO {writes[index]}", age=writes[index])
+
+    def read(index: int) -> None:
+        ceo = CEO()
+        while not stop.is_set():
+            values = ceo.snapshot().values
+            if values["name"] != f"CEO {values['age']}":
+                torn[0] += 1
+            reads[index] += 1
+
+    CEO().update(name="CEO 0", age=0)
+    threads = [threading.Thread(target=read, args=(i,)) for i in range(readers)]
+    threads += [threading.Thread(target=write, args=(i,)) for i in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(DURATION)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    print(
+        f"{readers:>8}{writers:>8}{sum(reads) / DURATION:>14,.0f}"
+        f"{sum(writes) / DURATION:>14,.0f}{torn[0]:>8}"
+    )
+
+
+def main() -> None:
+    """Report snapshot and update throughput for various thread mixes."""
+    print(
+        f"{'readers':>8}{'writers':>8}{'snapshots/s':>14}{'updates/s':>14}{'torn':>8}"
+    )
+    for readers, writers in [(1, 0), (0, 1), (1, 1), (4, 1), (1, 4), (4, 4)]:
+        _run(readers, writers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Demonstrate monostate that is safe to update and read from many threads."""
+
+import threading
+
+import pytest
+
+from singleton.monostate_concurrent import CEO
+
+
+@pytest.fixture(autouse=True)
+def initial_ceo() -> None:
+    """Restore the initial shared fields of `CEO` before each test."""
+    CEO().update(name="Steve", age=55)
+
+
+def test_concurrent_monostate_update() -> None:
+    """Verify that fields can be updated together, and read as a snapshot."""
+    steve = CEO()
+    before = steve.snapshot()
+    assert before.values == {"name": "Steve", "age": 55}
+
+    CEO().update(name="Bob", age=66)
+    after = steve.snapshot()
+    assert after.values == {"name": "Bob", "age": 66}
+    assert after.version > before.version
+
+    steve.name = "Steve"
+    assert steve.snapshot().version > after.version
+
+    with pytest.raises(AttributeError):
+        steve.update(salary=100_000)
+
+
+def test_concurrent_monostate_no_torn_snapshots() -> None:
+    """Verify that readers never see a partially applied update."""
+    stop = threading.Event()
+
+    def write() -> None:
+        ceo = CEO()
+        age = 0
+        while not stop.is_set():
+            age += 1
+            ceo.update(name=f"CEO {age}", age=age)
+
+    torn = []
+
+    def read() -> None:
+        ceo = CEO()
+        for _ in range(2000):
+            values = ceo.snapshot().values
+            if values["name"] != f"CEO {values['age']}":
+                torn.append(values)
+
+    CEO().update(name="CEO 0", age=0)
+    writers = [threading.Thread(target=write) for _ in range(2)]
+    readers = [threading.Thread(target=read) for _ in range(2)]
+    for thread in writers + readers:
+        thread.start()
+    for thread in readers:
+        thread.join()
+    stop.set()
+    for thread in writers:
+        thread.join()
+
+    assert not torn
@@ -0,0 +1,85 @@
+"""Variation of monostate with a fixed schema.
+
+The monostates in `monostate_test.py` alias every instance's `__dict__` to one shared
+dict, so any attribute can be added to all instances, silently. Here the shared fields
+are declared up front as annotated class attributes. Their values are kept in a compact
+table, an object with a slot per field, shared by all instances and accessed through
+`property` descriptors. Instances have no `__dict__`, so assigning an undeclared
+attribute raises `AttributeError`.
+
+A field's getter is an `operator.attrgetter` reading the table's slot, so a read runs
+no Python code. Writes only change the table, leaving the class, and CPython's cache of
+its attributes, as they are.
+"""
+
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Dict, Tuple, get_origin
+
+
+def _is_class_var(annotation: Any) -> bool:
+    if isinstance(annotation, str):
+        return annotation.startswith(("ClassVar", "typing.ClassVar"))
+    return annotation is ClassVar or get_origin(annotation) is ClassVar
+
+
+def _setter(table: Any, field: str) -> Callable[[Any, Any], None]:
+    # Generated, as assigning a named attribute is about twice as fast as calling
+    # `setattr` with the field's name. Slot names are identifiers, so `field` is too.
+    source = f"def set_field(_, value):\n    table.{field} = value"
+    namespace: Dict[str, Any] = {}
+    exec(source, {"table": table}, namespace)
+    return namespace["set_field"]
+
+
+class TypedMonostateMeta(type):
+    """Metaclass turning annotated class attributes into shared fields."""
+
+    def __new__(
+        mcs, name: str, bases: Tuple[type, ...], namespace: Dict[str, Any]
+    ) -> "TypedMonostateMeta":
+        # Without a `__dict__`, instances can only have the declared fields.
+        namespace.setdefault("__slots__", ())
+
+        fields = tuple(
+            field
+            for field, annotation in namespace.get("__annotations__", {}).items()
+            if not _is_class_var(annotation)
+        )
+        # The fields' table, kept by the class declaring them and shared by its
+        # subclasses. A field declared without a default has an empty slot, so reading
+        # it raises `AttributeError` until it is set.
+        table = type(f"{name}Fields", (), {"__slots__": fields})()
+        for field in fields:
+            if field in namespace:
+                setattr(table, field, namespace.pop(field))
+
+        table_attribute = f"_{name}__fields"
+        while any(hasattr(base, table_attribute) for base in bases):
+            table_attribute += "_"
+        namespace[table_attribute] = table
+        for field in fields:
+            namespace[field] = property(
+                attrgetter(f"{table_attribute}.{field}"), _setter(table, field)
+            )
+
+        cls = super().__new__(mcs, name, bases, namespace)
+        inherited: Tuple[str, ...] = getattr(cls, "_fields", ())
+        cls._fields = inherited + fields
+        return cls
+
+
+class TypedMonostate(metaclass=TypedMonostateMeta):
+    """Base class for monostate classes with a fixed schema.
+
+    Declare the shared fields as annotated class attributes; a field's class attribute
+    value, if any, is its initial value.
+    """
+
+    _fields: ClassVar[Tuple[str, ...]]
+
+
+class CEO(TypedMonostate):
+    """Monostate CEO with a fixed schema."""
+
+    name: str = "Steve"
+    age: int = 55
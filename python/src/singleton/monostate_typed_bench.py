@@ -0,0 +1,35 @@
+"""Benchmark attribute access of monostates with and without a fixed schema.
+
+Run from `python/src` with `python -m singleton.monostate_typed_bench`.
+"""
+
+import timeit
+from typing import Any, Dict
+
+from singleton import monostate_test, monostate_typed
+
+NUMBER = 1_000_000
+
+
+def _time(statement: str, namespace: Dict[str, Any]) -> float:
+    return min(timeit.repeat(statement, globals=namespace, number=NUMBER, repeat=5))
+
+
+def main() -> None:
+    """Time getting and setting a shared attribute on each monostate variant."""
+    variants = {
+        "CEO (shared __dict__)": monostate_test.CEO(),
+        "CFO (Monostate base)": monostate_test.CFO(),
+        "CEO (TypedMonostate)": monostate_typed.CEO(),
+    }
+
+    print(f"{NUMBER:,} operations, best of 5 (ns/op)")
+    print(f"{'variant':<24}{'get':>8}{'set':>8}")
+    for name, obj in variants.items():
+        get = _time("obj.name", {"obj": obj})
+        set_ = _time("obj.name = 'x'", {"obj": obj})
+        print(f"{name:<24}{get / NUMBER * 1e9:>8.1f}{set_ / NUMBER * 1e9:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
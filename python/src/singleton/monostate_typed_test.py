@@ -0,0 +1,60 @@
+"""Demonstrate monostate with a fixed schema."""
+
+import pytest
+
+from singleton.monostate_typed import CEO, TypedMonostate
+
+
+class CTO(TypedMonostate):
+    """Monostate CTO with a field declared without a default."""
+
+    name: str
+    budget: int = 0
+
+
+def test_typed_monostate_ceo() -> None:
+    """Verify `CEO`s `name` and `age` attributes are monostate."""
+    steve = CEO()
+    assert (steve.name, steve.age) == ("Steve", 55)
+
+    bob = CEO()
+    bob.name = "Bob"
+    bob.age = 66
+    assert (steve.name, steve.age) == ("Bob", 66)
+    assert CEO._fields == ("name", "age")
+
+
+def test_typed_monostate_undeclared() -> None:
+    """Verify that undeclared attributes are rejected."""
+    ceo = CEO()
+    with pytest.raises(AttributeError):
+        ceo.some_attr = 22
+
+    assert not hasattr(ceo, "__dict__")
+
+
+def test_typed_monostate_unset() -> None:
+    """Verify that a field without a default has to be set before use."""
+    linus = CTO()
+    with pytest.raises(AttributeError):
+        _ = linus.name
+
+    CTO().name = "Linus"
+    assert (linus.name, linus.budget) == ("Linus", 0)
+
+
+def test_typed_monostate_subclass() -> None:
+    """Verify that a subclass shares its base's fields, and adds its own."""
+
+    class Founder(CTO):
+        """Monostate CTO who founded the company."""
+
+        shares: int = 0
+
+    founder = Founder()
+    founder.budget = 100
+    founder.shares = 10
+    assert CTO().budget == 100
+    assert Founder._fields == ("name", "budget", "shares")
+    with pytest.raises(AttributeError):
+        CTO().shares = 1
@@ -0,0 +1,119 @@
+"""Singleton pattern example: lazily-initialised, fork-safe singletons.
+
+A plain singleton (see `singleton_metaclass_test.py` and `singleton_decorator_test.py`)
+survives `os.fork()`: a worker process inherits the parent's instance, along with any
+half-open resources (sockets, file handles, locks) that the instance holds.
+
+The singletons here are constructed lazily on first use in each process, and are
+forgotten automatically in a forked child so that the child constructs its own
+instance. State that is cheap to compute and safe to share can still be prepared in the
+parent before forking by defining a `__prefork__` class method.
+"""
+
+import functools
+import os
+import threading
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple, Type, TypeVar
+
+from singleton.singleton_registry import SingletonRegistry
+
+T = TypeVar("T")
+
+
+class ForkSafeSingleton(type):
+    """Metaclass that creates a per-process singleton, constructed on first call.
+
+    Instances are kept in a `SingletonRegistry` (see `singleton_registry.py`).
+
+    A class using this metaclass may define a `__prefork__` class method. It is called
+    once in the parent process just before the first `os.fork()`, and is the place to
+    prepare cheap, fork-safe state (e.g., parsed configuration) that children inherit.
+    """
+
+    registry: ClassVar[SingletonRegistry] = SingletonRegistry()
+    _classes: ClassVar[List["ForkSafeSingleton"]] = []
+
+    def __init__(cls, name: str, bases: Tuple[type, ...], namespace: Dict[str, Any]):
+        super().__init__(name, bases, namespace)
+        ForkSafeSingleton._classes.append(cls)
+        cls._preforked = False
+
+    def __call__(cls, *args, **kwargs) -> Any:
+        return ForkSafeSingleton.registry.get_or_create(
+            cls, lambda: super(ForkSafeSingleton, cls).__call__(*args, **kwargs)
+        )
+
+    def _before_fork(cls) -> None:
+        if not cls._preforked:
+            prefork = getattr(cls, "__prefork__", None)
+            if prefork is not None:
+                prefork()
+            cls._preforked = True
+
+    @staticmethod
+    def _prefork_all() -> None:
+        for cls in ForkSafeSingleton._classes:
+            cls._before_fork()
+
+    @staticmethod
+    def _reset_in_child() -> None:
+        # The parent's instances and their resources belong to the parent, so they are
+        # forgotten rather than torn down.
+        ForkSafeSingleton.registry.reset()
+
+
+# Reset functions for instances held by `fork_safe_singleton`-decorated classes.
+_decorated_resets: List[Callable[[], None]] = []
+_decorated_preforks: List[Callable[[], None]] = []
+
+
+def fork_safe_singleton(class_: Type[T]) -> Callable[..., T]:
+    """Class decorator to enforce a per-process singleton, constructed on first call.
+
+    The decorated class may define a `__prefork__` class method; see
+    `ForkSafeSingleton`.
+    """
+    instance: Optional[T] = None
+    lock = threading.Lock()
+
+    @functools.wraps(class_)
+    def wrapper_singleton(*args: Tuple[Any], **kwargs: Dict[str, Any]) -> T:
+        nonlocal instance
+        if instance is None:
+            with lock:
+                if instance is None:
+                    instance = class_(*args, **kwargs)
+
+        return instance
+
+    def reset() -> None:
+        nonlocal instance, lock
+        lock = threading.Lock()
+        instance = None
+
+    prefork = getattr(class_, "__prefork__", None)
+    if prefork is not None:
+        _decorated_preforks.append(prefork)
+    _decorated_resets.append(reset)
+
+    return wrapper_singleton
+
+
+def _prefork_decorated() -> None:
+    while _decorated_preforks:
+        _decorated_preforks.pop(0)()
+
+
+def _reset_decorated_in_child() -> None:
+    for reset in _decorated_resets:
+        reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=ForkSafeSingleton._prefork_all,
+        after_in_child=ForkSafeSingleton._reset_in_child,
+    )
+    os.register_at_fork(
+        before=_prefork_decorated, after_in_child=_reset_decorated_in_child
+    )
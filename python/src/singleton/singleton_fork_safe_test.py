@@ -0,0 +1,102 @@
+"""Demonstrate lazily-initialised, fork-safe singletons."""
+
+import os
+from typing import ClassVar, List
+
+import pytest
+
+from singleton.singleton_fork_safe import ForkSafeSingleton, fork_safe_singleton
+from singleton.singleton_registry import SingletonRegistry
+
+
+class Connection(metaclass=ForkSafeSingleton):
+    """Singleton representing a per-process connection."""
+
+    called_num: ClassVar[int] = 0
+    config: ClassVar[List[str]] = []
+
+    def __init__(self) -> None:
+        Connection.called_num += 1
+        self.pid = os.getpid()
+
+    @classmethod
+    def __prefork__(cls) -> None:
+        cls.config.append("parsed")
+
+
+@fork_safe_singleton
+class Cache:
+    """Singleton representing a per-process cache."""
+
+    called: ClassVar[int] = 0
+
+    def __init__(self) -> None:
+        Cache.called += 1
+        self.pid = os.getpid()
+
+
+@pytest.fixture(autouse=True)
+def fresh_connection() -> None:
+    """Forget the `Connection` instance and its counters before each test."""
+    ForkSafeSingleton.registry = SingletonRegistry()
+    Connection.called_num = 0
+    Connection.config.clear()
+    Connection._preforked = False
+
+
+def _in_child(check) -> bool:
+    """Run `check` in a forked child and return its result."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read_fd)
+            os.write(write_fd, b"1" if check() else b"0")
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    result = os.read(read_fd, 1)
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+    return result == b"1"
+
+
+def test_fork_safe_singleton_lazy() -> None:
+    """Verify that the instance is only constructed on first call."""
+    assert Connection.called_num == 0
+
+    connection_1 = Connection()
+    connection_2 = Connection()
+    assert Connection.called_num == 1
+    assert connection_1 is connection_2
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork()")
+def test_fork_safe_singleton_child() -> None:
+    """Verify that a forked child constructs its own instance."""
+    parent_connection = Connection()
+    parent_cache = Cache()
+
+    def check() -> bool:
+        connection = Connection()
+        cache = Cache()
+        return (
+            connection is not parent_connection
+            and connection.pid == os.getpid()
+            and connection is Connection()
+            and cache is not parent_cache
+            and cache.pid == os.getpid()
+        )
+
+    assert _in_child(check)
+    assert Connection() is parent_connection
+    assert Cache() is parent_cache
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork()")
+def test_fork_safe_singleton_prefork() -> None:
+    """Verify that `__prefork__` runs once in the parent, before forking."""
+    assert _in_child(lambda: Connection.config == ["parsed"])
+    assert _in_child(lambda: Connection.config == ["parsed"])
+    assert Connection.config == ["parsed"]
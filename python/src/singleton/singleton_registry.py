@@ -0,0 +1,151 @@
+"""Singleton pattern example: a registry of singletons with introspection and teardown.
+
+The metaclass in `singleton_metaclass_test.py` keeps its instances in a private
+class-level dict. The registry here also records when each singleton was constructed
+and how long its initialiser took, so slow-to-construct singletons can be found (and
+perhaps made lazy), and it can dispose of the singletons in an orderly fashion.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, ClassVar, Dict, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SingletonRecord:
+    """A singleton instance and how it was constructed."""
+
+    cls: type
+    instance: Any
+    # Wall-clock time (as per `time.time()`) when construction completed.
+    constructed_at: float
+    # Time taken to construct the instance, excluding that taken to construct any
+    # singletons constructed by its initialiser.
+    init_seconds: float
+
+
+class SingletonRegistry:
+    """Registry of singleton instances, in order of construction."""
+
+    def __init__(self) -> None:
+        self._records: Dict[type, SingletonRecord] = {}
+        # Re-entrant, as a singleton's initialiser may construct other singletons.
+        self._lock = threading.RLock()
+        # Per construction in progress, innermost last: time spent so far constructing
+        # the singletons its initialiser constructed.
+        self._nested_seconds: List[float] = []
+
+    def get_or_create(self, cls: type, factory: Callable[[], T]) -> T:
+        """Return the instance of `cls`, constructing it using `factory` if needed."""
+        record = self._records.get(cls)
+        if record is not None:
+            return record.instance
+
+        with self._lock:
+            record = self._records.get(cls)
+            if record is None:
+                start = time.perf_counter()
+                self._nested_seconds.append(0.0)
+                try:
+                    instance = factory()
+                finally:
+                    nested_seconds = self._nested_seconds.pop()
+                    total_seconds = time.perf_counter() - start
+                    if self._nested_seconds:
+                        self._nested_seconds[-1] += total_seconds
+                init_seconds = total_seconds - nested_seconds
+                record = SingletonRecord(cls, instance, time.time(), init_seconds)
+                self._records[cls] = record
+
+        return record.instance
+
+    def get(self, cls: type) -> Optional[Any]:
+        """Return the instance of `cls`, or `None` if it has not been constructed."""
+        record = self._records.get(cls)
+        return None if record is None else record.instance
+
+    def __contains__(self, cls: object) -> bool:
+        return cls in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[SingletonRecord]:
+        """Iterate over the records of the singletons, in order of construction."""
+        return iter(list(self._records.values()))
+
+    def dispose(self, cls: type) -> None:
+        """Tear down the instance of `cls`, if any.
+
+        The instance's `close()` method is called if it has one. The next call to `cls`
+        constructs a new instance.
+        """
+        with self._lock:
+            record = self._records.pop(cls, None)
+        if record is not None:
+            _close(record.instance)
+
+    def teardown(self) -> None:
+        """Tear down all instances, in reverse order of construction.
+
+        A singleton constructed by another singleton's initialiser is torn down after
+        the singleton depending on it. All instances are torn down even if some fail;
+        the first error is then raised.
+        """
+        with self._lock:
+            records = list(self._records.values())
+            self._records.clear()
+
+        error: Optional[Exception] = None
+        for record in reversed(records):
+            try:
+                _close(record.instance)
+            except Exception as ex:
+                error = error or ex
+
+        if error is not None:
+            raise error
+
+    def reset(self) -> None:
+        """Forget all instances without tearing them down, e.g., in a forked child."""
+        self._lock = threading.RLock()
+        self._nested_seconds = []
+        self._records.clear()
+
+    def startup_report(self) -> List[Dict[str, Any]]:
+        """Return the construction costs of the singletons, most expensive first."""
+        return [
+            {
+                "class": f"{record.cls.__module__}.{record.cls.__qualname__}",
+                "constructed_at": record.constructed_at,
+                "init_seconds": record.init_seconds,
+            }
+            for record in sorted(self, key=lambda rec: rec.init_seconds, reverse=True)
+        ]
+
+    def format_report(self) -> str:
+        """Return the startup report as a text table."""
+        lines = [f"{'init (ms)':>12}  class"]
+        for entry in self.startup_report():
+            lines.append(f"{entry['init_seconds'] * 1000:12.3f}  {entry['class']}")
+        return "\n".join(lines)
+
+
+def _close(instance: Any) -> None:
+    close = getattr(instance, "close", None)
+    if callable(close):
+        close()
+
+
+class RegisteredSingleton(type):
+    """Metaclass that creates a Singleton base type recorded in a registry."""
+
+    registry: ClassVar[SingletonRegistry] = SingletonRegistry()
+
+    def __call__(cls, *args, **kwargs) -> Any:
+        return RegisteredSingleton.registry.get_or_create(
+            cls, lambda: super(RegisteredSingleton, cls).__call__(*args, **kwargs)
+        )
@@ -0,0 +1,86 @@
+"""Demonstrate a registry of singletons with introspection and teardown."""
+
+import time
+from typing import List
+
+import pytest
+
+from singleton.singleton_registry import RegisteredSingleton, SingletonRegistry
+
+closed: List[str] = []
+
+
+class Database(metaclass=RegisteredSingleton):
+    """Singleton representing a database connection."""
+
+    def __init__(self) -> None:
+        time.sleep(0.01)
+
+    def close(self) -> None:
+        """Close the connection."""
+        closed.append("Database")
+
+
+class Repository(metaclass=RegisteredSingleton):
+    """Singleton representing a repository depending on the database."""
+
+    def __init__(self) -> None:
+        self.database = Database()
+
+    def close(self) -> None:
+        """Close the repository."""
+        closed.append("Repository")
+
+
+@pytest.fixture(autouse=True)
+def registry() -> SingletonRegistry:
+    """Provide a fresh registry for each test."""
+    RegisteredSingleton.registry = SingletonRegistry()
+    closed.clear()
+    return RegisteredSingleton.registry
+
+
+def test_registry_introspection(registry: SingletonRegistry) -> None:
+    """Verify that singletons are recorded in order of construction."""
+    assert Database not in registry
+    assert registry.get(Database) is None
+
+    repository = Repository()
+    assert Repository() is repository
+    assert registry.get(Database) is repository.database
+    assert [record.cls for record in registry] == [Database, Repository]
+    assert len(registry) == 2
+
+
+def test_registry_startup_report(registry: SingletonRegistry) -> None:
+    """Verify that initialisation costs are reported, most expensive first."""
+    Repository()
+
+    report = registry.startup_report()
+    # The repository's own cost excludes the database it constructs.
+    assert [entry["class"] for entry in report] == [
+        "singleton.singleton_registry_test.Database",
+        "singleton.singleton_registry_test.Repository",
+    ]
+    assert report[0]["init_seconds"] >= 0.01
+    assert report[1]["init_seconds"] < 0.01
+    assert "singleton.singleton_registry_test.Database" in registry.format_report()
+
+
+def test_registry_teardown(registry: SingletonRegistry) -> None:
+    """Verify that singletons are torn down in reverse order of construction."""
+    repository = Repository()
+    registry.teardown()
+
+    assert closed == ["Repository", "Database"]
+    assert len(registry) == 0
+    assert Repository() is not repository
+
+
+def test_registry_dispose(registry: SingletonRegistry) -> None:
+    """Verify that a single singleton can be disposed of."""
+    database = Database()
+    registry.dispose(Database)
+
+    assert closed == ["Database"]
+    assert Database() is not database
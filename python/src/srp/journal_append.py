@@ -0,0 +1,183 @@
+"""Append-only persistence of a journal.
+
+`PersistenceManager.save` rewrites the whole file on every call. `JournalAppender`
+keeps the file open, and on each save appends only the entries added since the previous
+save, in one buffered write. It falls back to a full rewrite when entries have been
+removed in the meantime.
+
+With `Durability.GROUP_COMMIT`, saves are forced to stable storage together, by a timer
+thread once the commit interval since the previous `fsync` has passed, so a save is
+lost on a crash only if made within about one commit interval of it.
+"""
+
+import os
+import threading
+import time
+from enum import Enum
+from pathlib import Path
+from typing import IO, Any, Iterable, NamedTuple, Optional, Tuple
+
+from srp.srp_comply import Journal
+
+# Size of the write buffer, so that a batch reaches the OS in few system calls.
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+
+class Durability(Enum):
+    """When saved entries are forced to stable storage with `fsync`."""
+
+    # Never: the entries are handed over to the OS, which writes them eventually.
+    NONE = "none"
+    # After every save.
+    FSYNC_BATCH = "fsync_batch"
+    # At most once per commit interval, covering every save since the previous `fsync`:
+    # after a save once the interval has passed, or else in the background when it
+    # passes. `sync()` and `close()` force it.
+    GROUP_COMMIT = "group_commit"
+
+
+class PendingEntries(NamedTuple):
+    """Entries of a journal yet to be saved."""
+
+    # Numbers and texts of the entries, formatted when written.
+    entries: Iterable[Tuple[int, str]]
+    # Whether the entries replace the file's contents, rather than being appended.
+    rewrite: bool
+    # Journal, and its number of entries and `count`, once the entries are written.
+    journal: Journal
+    length: int
+    count: int
+
+
+class JournalAppender:
+    """Saves a journal into a file, appending the entries added since the last save."""
+
+    def __init__(
+        self,
+        file: Path,
+        durability: Durability = Durability.NONE,
+        commit_interval: float = 1.0,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        """Create an appender saving into `file`, which is rewritten on first save.
+
+        `commit_interval` is the minimum time in seconds between two `fsync`s with
+        `Durability.GROUP_COMMIT`.
+        """
+        self.file = file
+        self.durability = durability
+        self.commit_interval = commit_interval
+        self._buffer_size = buffer_size
+        self._output: Optional[IO[str]] = None
+
+        # Journal last saved, and its number of entries and `count` then.
+        self._journal: Optional[Journal] = None
+        self._saved_length = 0
+        self._saved_count = 0
+
+        self._unsynced = False
+        self._last_sync = time.monotonic()
+        # Timer making the next group commit, if one is due.
+        self._commit_timer: Optional[threading.Timer] = None
+        # Guards the file, which the commit timer syncs from its own thread.
+        self._lock = threading.RLock()
+
+    def pending(self, journal: Journal) -> PendingEntries:
+        """Return the entries of `journal` to save.
+
+        The entries are copied, but not formatted until written by `write`, so this is
+        cheap to call under a lock guarding `journal`. They are marked saved once
+        written. All the entries are to be rewritten if `journal` is not the journal
+        last saved, or if entries have been removed from it since.
+        """
+        length, count = len(journal), journal.count
+        appended = (
+            journal is self._journal
+            and length - self._saved_length == count - self._saved_count
+        )
+        start = self._saved_length if appended else 0
+        entries = journal.copy_numbered_entries(start)
+        return PendingEntries(entries, not appended, journal, length, count)
+
+    def write(self, pending: PendingEntries) -> None:
+        """Write entries returned by `pending`, in the order they were returned.
+
+        If the write fails, the next save rewrites the whole file, as the file may hold
+        only some of the entries.
+        """
+        with self._lock:
+            try:
+                if pending.rewrite:
+                    self._close_output()
+                    self._output = self._open("w")
+                elif self._output is None:
+                    self._output = self._open("a")
+
+                self._output.writelines(
+                    f"{number}: {entry}\n" for number, entry in pending.entries
+                )
+                self._output.flush()
+            except BaseException:
+                self._journal = None
+                raise
+            self._journal = pending.journal
+            self._saved_length, self._saved_count = pending.length, pending.count
+            self._unsynced = True
+
+            if self.durability is Durability.FSYNC_BATCH:
+                self.sync()
+            elif self.durability is Durability.GROUP_COMMIT:
+                self._group_commit()
+
+    def save(self, journal: Journal) -> None:
+        """Save the entries of `journal` added since the last save."""
+        self.write(self.pending(journal))
+
+    def sync(self) -> None:
+        """Force the entries written so far to stable storage."""
+        with self._lock:
+            if self._output is not None and self._unsynced:
+                self._output.flush()
+                os.fsync(self._output.fileno())
+            self._unsynced = False
+            self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Close the file, forcing the entries to stable storage unless not durable."""
+        with self._lock:
+            if self._commit_timer is not None:
+                self._commit_timer.cancel()
+                self._commit_timer = None
+            if self._output is not None and self.durability is not Durability.NONE:
+                self.sync()
+            self._close_output()
+
+    def __enter__(self) -> "JournalAppender":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _group_commit(self) -> None:
+        """Sync if the commit interval has passed, or else have the timer sync then."""
+        remaining = self._last_sync + self.commit_interval - time.monotonic()
+        if remaining <= 0:
+            self.sync()
+        elif self._commit_timer is None:
+            self._commit_timer = threading.Timer(remaining, self._commit)
+            self._commit_timer.daemon = True
+            self._commit_timer.start()
+
+    def _commit(self) -> None:
+        with self._lock:
+            self._commit_timer = None
+            if self._unsynced:
+                self._group_commit()
+
+    def _open(self, mode: str) -> IO[str]:
+        return open(self.file, mode, buffering=self._buffer_size)
+
+    def _close_output(self) -> None:
+        if self._output is not None:
+            self._output.close()
+            self._output = None
@@ -0,0 +1,61 @@
+"""Benchmark saving a growing journal by full rewrites and by appending.
+
+Run from `python/src` with `python -m srp.journal_append_bench`.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from srp.journal_append import Durability, JournalAppender
+from srp.srp_comply import Journal, PersistenceManager
+
+INITIAL_ENTRIES = 100_000
+SAVES = 200
+ENTRIES_PER_SAVE = 50
+
+
+def _journal() -> Journal:
+    journal = Journal()
+    for entry in range(INITIAL_ENTRIES):
+        journal.add_entry(f"entry number {entry} of the journal")
+    return journal
+
+
+def _rewrite(file: Path) -> float:
+    journal = _journal()
+    start = time.perf_counter()
+    for _ in range(SAVES):
+        for entry in range(ENTRIES_PER_SAVE):
+            journal.add_entry(f"new entry {entry}")
+        PersistenceManager.save(journal, file)
+    return time.perf_counter() - start
+
+
+def _append(file: Path, durability: Durability) -> float:
+    journal = _journal()
+    start = time.perf_counter()
+    with JournalAppender(file, durability, commit_interval=0.05) as appender:
+        for _ in range(SAVES):
+            for entry in range(ENTRIES_PER_SAVE):
+                journal.add_entry(f"new entry {entry}")
+            appender.save(journal)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Print the average time taken to save a journal."""
+    with tempfile.TemporaryDirectory() as directory:
+        file = Path(directory, "journal.txt")
+        print(f"{INITIAL_ENTRIES:,} entries, {ENTRIES_PER_SAVE} added per save")
+        print(f"{'save':>20}  {'ms/save':>8}")
+        print(f"{'full rewrite':>20}  {_rewrite(file) / SAVES * 1000:8.3f}")
+        expected = file.read_text()
+        for durability in Durability:
+            seconds = _append(file, durability)
+            assert file.read_text() == expected
+            print(f"{'append, ' + durability.value:>20}  {seconds / SAVES * 1000:8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Demonstrate append-only persistence of a journal."""
+
+import os
+import time
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from srp.journal_append import Durability, JournalAppender
+from srp.srp_comply import Journal
+
+
+@pytest.fixture(name="fsyncs")
+def fixture_fsyncs(monkeypatch: pytest.MonkeyPatch) -> List[int]:
+    """Record the file descriptors synced, without syncing them."""
+    fsyncs: List[int] = []
+    monkeypatch.setattr(os, "fsync", fsyncs.append)
+    return fsyncs
+
+
+def test_append_save(tmp_path: Path) -> None:
+    """Verify that only the entries added since the last save are written."""
+    output = tmp_path.joinpath("test.txt")
+    output.write_text("stale\n")
+    journal = Journal()
+    journal.add_entry("test 1")
+
+    with JournalAppender(output) as appender:
+        appender.save(journal)
+        assert output.read_text() == "0: test 1\n"
+
+        journal.add_entry("test 2")
+        journal.add_entry("test 3")
+        pending = appender.pending(journal)
+        assert list(pending.entries) == [(1, "test 2"), (2, "test 3")]
+        assert not pending.rewrite
+        appender.write(pending)
+        appender.save(journal)
+
+    assert output.read_text() == "0: test 1\n1: test 2\n2: test 3\n"
+
+
+def test_append_save_after_failed_write(tmp_path: Path) -> None:
+    """Verify that entries whose write failed are written by the next save."""
+    output = tmp_path.joinpath("test.txt")
+    journal = Journal()
+    journal.add_entry("a")
+
+    with JournalAppender(output) as appender:
+        appender.save(journal)
+        journal.add_entry("b")
+        file = appender._output
+        with patch.object(file, "write", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                appender.save(journal)
+        journal.add_entry("c")
+        appender.save(journal)
+
+    assert output.read_text() == "0: a\n1: b\n2: c\n"
+
+
+def test_append_save_after_removal(tmp_path: Path) -> None:
+    """Verify that the file is rewritten if entries have been removed."""
+    output = tmp_path.joinpath("test.txt")
+    journal = Journal()
+    journal.add_entry("test 1")
+    journal.add_entry("test 2")
+
+    with JournalAppender(output) as appender:
+        appender.save(journal)
+        journal.remove_entry(0)
+        journal.add_entry("test 3")
+        appender.save(journal)
+
+    assert output.read_text() == "1: test 2\n2: test 3\n"
+
+
+@pytest.mark.parametrize(
+    "durability, commit_interval, expected",
+    [
+        (Durability.NONE, 0.0, 0),
+        (Durability.FSYNC_BATCH, 0.0, 3),
+        (Durability.GROUP_COMMIT, 0.0, 3),
+        # Only `close` syncs.
+        (Durability.GROUP_COMMIT, 3600.0, 1),
+    ],
+)
+def test_append_durability(
+    tmp_path: Path,
+    fsyncs: List[int],
+    durability: Durability,
+    commit_interval: float,
+    expected: int,
+) -> None:
+    """Verify when entries are forced to stable storage."""
+    journal = Journal()
+    with JournalAppender(
+        tmp_path.joinpath("test.txt"), durability, commit_interval
+    ) as appender:
+        for entry in range(3):
+            journal.add_entry(f"test {entry}")
+            appender.save(journal)
+
+    assert len(fsyncs) == expected
+
+
+def test_append_group_commit_in_background(tmp_path: Path, fsyncs: List[int]) -> None:
+    """Verify that a group commit is made once the interval passes, without saves."""
+    journal = Journal()
+    with JournalAppender(
+        tmp_path.joinpath("test.txt"), Durability.GROUP_COMMIT, commit_interval=0.5
+    ) as appender:
+        for entry in range(3):
+            journal.add_entry(f"test {entry}")
+            appender.save(journal)
+        assert not fsyncs
+
+        deadline = time.monotonic() + 5
+        while not fsyncs and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(fsyncs) == 1
+
+    # Nothing left to sync on close.
+    assert len(fsyncs) == 1
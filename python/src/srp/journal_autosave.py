@@ -0,0 +1,141 @@
+"""Background autosave of a journal.
+
+Saving a journal after each change blocks the caller for the write. `JournalAutosave`
+instead notes the change and returns; a background thread saves the journal through a
+`JournalAppender` once changes stop arriving for a debounce interval, so that a burst of
+changes is saved in one batch. Only copying the new entries, without formatting them, is
+done under the journal's lock; formatting and writing them are not, so the time a change
+takes barely depends on the size of the journal, and not on the speed of the disk.
+"""
+
+import threading
+import time
+from typing import Any, Optional
+
+from srp.journal_append import JournalAppender
+from srp.srp_comply import Journal
+
+
+class JournalAutosave:
+    """Saves a journal in the background, shortly after it changes.
+
+    Change the journal through `add_entry` and `remove_entry`, or call `notify` after
+    changing it under `lock`.
+    """
+
+    def __init__(
+        self,
+        journal: Journal,
+        appender: JournalAppender,
+        debounce: float = 0.05,
+        max_delay: float = 1.0,
+    ) -> None:
+        """Start saving `journal` through `appender`.
+
+        A save happens once no change has been notified for `debounce` seconds, and
+        at most `max_delay` seconds after the first unsaved change, even if changes
+        keep coming.
+        """
+        self.journal = journal
+        self.appender = appender
+        self.debounce = debounce
+        self.max_delay = max_delay
+
+        # Guards the journal, and the state below.
+        self.lock = threading.Condition()
+        self._first_change: Optional[float] = None
+        self._last_change = 0.0
+        self._closing = False
+        self._error: Optional[BaseException] = None
+        # Serialises saves, so that batches are written in the order they were taken.
+        self._save_lock = threading.Lock()
+
+        self._thread = threading.Thread(
+            target=self._run, name="journal-autosave", daemon=True
+        )
+        self._thread.start()
+
+    def add_entry(self, entry: str) -> None:
+        """Add a journal entry, to be saved shortly."""
+        with self.lock:
+            self.journal.add_entry(entry)
+            self._changed()
+
+    def remove_entry(self, pos: int) -> None:
+        """Remove the journal entry at position `pos`, to be saved shortly."""
+        with self.lock:
+            self.journal.remove_entry(pos)
+            self._changed()
+
+    def notify(self) -> None:
+        """Note that the journal has changed, to be saved shortly."""
+        with self.lock:
+            self._changed()
+
+    def flush(self) -> None:
+        """Save the changes made so far, and wait until they have been written."""
+        self._raise_error()
+        self._save()
+
+    def close(self) -> None:
+        """Save the changes made so far, stop the background thread and the appender."""
+        with self.lock:
+            self._closing = True
+            self.lock.notify()
+        self._thread.join()
+        try:
+            self.flush()
+        finally:
+            self.appender.close()
+
+    def __enter__(self) -> "JournalAutosave":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _changed(self) -> None:
+        self._last_change = time.monotonic()
+        if self._first_change is None:
+            self._first_change = self._last_change
+            self.lock.notify()
+
+    def _save(self) -> None:
+        with self._save_lock:
+            with self.lock:
+                self._first_change = None
+                pending = self.appender.pending(self.journal)
+            self.appender.write(pending)
+
+    def _run(self) -> None:
+        while True:
+            with self.lock:
+                while self._first_change is None and not self._closing:
+                    self.lock.wait()
+                # Wait for the changes to stop, or for the maximum delay.
+                while not self._closing and self._first_change is not None:
+                    deadline = min(
+                        self._last_change + self.debounce,
+                        self._first_change + self.max_delay,
+                    )
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.lock.wait(remaining)
+                if self._closing:
+                    return
+                if self._first_change is None:
+                    # Saved by `flush` in the meantime.
+                    continue
+
+            try:
+                self._save()
+            except BaseException as ex:
+                # Raised by the next `flush` or `close`; saving in the background stops.
+                self._error = ex
+                return
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
@@ -0,0 +1,68 @@
+"""Benchmark the latency of journal changes saved synchronously and in the background.
+
+Run from `python/src` with `python -m srp.journal_autosave_bench`.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from srp.journal_append import JournalAppender
+from srp.journal_autosave import JournalAutosave
+from srp.srp_comply import Journal, PersistenceManager
+
+SIZES = (1_000, 10_000, 100_000)
+CHANGES = 200
+
+
+def _journal(size: int) -> Journal:
+    journal = Journal()
+    for entry in range(size):
+        journal.add_entry(f"entry number {entry} of the journal")
+    return journal
+
+
+def _latencies(change: Callable[[str], None]) -> List[float]:
+    latencies = []
+    for entry in range(CHANGES):
+        start = time.perf_counter()
+        change(f"new entry {entry}")
+        latencies.append(time.perf_counter() - start)
+        # Changes arrive in bursts of 10.
+        if entry % 10 == 9:
+            time.sleep(0.001)
+    return sorted(latencies)
+
+
+def main() -> None:
+    """Print the median and 99th percentile latencies of adding an entry."""
+    print(f"{'entries':>9}  {'save (us)':>17}  {'autosave (us)':>17}")
+    print(f"{'':>9}  {'p50':>8} {'p99':>8}  {'p50':>8} {'p99':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        file = Path(directory, "journal.txt")
+        for size in SIZES:
+            journal = _journal(size)
+
+            def add_and_save(entry: str) -> None:
+                journal.add_entry(entry)
+                PersistenceManager.save(journal, file)
+
+            saved = _latencies(add_and_save)
+
+            with JournalAutosave(
+                _journal(size), JournalAppender(file), debounce=0.002
+            ) as autosave:
+                autosaved = _latencies(autosave.add_entry)
+            assert len(file.read_text().splitlines()) == size + CHANGES
+
+            print(
+                f"{size:9,}  {saved[CHANGES // 2] * 1e6:8.0f}"
+                f" {saved[CHANGES * 99 // 100] * 1e6:8.0f}"
+                f"  {autosaved[CHANGES // 2] * 1e6:8.1f}"
+                f" {autosaved[CHANGES * 99 // 100] * 1e6:8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Demonstrate saving a journal in the background."""
+
+import time
+from pathlib import Path
+from typing import List
+
+from srp.journal_append import JournalAppender, PendingEntries
+from srp.journal_autosave import JournalAutosave
+from srp.srp_comply import Journal
+
+
+class RecordingAppender(JournalAppender):
+    """Appender recording the batches it writes."""
+
+    def __init__(self, file: Path) -> None:
+        super().__init__(file)
+        self.writes: List[PendingEntries] = []
+
+    def write(self, pending: PendingEntries) -> None:
+        """Record and write a batch."""
+        self.writes.append(pending)
+        super().write(pending)
+
+
+def _wait_for(output: Path, data: str) -> bool:
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        if output.exists() and output.read_text() == data:
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_autosave_debounced(tmp_path: Path) -> None:
+    """Verify that a burst of changes is saved in the background, in one batch."""
+    output = tmp_path.joinpath("test.txt")
+    appender = RecordingAppender(output)
+
+    with JournalAutosave(Journal(), appender, debounce=0.05) as autosave:
+        for entry in range(3):
+            autosave.add_entry(f"test {entry}")
+        assert _wait_for(output, "0: test 0\n1: test 1\n2: test 2\n")
+        assert [list(pending.entries) for pending in appender.writes] == [
+            [(0, "test 0"), (1, "test 1"), (2, "test 2")]
+        ]
+
+        autosave.remove_entry(0)
+        assert _wait_for(output, "1: test 1\n2: test 2\n")
+
+
+def test_autosave_close(tmp_path: Path) -> None:
+    """Verify that pending changes are saved on close, without waiting."""
+    output = tmp_path.joinpath("test.txt")
+    journal = Journal()
+    autosave = JournalAutosave(journal, JournalAppender(output), debounce=60)
+    autosave.add_entry("test 0")
+    autosave.flush()
+    assert output.read_text() == "0: test 0\n"
+
+    with autosave.lock:
+        journal.add_entry("test 1")
+        autosave.notify()
+    autosave.close()
+    assert output.read_text() == "0: test 0\n1: test 1\n"
+
+
+def test_autosave_max_delay(tmp_path: Path) -> None:
+    """Verify that changes arriving continually are still saved."""
+    output = tmp_path.joinpath("test.txt")
+    with JournalAutosave(
+        Journal(), JournalAppender(output), debounce=0.05, max_delay=0.1
+    ) as autosave:
+        start = time.monotonic()
+        while not output.exists() and time.monotonic() - start < 5:
+            autosave.add_entry("test")
+            time.sleep(0.01)
+        assert output.exists()
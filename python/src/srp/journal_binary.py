@@ -0,0 +1,211 @@
+"""Binary journal file format, with an index for random access to entries.
+
+In the text format written by `PersistenceManager.save`, finding entry N means reading
+every line before it. The binary format here stores the entries as length-prefixed
+records, in blocks of a fixed number of entries, each optionally compressed with zlib.
+A trailing index holds the offset of every block, and of every entry within its block,
+so that any entry is found with a few lookups and reads at most one block.
+
+Layout, little-endian:
+
+- header: magic `b"JRNL"`, format version (`B`), flags (`B`), entries per block (`I`)
+- blocks, each a sequence of records: entry number (`q`), text length in bytes (`I`),
+  UTF-8 text
+- block table: per block, file offset (`Q`) and stored length (`I`)
+- entry offsets: per entry, offset within its uncompressed block (`I`)
+- footer: block table offset (`Q`), number of entries (`Q`), number of blocks (`I`),
+  magic `b"JRNX"`
+"""
+
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import Any, Final, Iterable, Iterator, List, Optional, Tuple
+
+from srp.srp_comply import Journal, PersistenceManager
+
+_HEADER: Final = struct.Struct("<4sBBI")
+_RECORD: Final = struct.Struct("<qI")
+_BLOCK: Final = struct.Struct("<QI")
+_OFFSET: Final = struct.Struct("<I")
+_FOOTER: Final = struct.Struct("<QQI4s")
+
+MAGIC: Final = b"JRNL"
+FOOTER_MAGIC: Final = b"JRNX"
+VERSION: Final = 1
+# Flag set when the blocks are compressed with zlib.
+COMPRESSED: Final = 0x01
+
+DEFAULT_BLOCK_ENTRIES: Final = 1024
+
+
+def write_binary(
+    entries: Iterable[Tuple[int, str]],
+    file: Path,
+    compress: bool = False,
+    block_entries: int = DEFAULT_BLOCK_ENTRIES,
+) -> int:
+    """Write numbered entries into a binary journal file; return the entry count."""
+    if block_entries < 1:
+        raise ValueError(f"block_entries must be at least 1, not {block_entries!r}")
+
+    blocks: List[Tuple[int, int]] = []
+    offsets = array("I")
+    block = bytearray()
+
+    with open(file, "wb") as output:
+        flags = COMPRESSED if compress else 0
+        output.write(_HEADER.pack(MAGIC, VERSION, flags, block_entries))
+
+        def write_block() -> None:
+            data = zlib.compress(block) if compress else block
+            blocks.append((output.tell(), len(data)))
+            output.write(data)
+            block.clear()
+
+        for number, text in entries:
+            encoded = text.encode()
+            offsets.append(len(block))
+            block += _RECORD.pack(number, len(encoded))
+            block += encoded
+            if len(offsets) % block_entries == 0:
+                write_block()
+        if block:
+            write_block()
+
+        table_offset = output.tell()
+        for block_offset, length in blocks:
+            output.write(_BLOCK.pack(block_offset, length))
+        if sys.byteorder == "big":
+            offsets.byteswap()
+        output.write(offsets.tobytes())
+        footer = _FOOTER.pack(table_offset, len(offsets), len(blocks), FOOTER_MAGIC)
+        output.write(footer)
+
+    return len(offsets)
+
+
+class BinaryJournalReader:
+    """Random access to the entries of a binary journal file, memory-mapped."""
+
+    def __init__(self, file: Path) -> None:
+        """Open a binary journal file for reading."""
+        with open(file, "rb") as input_file:
+            self._data = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._data) < _HEADER.size + _FOOTER.size:
+            self._data.close()
+            raise ValueError(f"{file}: not a binary journal file")
+        magic, version, flags, self.block_entries = _HEADER.unpack_from(self._data)
+        self._table_offset, self._length, block_count, footer_magic = (
+            _FOOTER.unpack_from(self._data, len(self._data) - _FOOTER.size)
+        )
+        if magic != MAGIC or footer_magic != FOOTER_MAGIC or version != VERSION:
+            self._data.close()
+            raise ValueError(f"{file}: not a binary journal file of version {VERSION}")
+        if self.block_entries < 1:
+            self._data.close()
+            raise ValueError(f"{file}: invalid entries per block {self.block_entries}")
+
+        self.compressed = bool(flags & COMPRESSED)
+        self._offsets_offset = self._table_offset + block_count * _BLOCK.size
+        # Most recently decompressed block, reused by consecutive reads.
+        self._cached_block: Optional[Tuple[int, bytes]] = None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> Tuple[int, str]:
+        """Return the number and text of the entry at `index`."""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("journal entry index out of range")
+
+        block_index = index // self.block_entries
+        block, base = self._block(block_index)
+        (offset,) = _OFFSET.unpack_from(
+            self._data, self._offsets_offset + index * _OFFSET.size
+        )
+        return _unpack_record(block, base + offset)[:2]
+
+    def read_range(self, start: int, stop: int) -> Iterator[Tuple[int, str]]:
+        """Iterate over the numbers and texts of the entries from `start` to `stop`."""
+        start, stop, _ = slice(start, stop).indices(self._length)
+        if start >= stop:
+            return
+
+        block_index = start // self.block_entries
+        (offset,) = _OFFSET.unpack_from(
+            self._data, self._offsets_offset + start * _OFFSET.size
+        )
+        block, base = self._block(block_index)
+        position = base + offset
+        for index in range(start, stop):
+            if index != start and index % self.block_entries == 0:
+                block_index += 1
+                block, position = self._block(block_index)
+            number, text, position = _unpack_record(block, position)
+            yield number, text
+
+    def __iter__(self) -> Iterator[Tuple[int, str]]:
+        return self.read_range(0, self._length)
+
+    def close(self) -> None:
+        """Release the memory map of the file."""
+        self._data.close()
+
+    def __enter__(self) -> "BinaryJournalReader":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _block(self, block_index: int) -> Tuple[Any, int]:
+        """Return a buffer holding block `block_index`, and the block's offset in it."""
+        block_offset, length = _BLOCK.unpack_from(
+            self._data, self._table_offset + block_index * _BLOCK.size
+        )
+        if not self.compressed:
+            return self._data, block_offset
+
+        if self._cached_block is None or self._cached_block[0] != block_index:
+            block = zlib.decompress(self._data[block_offset : block_offset + length])
+            self._cached_block = (block_index, block)
+        return self._cached_block[1], 0
+
+
+def _unpack_record(buffer: Any, position: int) -> Tuple[int, str, int]:
+    """Return the number and text of the record at `position`, and the next one's."""
+    number, length = _RECORD.unpack_from(buffer, position)
+    start = position + _RECORD.size
+    text = str(buffer[start : start + length], "utf-8")
+    return number, text, start + length
+
+
+def save_binary(journal: Journal, file: Path, compress: bool = False) -> None:
+    """Save journal entries into a binary journal file."""
+    write_binary(journal.get_numbered_entries(), file, compress)
+
+
+def load_binary(journal: Journal, file: Path) -> None:
+    """Load journal entries from a binary journal file."""
+    with BinaryJournalReader(file) as reader:
+        for number, entry in reader:
+            journal.restore_entry(number, entry)
+
+
+def text_to_binary(text_file: Path, binary_file: Path, compress: bool = False) -> int:
+    """Convert a text journal file into a binary one; return the entry count."""
+    entries = PersistenceManager.iter_entries(text_file)
+    return write_binary(entries, binary_file, compress)
+
+
+def binary_to_text(binary_file: Path, text_file: Path) -> int:
+    """Convert a binary journal file into a text one; return the entry count."""
+    with BinaryJournalReader(binary_file) as reader, open(text_file, "w") as output:
+        output.writelines(f"{number}: {entry}\n" for number, entry in reader)
+        return len(reader)
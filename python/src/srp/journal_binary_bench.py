@@ -0,0 +1,67 @@
+"""Benchmark reading entries from text and binary journal files.
+
+Run from `python/src` with `python -m srp.journal_binary_bench`.
+"""
+
+import random
+import tempfile
+import time
+from itertools import islice
+from pathlib import Path
+
+from srp.journal_binary import BinaryJournalReader, save_binary
+from srp.srp_comply import Journal, PersistenceManager
+
+ENTRIES = 1_000_000
+LOOKUPS = 10_000
+TEXT_LOOKUPS = 5
+RANGE = 1_000
+
+
+def main() -> None:
+    """Print file sizes and the time taken to read entries at random positions."""
+    journal = Journal()
+    for entry in range(ENTRIES):
+        journal.add_entry(f"entry number {entry} of the journal")
+    rng = random.Random(42)
+    positions = [rng.randrange(ENTRIES) for _ in range(LOOKUPS)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        text = Path(directory, "journal.txt")
+        PersistenceManager.save(journal, text)
+
+        start = time.perf_counter()
+        for position in positions[:TEXT_LOOKUPS]:
+            _ = next(islice(PersistenceManager.iter_entries(text), position, None))
+        text_lookup = (time.perf_counter() - start) / TEXT_LOOKUPS
+
+        print(f"{ENTRIES:,} entries; {LOOKUPS:,} lookups, {RANGE:,}-entry ranges")
+        print(f"{'file':>18}  {'MiB':>5}  {'us/lookup':>10}  {'us/range':>9}")
+        size = text.stat().st_size / 2**20
+        print(f"{'text':>18}  {size:5.1f}  {text_lookup * 1e6:10.0f}")
+
+        for compress in (False, True):
+            binary = Path(directory, "journal.jrnl")
+            save_binary(journal, binary, compress)
+            with BinaryJournalReader(binary) as reader:
+                start = time.perf_counter()
+                for position in positions:
+                    _ = reader[position]
+                lookup = (time.perf_counter() - start) / LOOKUPS
+
+                start = time.perf_counter()
+                for position in positions[:100]:
+                    for _ in reader.read_range(position, position + RANGE):
+                        pass
+                range_read = (time.perf_counter() - start) / 100
+
+            label = "binary, zlib" if compress else "binary"
+            size = binary.stat().st_size / 2**20
+            print(
+                f"{label:>18}  {size:5.1f}  {lookup * 1e6:10.1f}"
+                f"  {range_read * 1e6:9.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
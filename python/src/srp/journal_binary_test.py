@@ -0,0 +1,89 @@
+"""Demonstrate the binary journal file format."""
+
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from srp.journal_binary import (
+    BinaryJournalReader,
+    binary_to_text,
+    load_binary,
+    save_binary,
+    text_to_binary,
+    write_binary,
+)
+from srp.srp_comply import Journal, PersistenceManager
+
+ENTRIES: List[Tuple[int, str]] = [
+    (number, f"test {number} ✓") for number in range(10)
+]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_binary_random_access(tmp_path: Path, compress: bool) -> None:
+    """Verify reading entries, and ranges of entries, in any order."""
+    output = tmp_path.joinpath("test.jrnl")
+    assert write_binary(ENTRIES, output, compress, block_entries=3) == 10
+
+    with BinaryJournalReader(output) as reader:
+        assert len(reader) == 10
+        assert reader.compressed == compress
+        assert reader[7] == (7, "test 7 ✓")
+        assert reader[0] == (0, "test 0 ✓")
+        assert reader[-1] == (9, "test 9 ✓")
+        assert list(reader.read_range(2, 7)) == ENTRIES[2:7]
+        assert list(reader.read_range(8, 20)) == ENTRIES[8:]
+        assert not list(reader.read_range(5, 5))
+        assert list(reader) == ENTRIES
+        with pytest.raises(IndexError):
+            _ = reader[10]
+
+
+def test_binary_journal(tmp_path: Path) -> None:
+    """Verify saving and loading a journal in the binary format."""
+    journal = Journal()
+    for entry in range(3):
+        journal.add_entry(f"test {entry}")
+    journal.remove_entry(1)
+    output = tmp_path.joinpath("test.jrnl")
+    save_binary(journal, output, compress=True)
+
+    loaded = Journal()
+    load_binary(loaded, output)
+    loaded.add_entry("test 3")
+    assert list(loaded.get_entries()) == ["0: test 0", "2: test 2", "3: test 3"]
+
+
+def test_binary_conversion(tmp_path: Path) -> None:
+    """Verify converting a journal file to the binary format and back."""
+    journal = Journal()
+    for number, entry in ENTRIES:
+        journal.restore_entry(number, entry)
+    text = tmp_path.joinpath("test.txt")
+    PersistenceManager.save(journal, text)
+
+    binary = tmp_path.joinpath("test.jrnl")
+    assert text_to_binary(text, binary) == 10
+    converted = tmp_path.joinpath("converted.txt")
+    assert binary_to_text(binary, converted) == 10
+    assert converted.read_text() == text.read_text()
+
+    with pytest.raises(ValueError, match="not a binary journal file"):
+        BinaryJournalReader(text)
+
+
+def test_binary_block_entries(tmp_path: Path) -> None:
+    """Verify that blocks must hold at least one entry, when writing and reading."""
+    binary = tmp_path.joinpath("test.jrnl")
+    with pytest.raises(ValueError, match="block_entries must be at least 1"):
+        write_binary(ENTRIES, binary, block_entries=0)
+    assert not binary.exists()
+
+    write_binary(ENTRIES, binary, block_entries=4)
+    data = bytearray(binary.read_bytes())
+    # Entries per block follow the magic, version and flags in the header.
+    data[6:10] = bytes(4)
+    binary.write_bytes(data)
+    with pytest.raises(ValueError, match="invalid entries per block 0"):
+        BinaryJournalReader(binary)
@@ -0,0 +1,176 @@
+"""Storage of journal entries, with removal by position in logarithmic time.
+
+A journal that stores its entries as a list of formatted strings pays O(n) to remove
+an entry, as the entries after it are shifted, and formats every entry whether or not
+it is ever read. `EntryStore` keeps each entry's number and text in compact parallel
+arrays and formats entries only when they are read. Removed entries are marked dead
+rather than deleted, and a Fenwick (binary indexed) tree counting the live entries
+locates the entry at a given position in O(log n).
+"""
+
+from array import array
+from itertools import compress
+from typing import Iterator, List, Sequence, Tuple
+
+# Minimum number of dead entries before they are compacted away.
+COMPACT_THRESHOLD = 1024
+
+
+class EntryStore:
+    """Numbered journal entries, addressed by position among the live entries."""
+
+    def __init__(self) -> None:
+        self._numbers = array("q")
+        self._texts: List[str] = []
+        # 1 for a live entry, 0 for a removed one.
+        self._live = bytearray()
+        # Fenwick tree of `_live`, 1-based: `_tree[i]` is the number of live entries
+        # among entries `i - (i & -i)` to `i - 1`. A list, as indexing an array boxes
+        # its items.
+        self._tree: List[int] = [0]
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, number: int, text: str) -> None:
+        """Add an entry after all the others."""
+        self._numbers.append(number)
+        self._texts.append(text)
+        self._live.append(1)
+
+        tree = self._tree
+        index = len(tree)
+        lowest = index - (index & -index)
+        live, child = 1, index - 1
+        while child > lowest:
+            live += tree[child]
+            child -= child & -child
+        tree.append(live)
+        self._length += 1
+
+    def extend(self, numbers: Sequence[int], texts: Sequence[str]) -> None:
+        """Add entries after all the others, in time linear in their number."""
+        self._numbers.extend(numbers)
+        self._texts.extend(texts)
+        self._live.extend(b"\1" * len(numbers))
+        self._length += len(numbers)
+
+        # Grow the tree as `_build_tree` builds it, adding each node to its parent in
+        # turn. Of the existing nodes, only those on the path down from the last have
+        # a new parent.
+        tree = self._tree
+        first = len(tree)
+        tree.extend([1] * len(numbers))
+        size = len(tree)
+        node = first - 1
+        while node:
+            parent = node + (node & -node)
+            if parent < size:
+                tree[parent] += tree[node]
+            node -= node & -node
+        for node in range(first, size):
+            parent = node + (node & -node)
+            if parent < size:
+                tree[parent] += tree[node]
+
+    def remove(self, position: int) -> None:
+        """Remove the entry at `position`; negative positions count from the end."""
+        index = self._index(position)
+        self._live[index] = 0
+        tree, node, size = self._tree, index + 1, len(self._tree)
+        while node < size:
+            tree[node] -= 1
+            node += node & -node
+        self._length -= 1
+
+        dead = len(self._live) - self._length
+        if dead >= COMPACT_THRESHOLD and dead > self._length:
+            self._compact()
+
+    def __getitem__(self, position: int) -> Tuple[int, str]:
+        """Return the number and text of the entry at `position`."""
+        index = self._index(position)
+        return self._numbers[index], self._texts[index]
+
+    def items(self, start: int = 0) -> Iterator[Tuple[int, str]]:
+        """Iterate over the numbers and texts of the entries from `start` on.
+
+        A negative `start` counts from the end, as in slicing.
+        """
+        if start < 0:
+            start += self._length
+        if start >= self._length:
+            return iter(())
+        if start <= 0:
+            return compress(zip(self._numbers, self._texts), self._live)
+        # Copy only the entries from `start` on, rather than skip those before it.
+        index = self._index(start)
+        return compress(
+            zip(self._numbers[index:], self._texts[index:]), self._live[index:]
+        )
+
+    def copy(self, start: int = 0) -> "EntriesCopy":
+        """Return a copy of the entries from `start` on, unaffected by later changes.
+
+        Only the arrays are copied, not the entries' texts, so this is cheap even for
+        many entries; the entries are taken from the copy when it is iterated over.
+        """
+        if start < 0:
+            start += self._length
+        if start >= self._length:
+            return EntriesCopy(array("q"), [], bytearray())
+        index = self._index(start) if start > 0 else 0
+        return EntriesCopy(
+            self._numbers[index:], self._texts[index:], self._live[index:]
+        )
+
+    def _index(self, position: int) -> int:
+        """Return the index in the arrays of the entry at `position`."""
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError("journal entry position out of range")
+
+        # Descend the tree for the entry preceded by `position` live entries.
+        tree, node, remaining = self._tree, 0, position
+        size = len(tree)
+        step = 1 << (size - 1).bit_length()
+        while step:
+            child = node + step
+            if child < size and tree[child] <= remaining:
+                node = child
+                remaining -= tree[child]
+            step >>= 1
+        return node
+
+    def _compact(self) -> None:
+        self._numbers = array("q", compress(self._numbers, self._live))
+        self._texts = list(compress(self._texts, self._live))
+        self._live = bytearray(b"\1" * self._length)
+        self._build_tree()
+
+    def _build_tree(self) -> None:
+        tree = [0]
+        tree.extend(self._live)
+        size = len(tree)
+        for node in range(1, size):
+            parent = node + (node & -node)
+            if parent < size:
+                tree[parent] += tree[node]
+        self._tree = tree
+
+
+class EntriesCopy:
+    """Copy of entries of an `EntryStore`; see `EntryStore.copy`."""
+
+    def __init__(
+        self, numbers: "array[int]", texts: List[str], live: bytearray
+    ) -> None:
+        self._numbers = numbers
+        self._texts = texts
+        self._live = live
+
+    def __iter__(self) -> Iterator[Tuple[int, str]]:
+        """Iterate over the numbers and texts of the entries."""
+        return compress(zip(self._numbers, self._texts), self._live)
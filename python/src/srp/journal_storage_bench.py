@@ -0,0 +1,45 @@
+"""Benchmark interleaved additions and removals of journal entries.
+
+Run from `python/src` with `python -m srp.journal_storage_bench`.
+"""
+
+import random
+import time
+from typing import Union
+
+from srp import srp_comply, srp_violate
+
+OPERATIONS = 200_000
+SIZES = (1_000, 100_000, 1_000_000)
+
+
+def _interleaved(
+    journal: Union[srp_comply.Journal, srp_violate.Journal], size: int
+) -> float:
+    rng = random.Random(42)
+    for entry in range(size):
+        journal.add_entry(f"entry number {entry} of the journal")
+    positions = [rng.randrange(size) for _ in range(OPERATIONS)]
+
+    start = time.perf_counter()
+    for operation, position in enumerate(positions):
+        journal.add_entry(f"entry number {operation} added")
+        journal.remove_entry(position)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Print the time taken by pairs of an addition and a removal."""
+    print(f"{OPERATIONS:,} additions, each followed by a removal")
+    print(f"{'entries':>9}  {'list (us/op)':>12}  {'store (us/op)':>13}")
+    for size in SIZES:
+        listed = _interleaved(srp_violate.Journal(), size)
+        stored = _interleaved(srp_comply.Journal(), size)
+        print(
+            f"{size:9,}  {listed / OPERATIONS * 1e6:12.2f}"
+            f"  {stored / OPERATIONS * 1e6:13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
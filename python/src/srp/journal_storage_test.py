@@ -0,0 +1,74 @@
+"""Demonstrate storage of journal entries with removal by position."""
+
+import random
+from typing import List, Tuple
+
+import pytest
+
+from srp.journal_storage import COMPACT_THRESHOLD, EntryStore
+
+
+def test_store_interleaved() -> None:
+    """Verify interleaved additions and removals against a list."""
+    rng = random.Random(42)
+    store = EntryStore()
+    expected: List[Tuple[int, str]] = []
+
+    # Enough removals to compact the store several times.
+    for number in range(COMPACT_THRESHOLD * 10):
+        store.append(number, f"test {number}")
+        expected.append((number, f"test {number}"))
+        if rng.random() < 0.6:
+            position = rng.randrange(-len(expected), len(expected))
+            store.remove(position)
+            del expected[position]
+
+    assert len(store) == len(expected)
+    assert list(store.items()) == expected
+    start = len(expected) // 2
+    assert list(store.items(start)) == expected[start:]
+    for negative_start in (-1, -2, -len(expected), -len(expected) - 1):
+        assert list(store.items(negative_start)) == expected[negative_start:]
+    assert store[start] == expected[start]
+    assert store[-1] == expected[-1]
+
+
+def test_store_extend() -> None:
+    """Verify adding entries in bulk."""
+    store = EntryStore()
+    store.extend([0, 1, 2], ["test 0", "test 1", "test 2"])
+    store.remove(1)
+    store.extend([3], ["test 3"])
+
+    assert list(store.items()) == [(0, "test 0"), (2, "test 2"), (3, "test 3")]
+    assert list(store.items(1)) == [(2, "test 2"), (3, "test 3")]
+    assert not list(store.items(3))
+
+
+def test_store_extend_many() -> None:
+    """Verify locating entries after adding many small batches."""
+    store = EntryStore()
+    for first in range(0, 100, 7):
+        numbers = list(range(first, min(first + 7, 100)))
+        store.extend(numbers, [f"test {number}" for number in numbers])
+        store.remove(0)
+
+    expected = list(range(100))
+    for _ in range(0, 100, 7):
+        del expected[0]
+    assert len(store) == len(expected)
+    assert [store[position] for position in range(len(store))] == [
+        (number, f"test {number}") for number in expected
+    ]
+
+
+def test_store_out_of_range() -> None:
+    """Verify that positions out of range are rejected."""
+    store = EntryStore()
+    store.append(0, "test 0")
+    store.remove(0)
+
+    with pytest.raises(IndexError):
+        store.remove(0)
+    with pytest.raises(IndexError):
+        _ = store[-1]
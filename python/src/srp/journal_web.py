@@ -0,0 +1,119 @@
+"""Loading of journal entries over HTTP, with pooled connections.
+
+Opening a new connection for every URI costs a TCP (and perhaps TLS) handshake per
+journal. `ConnectionPool` keeps idle HTTP/1.1 connections per host for reuse, and the
+response body is decoded line by line as it arrives, rather than read whole first.
+"""
+
+import http.client
+import io
+import threading
+from collections import defaultdict, deque
+from typing import DefaultDict, Deque, Iterator, List, Tuple
+from urllib.parse import urlsplit
+
+from srp.srp_comply import parse_entry
+
+# Errors raised when reusing a connection that the server has since closed.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+class ConnectionPool:
+    """Idle HTTP connections, per scheme and host; safe to use from many threads."""
+
+    def __init__(self, timeout: float = 10.0, max_idle_per_host: int = 8) -> None:
+        """Create a pool of connections with a `timeout` in seconds."""
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: DefaultDict[
+            Tuple[str, str], Deque[http.client.HTTPConnection]
+        ] = defaultdict(deque)
+        self._lock = threading.Lock()
+
+    def acquire(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        """Return an idle connection to `netloc`, or a new one if none is idle."""
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            if idle:
+                return idle.pop()
+        return self.connect(scheme, netloc)
+
+    def connect(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        """Return a new connection to `netloc`."""
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def release(
+        self, scheme: str, netloc: str, connection: http.client.HTTPConnection
+    ) -> None:
+        """Return `connection`, whose last response has been read completely."""
+        with self._lock:
+            idle = self._idle[(scheme, netloc)]
+            if len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        """Close the idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, defaultdict(deque)
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+
+# Pool used by default, shared by all loads.
+DEFAULT_POOL = ConnectionPool()
+
+
+def iter_web_entries(
+    uri: str, pool: ConnectionPool = DEFAULT_POOL
+) -> Iterator[Tuple[int, str]]:
+    """Iterate over the numbers and texts of the entries at `uri`, as they arrive."""
+    parts = urlsplit(uri)
+    if parts.scheme not in ("http", "https"):
+        raise ValueError(f"unsupported URI scheme: {uri}")
+    target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+    connection = pool.acquire(parts.scheme, parts.netloc)
+    try:
+        try:
+            connection.request("GET", target)
+            response = connection.getresponse()
+        except _STALE_CONNECTION_ERRORS:
+            # The server may have closed the idle connection: retry on a new one.
+            connection.close()
+            connection = pool.connect(parts.scheme, parts.netloc)
+            connection.request("GET", target)
+            response = connection.getresponse()
+
+        if response.status != http.client.OK:
+            raise OSError(f"{uri}: HTTP {response.status} {response.reason}")
+
+        encoding = response.headers.get_content_charset("utf-8")
+        # `newline="\n"` so that only "\n" ends an entry, as in a saved file.
+        for line in io.TextIOWrapper(response, encoding=encoding, newline="\n"):
+            yield parse_entry(line.rstrip("\n"))
+    except BaseException:
+        # Including `GeneratorExit`: the response may not have been read completely.
+        connection.close()
+        raise
+    pool.release(parts.scheme, parts.netloc, connection)
+
+
+def fetch_web_entries(
+    uri: str, pool: ConnectionPool = DEFAULT_POOL
+) -> Tuple[List[int], List[str]]:
+    """Return the numbers and the texts of the entries at `uri`."""
+    numbers: List[int] = []
+    entries: List[str] = []
+    for number, entry in iter_web_entries(uri, pool):
+        numbers.append(number)
+        entries.append(entry)
+    return numbers, entries
@@ -0,0 +1,83 @@
+"""Benchmark loading journals from a growing number of URIs.
+
+Run from `python/src` with `python -m srp.journal_web_bench`.
+"""
+
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+from srp.srp_comply import Journal, PersistenceManager, parse_entry
+
+ENTRIES_PER_JOURNAL = 1_000
+URI_COUNTS = (1, 10, 100, 400)
+# Time the server takes to respond, as a remote one would.
+LATENCY_SECONDS = 0.005
+
+BODY = "".join(
+    f"{number}: entry number {number} of the journal\n"
+    for number in range(ENTRIES_PER_JOURNAL)
+).encode()
+
+
+class JournalHandler(BaseHTTPRequestHandler):
+    """Serve the same journal at every path, after some latency."""
+
+    protocol_version = "HTTP/1.1"
+    # Send responses without waiting for the previous packet to be acknowledged.
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        """Send the journal."""
+        time.sleep(LATENCY_SECONDS)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args: object) -> None:
+        """Do not log requests."""
+
+
+def _urlopen(journal: Journal, uris: List[str]) -> None:
+    for uri in uris:
+        with urllib.request.urlopen(uri) as response:
+            for line in response.read().decode().splitlines():
+                journal.restore_entry(*parse_entry(line))
+
+
+def _pooled(journal: Journal, uris: List[str]) -> None:
+    for uri in uris:
+        PersistenceManager.load_from_web(journal, uri)
+
+
+def _concurrent(journal: Journal, uris: List[str]) -> None:
+    PersistenceManager.load_from_web_many(journal, uris)
+
+
+def main() -> None:
+    """Print the number of URIs loaded per second."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), JournalHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"{'URIs':>5}  {'urlopen':>8}  {'pooled':>8}  {'pooled, 8 threads':>17}")
+    for uri_count in URI_COUNTS:
+        uris = [f"{base}/journal{n}" for n in range(uri_count)]
+        rates = []
+        for load in (_urlopen, _pooled, _concurrent):
+            journal = Journal()
+            start = time.perf_counter()
+            load(journal, uris)
+            rates.append(uri_count / (time.perf_counter() - start))
+            assert len(journal) == uri_count * ENTRIES_PER_JOURNAL
+        print(f"{uri_count:5}  {rates[0]:8.0f}  {rates[1]:8.0f}  {rates[2]:17.0f}")
+    print("(URIs per second)")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
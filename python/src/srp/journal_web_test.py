@@ -0,0 +1,102 @@
+"""Demonstrate loading journal entries over HTTP."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, Set, Tuple
+
+import pytest
+
+from srp.journal_web import ConnectionPool, fetch_web_entries, iter_web_entries
+from srp.srp_comply import Journal, PersistenceManager
+
+JOURNALS: Dict[str, bytes] = {
+    "/monday": "0: test 1\n1: test 2 ✓\n".encode(),
+    "/tuesday": b"2: test 3\n",
+    "/empty": b"",
+}
+
+
+class JournalHandler(BaseHTTPRequestHandler):
+    """Serve the journals over persistent HTTP/1.1 connections."""
+
+    protocol_version = "HTTP/1.1"
+    # Send responses without waiting for the previous packet to be acknowledged.
+    disable_nagle_algorithm = True
+    # Client ports of the connections accepted.
+    connections: Set[int] = set()
+
+    def do_GET(self) -> None:
+        """Send a journal, or 404 if there is none at the path."""
+        JournalHandler.connections.add(self.client_address[1])
+        body = JOURNALS.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        """Do not log requests."""
+
+
+@pytest.fixture(name="server")
+def fixture_server() -> Iterator[str]:
+    """Provide the base URI of a local journal server."""
+    JournalHandler.connections = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), JournalHandler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_load_from_web(server: str) -> None:
+    """Load journal entries from a URI, over a pooled connection."""
+    journal = Journal()
+    PersistenceManager.load_from_web(journal, f"{server}/monday")
+    PersistenceManager.load_from_web(journal, f"{server}/tuesday")
+    journal.add_entry("test 4")
+
+    assert list(journal.get_entries()) == [
+        "0: test 1",
+        "1: test 2 ✓",
+        "2: test 3",
+        "3: test 4",
+    ]
+    assert len(JournalHandler.connections) == 1
+
+
+def test_load_from_web_many(server: str) -> None:
+    """Load journal entries from several URIs, in order."""
+    journal = Journal()
+    uris = [f"{server}/{day}" for day in ("monday", "empty", "tuesday")]
+    PersistenceManager.load_from_web_many(journal, uris, workers=3)
+
+    assert list(journal.get_entries()) == ["0: test 1", "1: test 2 ✓", "2: test 3"]
+    assert journal.count == 3
+
+
+def test_web_entries_streamed(server: str) -> None:
+    """Verify that a connection is not reused if its response was not read."""
+    pool = ConnectionPool()
+    entries: Iterator[Tuple[int, str]] = iter_web_entries(f"{server}/monday", pool)
+    assert next(entries) == (0, "test 1")
+    entries.close()
+
+    assert fetch_web_entries(f"{server}/tuesday", pool) == ([2], ["test 3"])
+    assert len(JournalHandler.connections) == 2
+    pool.close()
+
+
+def test_web_entries_errors(server: str) -> None:
+    """Verify that missing journals and unsupported URIs are rejected."""
+    with pytest.raises(OSError, match="HTTP 404"):
+        fetch_web_entries(f"{server}/wednesday")
+    with pytest.raises(ValueError, match="unsupported URI scheme"):
+        fetch_web_entries("ftp://localhost/monday")
@@ -3,8 +3,17 @@
 Example based on https://www.udemy.com/course/design-patterns-python/.
 """
 
+import mmap
+import multiprocessing
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Generator, List
+from typing import Generator, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from srp.journal_storage import EntryStore
+
+# Size of the chunks of a file parsed by each worker of `load_parallel`, in bytes.
+LOAD_CHUNK_SIZE = 1 << 20
 
 
 class Journal:
@@ -14,21 +23,48 @@ class Journal:
     """
 
     def __init__(self) -> None:
-        self.entries: List[str] = []
+        # Entries are stored unformatted, and formatted when read.
+        self._entries = EntryStore()
         self.count = 0
 
+    def __len__(self) -> int:
+        return len(self._entries)
+
     def add_entry(self, entry: str) -> None:
         """Add a journal entry."""
-        self.entries.append(f"{self.count}: {entry}")
+        self._entries.append(self.count, entry)
         self.count += 1
 
     def remove_entry(self, pos: int) -> None:
         """Remove journal entry at position `pos`."""
-        del self.entries[pos]
+        self._entries.remove(pos)
+
+    def get_entries(self, start: int = 0) -> Generator[str, None, None]:
+        """Get entries stored in this journal, from position `start` on."""
+        return (f"{number}: {entry}" for number, entry in self._entries.items(start))
+
+    def get_numbered_entries(self, start: int = 0) -> Iterator[Tuple[int, str]]:
+        """Get the numbers and texts of entries in this journal, from `start` on."""
+        return self._entries.items(start)
+
+    def copy_numbered_entries(self, start: int = 0) -> Iterable[Tuple[int, str]]:
+        """Get a copy of the numbers and texts of entries, from `start` on.
+
+        Cheap to take, e.g., under a lock, and unaffected by later changes to the
+        journal; the entries are read when the copy is iterated over.
+        """
+        return self._entries.copy(start)
 
-    def get_entries(self) -> Generator[str, None, None]:
-        """Get entries stored in this journal."""
-        return (entry for entry in self.entries)
+    def restore_entry(self, number: int, entry: str) -> None:
+        """Add a journal entry previously numbered `number`, e.g., when loading."""
+        self._entries.append(number, entry)
+        self.count = max(self.count, number + 1)
+
+    def restore_entries(self, numbers: Sequence[int], entries: Sequence[str]) -> None:
+        """Add journal entries previously numbered `numbers`, in ascending order."""
+        self._entries.extend(numbers, entries)
+        if numbers:
+            self.count = max(self.count, numbers[-1] + 1)
 
 
 class PersistenceManager:
@@ -43,7 +79,106 @@ class PersistenceManager:
     @staticmethod
     def load(journal: Journal, file: Path) -> None:
         """Load journal entries from a file."""
+        for number, entry in PersistenceManager.iter_entries(file):
+            journal.restore_entry(number, entry)
+
+    @staticmethod
+    def iter_entries(file: Path) -> Iterator[Tuple[int, str]]:
+        """Iterate lazily over the numbers and texts of the entries saved in a file.
+
+        The file is memory-mapped, so only the pages being read need be in memory.
+        """
+        with open(file, "rb") as input_file:
+            if os.fstat(input_file.fileno()).st_size == 0:
+                # An empty file cannot be memory-mapped.
+                return
+            with mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for line in iter(data.readline, b""):
+                    yield parse_entry(line.decode().rstrip("\n"))
+
+    @staticmethod
+    def load_parallel(
+        journal: Journal, file: Path, workers: Optional[int] = None
+    ) -> None:
+        """Load journal entries from a file, parsing chunks of it in parallel.
+
+        The file is split into chunks of whole lines of about `LOAD_CHUNK_SIZE` bytes,
+        parsed by worker processes (by default, one per CPU). Each chunk is added to
+        `journal`, in order, as soon as it has been parsed; with a single worker, this
+        is `load`.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            PersistenceManager.load(journal, file)
+            return
+
+        with open(file, "rb") as input_file:
+            if os.fstat(input_file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(
+                input_file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as data, multiprocessing.Pool(workers) as pool:
+                bounds = _chunk_bounds(data, LOAD_CHUNK_SIZE)
+                chunks = pool.imap(_parse_chunk, ((file, *chunk) for chunk in bounds))
+                for numbers, entries in chunks:
+                    journal.restore_entries(numbers, entries)
 
     @staticmethod
     def load_from_web(journal: Journal, uri: str) -> None:
-        """Load journal entries from a URI."""
+        """Load journal entries from a URI.
+
+        The entries are decoded as they are received. Connections are pooled, and
+        reused by later loads from the same host.
+        """
+        # Imported here, as `journal_web` depends on this module.
+        from srp.journal_web import iter_web_entries
+
+        for number, entry in iter_web_entries(uri):
+            journal.restore_entry(number, entry)
+
+    @staticmethod
+    def load_from_web_many(
+        journal: Journal, uris: Sequence[str], workers: int = 8
+    ) -> None:
+        """Load journal entries from several URIs, fetched concurrently.
+
+        The entries are added in the order of `uris`.
+        """
+        from srp.journal_web import fetch_web_entries
+
+        with ThreadPoolExecutor(workers) as executor:
+            for numbers, entries in executor.map(fetch_web_entries, uris):
+                journal.restore_entries(numbers, entries)
+
+
+def parse_entry(line: str) -> Tuple[int, str]:
+    """Return the number and text of a saved journal entry, `"number: text"`."""
+    number, separator, entry = line.partition(": ")
+    if not separator or not number.isdigit():
+        raise ValueError(f"malformed journal entry: {line!r}")
+    return int(number), entry
+
+
+def _chunk_bounds(data: mmap.mmap, size: int) -> Iterator[Tuple[int, int]]:
+    """Generate the byte ranges of chunks of whole lines, of about `size` bytes."""
+    start = 0
+    while start < len(data):
+        # Extend the chunk to the end of its last line.
+        newline = data.find(b"\n", start + size - 1)
+        end = len(data) if newline == -1 else newline + 1
+        yield start, end
+        start = end
+
+
+def _parse_chunk(chunk: Tuple[Path, int, int]) -> Tuple[List[int], List[str]]:
+    file, start, end = chunk
+    with open(file, "rb") as input_file:
+        input_file.seek(start)
+        lines = input_file.read(end - start).decode().split("\n")
+    numbers, entries = [], []
+    # The last line of a chunk ends with a newline, unless it is the last of the file.
+    for line in lines[:-1] if lines[-1] == "" else lines:
+        number, entry = parse_entry(line)
+        numbers.append(number)
+        entries.append(entry)
+    return numbers, entries
@@ -0,0 +1,45 @@
+"""Benchmark loading a large journal file.
+
+Run from `python/src` with `python -m srp.srp_load_bench`.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from srp.srp_comply import Journal, PersistenceManager
+
+ENTRIES = 2_000_000
+
+
+def main() -> None:
+    """Print the time taken to iterate over and to load a journal file."""
+    with tempfile.TemporaryDirectory() as directory:
+        file = Path(directory, "journal.txt")
+        journal = Journal()
+        for entry in range(ENTRIES):
+            journal.add_entry(f"entry number {entry} of the journal")
+        PersistenceManager.save(journal, file)
+        del journal
+        print(f"{ENTRIES:,} entries, {file.stat().st_size / 2**20:.0f} MiB")
+
+        start = time.perf_counter()
+        for _ in PersistenceManager.iter_entries(file):
+            pass
+        print(f"{'iterate':>16}  {time.perf_counter() - start:6.2f} s")
+
+        for workers in (None, 2, 4):
+            journal = Journal()
+            start = time.perf_counter()
+            if workers is None:
+                PersistenceManager.load(journal, file)
+            else:
+                PersistenceManager.load_parallel(journal, file, workers)
+            elapsed = time.perf_counter() - start
+            assert journal.count == ENTRIES
+            label = "load" if workers is None else f"parallel, {workers}"
+            print(f"{label:>16}  {elapsed:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from srp import srp_comply
 from srp import srp_violate
 
@@ -41,3 +43,91 @@ def test_comply_save(tmp_path: Path) -> None:
     with open(output) as file:
         data = file.read()
     assert data == "0: test 1\n1: test 2\n"
+
+
+def test_violate_load(tmp_path: Path) -> None:
+    """Verify `Journal`'s extraneous responsibility of loading."""
+    output = tmp_path.joinpath("test.txt")
+    output.write_text("0: test 1\n2: test 3\n")
+
+    journal = srp_violate.Journal()
+    journal.load(output)
+    journal.add_entry("test 4")
+
+    assert list(journal.get_entries()) == ["0: test 1", "2: test 3", "3: test 4"]
+
+
+def test_comply_load(tmp_path: Path) -> None:
+    """Verify SRP-compliant loading of journal entries from file."""
+    journal = srp_comply.Journal()
+    for entry in range(5):
+        journal.add_entry(f"test {entry}")
+    journal.remove_entry(4)
+    output = tmp_path.joinpath("test.txt")
+    srp_comply.PersistenceManager.save(journal, output)
+
+    entries = srp_comply.PersistenceManager.iter_entries(output)
+    assert next(entries) == (0, "test 0")
+
+    loaded = srp_comply.Journal()
+    srp_comply.PersistenceManager.load(loaded, output)
+    assert list(loaded.get_entries()) == list(journal.get_entries())
+    assert loaded.count == 4
+
+    in_parallel = srp_comply.Journal()
+    srp_comply.PersistenceManager.load_parallel(in_parallel, output, workers=3)
+    assert list(in_parallel.get_entries()) == list(journal.get_entries())
+    assert in_parallel.count == 4
+
+
+def test_comply_load_parallel_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify loading a file split into many chunks, fewer workers than chunks."""
+    journal = srp_comply.Journal()
+    for entry in range(50):
+        journal.add_entry(f"test {entry}")
+    output = tmp_path.joinpath("test.txt")
+    srp_comply.PersistenceManager.save(journal, output)
+
+    monkeypatch.setattr(srp_comply, "LOAD_CHUNK_SIZE", 32)
+    loaded = srp_comply.Journal()
+    srp_comply.PersistenceManager.load_parallel(loaded, output, workers=2)
+    assert list(loaded.get_entries()) == list(journal.get_entries())
+    assert loaded.count == 50
+
+
+def test_comply_load_empty(tmp_path: Path) -> None:
+    """Verify that loading an empty file adds no entries."""
+    output = tmp_path.joinpath("test.txt")
+    output.touch()
+
+    journal = srp_comply.Journal()
+    srp_comply.PersistenceManager.load(journal, output)
+    srp_comply.PersistenceManager.load_parallel(journal, output)
+    assert not list(journal.get_entries())
+    assert journal.count == 0
+
+
+def test_comply_load_malformed(tmp_path: Path) -> None:
+    """Verify that a line not in the `number: entry` format is rejected."""
+    output = tmp_path.joinpath("test.txt")
+    output.write_text("0: test 1\ntest 2\n")
+
+    with pytest.raises(ValueError, match="malformed journal entry: 'test 2'"):
+        srp_comply.PersistenceManager.load(srp_comply.Journal(), output)
+
+
+def test_comply_remove_entry() -> None:
+    """Verify removing journal entries by position."""
+    journal = srp_comply.Journal()
+    for entry in range(4):
+        journal.add_entry(f"test {entry}")
+    journal.remove_entry(1)
+    journal.remove_entry(-1)
+    journal.add_entry("test 4")
+
+    assert len(journal) == 3
+    assert list(journal.get_entries()) == ["0: test 0", "2: test 2", "4: test 4"]
+    assert list(journal.get_entries(1)) == ["2: test 2", "4: test 4"]
+    assert list(journal.get_entries(-2)) == ["2: test 2", "4: test 4"]
@@ -3,6 +3,8 @@
 Example based on https://www.udemy.com/course/design-patterns-python/.
 """
 
+import mmap
+import os
 from pathlib import Path
 from typing import Generator, List
 
@@ -41,6 +43,17 @@ class Journal:
 
     def load(self, file: Path) -> None:
         """Load journal entries from a file."""
+        with open(file, "rb") as input_file:
+            if os.fstat(input_file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for line in iter(data.readline, b""):
+                    entry = line.decode().rstrip("\n")
+                    number, separator, _ = entry.partition(": ")
+                    if not separator or not number.isdigit():
+                        raise ValueError(f"malformed journal entry: {entry!r}")
+                    self.entries.append(entry)
+                    self.count = max(self.count, int(number) + 1)
 
     def load_from_web(self, uri: str) -> None:
         """Load journal entries from a URI."""